@@ -0,0 +1,166 @@
+"""
+Training-volume analytics
+Weekly or monthly series per exercise or muscle group, read from the
+daily_exercise_stats rollup. One grouped query returns the per-bucket
+totals. Rolling averages and period-over-period change are computed over
+the resulting short series in Python.
+"""
+
+from datetime import date, datetime, timedelta
+from sqlalchemy import Date, cast, func
+from models import db, DailyExerciseStats, Exercise
+from reports import parse_number, parse_user_id
+
+BUCKETS = ('week', 'month')
+GROUPS = {
+    'exercise': Exercise.name,
+    'muscle_group': Exercise.muscle_group,
+}
+DEFAULT_DAYS = 365
+DEFAULT_WINDOW = 4
+MAX_WINDOW = 52
+
+
+def parse_date(value, name):
+    try:
+        return datetime.strptime(value, '%Y-%m-%d').date()
+    except ValueError:
+        raise ValueError(f'{name} must be YYYY-MM-DD')
+
+
+def parse_analytics_args(args):
+    """Validate query parameters; raises ValueError with a message for the client"""
+    user_id = parse_user_id(args)
+
+    end_date = parse_date(args['endDate'], 'endDate') if args.get('endDate') else date.today()
+    start_date = (parse_date(args['startDate'], 'startDate') if args.get('startDate')
+                  else end_date - timedelta(days=DEFAULT_DAYS - 1))
+    if start_date > end_date:
+        raise ValueError('startDate must not be after endDate')
+
+    bucket = args.get('bucket', 'week')
+    if bucket not in BUCKETS:
+        raise ValueError(f'bucket must be one of: {", ".join(BUCKETS)}')
+
+    group_by = args.get('groupBy', 'exercise')
+    if group_by not in GROUPS:
+        raise ValueError(f'groupBy must be one of: {", ".join(GROUPS)}')
+
+    window = parse_number(args, 'window', int, 'an integer')
+    if window is None:
+        window = DEFAULT_WINDOW
+    if not 1 <= window <= MAX_WINDOW:
+        raise ValueError(f'window must be between 1 and {MAX_WINDOW}')
+
+    return {
+        'user_id': user_id,
+        'start_date': start_date,
+        'end_date': end_date,
+        'bucket': bucket,
+        'group_by': group_by,
+        'window': window,
+    }
+
+
+def bucket_start(day, bucket):
+    """First day of the week (Monday) or month containing day"""
+    if bucket == 'week':
+        return day - timedelta(days=day.weekday())
+    return day.replace(day=1)
+
+
+def bucket_expression(bucket):
+    """SQL expression for the bucket_start() of each rollup row"""
+    column = DailyExerciseStats.stat_date
+    if db.engine.dialect.name == 'postgresql':
+        return cast(func.date_trunc(bucket, column), Date)
+    if bucket == 'week':
+        # Forward to Sunday (or stay on it), then back to that week's Monday
+        return func.date(column, 'weekday 0', '-6 days')
+    return func.date(column, 'start of month')
+
+
+def bucket_periods(start_date, end_date, bucket):
+    """Every bucket start in the range, so quiet periods show up as zeros"""
+    periods = []
+    current = bucket_start(start_date, bucket)
+    while current <= end_date:
+        periods.append(current)
+        if bucket == 'week':
+            current += timedelta(days=7)
+        else:
+            current = (current + timedelta(days=32)).replace(day=1)
+    return periods
+
+
+def rolling_mean(values, window):
+    """Trailing mean over up to `window` buckets"""
+    means = []
+    total = 0
+    for i, value in enumerate(values):
+        total += value
+        if i >= window:
+            total -= values[i - window]
+        means.append(round(total / min(i + 1, window), 1))
+    return means
+
+
+def percent_change(values):
+    """Change from the previous bucket in percent; None when the previous bucket is empty"""
+    return [None] + [
+        round((value - previous) / previous * 100, 1) if previous else None
+        for previous, value in zip(values, values[1:])
+    ]
+
+
+def build_volume_series(params):
+    """Per-group series of volume, sets and reps by bucket, with rolling and change columns"""
+    bucket = bucket_expression(params['bucket']).label('bucket')
+    group = GROUPS[params['group_by']].label('group_key')
+
+    rows = db.session.query(
+        bucket,
+        group,
+        func.sum(DailyExerciseStats.total_volume),
+        func.sum(DailyExerciseStats.total_sets),
+        func.sum(DailyExerciseStats.total_reps)
+    ).select_from(DailyExerciseStats).join(
+        Exercise, DailyExerciseStats.exercise_id == Exercise.exercise_id
+    ).filter(
+        DailyExerciseStats.user_id == params['user_id'],
+        DailyExerciseStats.stat_date >= params['start_date'],
+        DailyExerciseStats.stat_date <= params['end_date']
+    ).group_by(bucket, group).all()
+
+    periods = bucket_periods(params['start_date'], params['end_date'], params['bucket'])
+    position = {period.isoformat(): i for i, period in enumerate(periods)}
+
+    # Scatter the sparse rows into dense per-group columns
+    columns = {}
+    for period, key, volume, sets, reps in rows:
+        i = position[period if isinstance(period, str) else period.isoformat()]
+        series = columns.setdefault(key, {
+            'volume': [0.0] * len(periods),
+            'sets': [0] * len(periods),
+            'reps': [0] * len(periods),
+        })
+        series['volume'][i] = round(float(volume or 0), 1)
+        series['sets'][i] = int(sets or 0)
+        series['reps'][i] = int(reps or 0)
+
+    # Largest total volume first
+    ordered = sorted(columns.items(), key=lambda item: -sum(item[1]['volume']))
+    return {
+        'bucket': params['bucket'],
+        'groupBy': params['group_by'],
+        'window': params['window'],
+        'periods': [period.isoformat() for period in periods],
+        'series': [
+            dict(series,
+                 key=key,
+                 totalVolume=round(sum(series['volume']), 1),
+                 rollingVolume=rolling_mean(series['volume'], params['window']),
+                 volumeChangePct=percent_change(series['volume']))
+            for key, series in ordered
+        ]
+    }
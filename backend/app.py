@@ -3,15 +3,23 @@ from flask_cors import CORS
 from config import Config
 from models import db
 from routes import api
+from serializers import FastJSONProvider
+from migrations import upgrade
+import connections
+import instrumentation
 import os
 
 def create_app(config_class=Config):
     """Application factory"""
     app = Flask(__name__)
     app.config.from_object(config_class)
+    app.json = FastJSONProvider(app)
     
     # Initialize extensions
+    connections.configure_binds(app)
     db.init_app(app)
+    connections.init_app(app, db)
+    instrumentation.init_app(app)
     
     # Enable CORS for React frontend
     # Allow localhost and all Vercel domains using regex patterns
@@ -22,7 +30,7 @@ def create_app(config_class=Config):
                 r"https://.*\.vercel\.app",  # Any Vercel subdomain
             ],
             "methods": ["GET", "POST", "PUT", "DELETE", "OPTIONS"],
-            "allow_headers": ["Content-Type"],
+            "allow_headers": ["Content-Type", "X-Read-Primary"],
             "supports_credentials": False
         }
     })
@@ -40,8 +48,11 @@ def create_app(config_class=Config):
                 'exercises': '/api/exercises',
                 'workouts': '/api/workouts',
                 'reports': '/api/reports/summary',
+                'analytics': '/api/analytics/volume',
                 'categories': '/api/categories',
-                'health': '/api/health'
+                'health': '/api/health',
+                'liveness': '/api/health/live',
+                'readiness': '/api/health/ready'
             }
         })
     
@@ -61,9 +72,10 @@ def create_app(config_class=Config):
 if __name__ == '__main__':
     app = create_app()
     
-    # Create tables if they don't exist
+    # Create tables if they don't exist and apply pending migrations
     with app.app_context():
         db.create_all()
+        upgrade()
         print("Database tables created successfully!")
     
     print("Starting Flask server on http://localhost:5001")
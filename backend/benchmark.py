@@ -0,0 +1,327 @@
+"""
+API benchmark suite
+Loads synthetic data at several sizes and measures latency percentiles and
+SQL statement counts for every endpoint in the api blueprint.
+Results are written as JSON so runs can be compared over time.
+
+The target databases are wiped; point --database-url at scratch databases only.
+
+Usage: python benchmark.py [--sizes small,medium] [--iterations 50]
+                           [--database-url sqlite:///bench.db --database-url postgresql+psycopg://...]
+"""
+
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+from sqlalchemy import event, func
+from app import create_app
+from config import Config, engine_options
+from load_data import generate
+from migrations import upgrade
+from models import db, Exercise, User, Workout
+
+# name -> (users, workouts, logs)
+SIZES = {
+    'small': (10, 1000, 6000),
+    'medium': (100, 10000, 60000),
+    'large': (1000, 100000, 600000),
+}
+
+# Fixed so every run benchmarks identical data
+END_DATE = date(2025, 1, 1)
+
+# Most bind parameters any one statement may use; an IN-list built from
+# query results grows past this with the data
+MAX_PARAMS = 100
+
+
+def endpoint_requests(client, rng, ids):
+    """Map each benchmark name to a function returning (method, url, request kwargs)
+
+    Any setup a request needs (e.g. creating the row a DELETE removes) runs
+    inside that function, outside the timed call.
+    """
+    counter = iter(range(10 ** 9))
+
+    def window(days):
+        start = END_DATE - timedelta(days=rng.randrange(days, 730))
+        return f'startDate={start}&endDate={start + timedelta(days=days)}'
+
+    def user():
+        # Workout listings and reports are always scoped to one user
+        return f'user_id={rng.choice(ids["users"])}'
+
+    def new_workout():
+        response = client.post('/api/workouts', json={
+            'user_id': rng.choice(ids['users']), 'workout_date': str(END_DATE)
+        })
+        return response.get_json()['workout_id']
+
+    def new_exercise():
+        response = client.post('/api/exercises', json={
+            'name': f'Benchmark Exercise {next(counter)}', 'category': 'strength'
+        })
+        return response.get_json()['exercise_id']
+
+    def new_log():
+        response = client.post('/api/workout-exercises', json={
+            'workout_id': rng.choice(ids['workouts']), 'exercise_id': rng.choice(ids['exercises']),
+            'sets': 3, 'reps': 10, 'weight_lbs': 100
+        })
+        return response.get_json()['log_id']
+
+    def finished_job():
+        # A unique weight filter keeps the report out of the cache so a job is queued
+        response = client.get(f'/api/reports/summary?{user()}&{window(30)}'
+                              f'&minWeight=0.{next(counter)}&async=true')
+        job_url = response.headers['Location']
+        while client.get(job_url).get_json()['status'] in ('queued', 'running'):
+            time.sleep(0.01)
+        return job_url
+
+    def session(logs):
+        return {
+            'user_id': rng.choice(ids['users']), 'workout_date': str(END_DATE),
+            'exercises': [{'exercise_id': rng.choice(ids['exercises']), 'sets': 3, 'reps': 8,
+                           'weight_lbs': 135} for _ in range(logs)]
+        }
+
+    import_body = 'user_id,workout_date,exercise_id,sets,reps,weight_lbs\n' + ''.join(
+        f'1,{END_DATE - timedelta(days=i // 10)},{ids["exercises"][i % len(ids["exercises"])]},3,8,100\n'
+        for i in range(100)
+    )
+
+    return {
+        'get_exercises': lambda: ('GET', '/api/exercises', {}),
+        'get_exercise': lambda: ('GET', f'/api/exercises/{rng.choice(ids["exercises"])}', {}),
+        'create_exercise': lambda: ('POST', '/api/exercises', {'json': {
+            'name': f'Benchmark Exercise {next(counter)}', 'category': 'strength'}}),
+        'update_exercise': lambda: ('PUT', f'/api/exercises/{rng.choice(ids["exercises"])}', {
+            'json': {'description': f'Updated {next(counter)}'}}),
+        'delete_exercise': lambda: ('DELETE', f'/api/exercises/{new_exercise()}', {}),
+        'get_workouts': lambda: ('GET', f'/api/workouts?limit=50&{user()}', {}),
+        'get_workouts:heavy': lambda: ('GET', f'/api/workouts?limit=50&user_id={ids["heavy_user"]}', {}),
+        'get_workout': lambda: ('GET', f'/api/workouts/{rng.choice(ids["workouts"])}', {}),
+        'create_workout': lambda: ('POST', '/api/workouts', {'json': {
+            'user_id': rng.choice(ids['users']), 'workout_date': str(END_DATE)}}),
+        'update_workout': lambda: ('PUT', f'/api/workouts/{rng.choice(ids["workouts"])}', {
+            'json': {'notes': f'Updated {next(counter)}'}}),
+        'delete_workout': lambda: ('DELETE', f'/api/workouts/{new_workout()}', {}),
+        'create_workouts_bulk': lambda: ('POST', '/api/workouts/bulk', {'json': session(10)}),
+        'create_workouts_bulk:sync': lambda: ('POST', '/api/workouts/bulk', {'json': {
+            'workouts': [session(8) for _ in range(20)]}}),
+        'create_workout_exercise': lambda: ('POST', '/api/workout-exercises', {'json': {
+            'workout_id': rng.choice(ids['workouts']), 'exercise_id': rng.choice(ids['exercises']),
+            'sets': 3, 'reps': 10, 'weight_lbs': 100}}),
+        'delete_workout_exercise': lambda: ('DELETE', f'/api/workout-exercises/{new_log()}', {}),
+        'get_workout_report': lambda: ('GET', f'/api/reports/summary?{user()}&{window(30)}', {}),
+        'get_workout_report:year': lambda: ('GET', f'/api/reports/summary?{user()}&{window(365)}', {}),
+        # The most active user's whole history, the largest report there is
+        'get_workout_report:heavy': lambda: ('GET', f'/api/reports/summary?user_id={ids["heavy_user"]}', {}),
+        'get_workout_report:filtered': lambda: ('GET', f'/api/reports/summary?{user()}&{window(90)}'
+                                                '&category=strength&minWeight=100', {}),
+        'get_volume_analytics': lambda: ('GET', f'/api/analytics/volume?user_id={rng.choice(ids["users"])}'
+                                         f'&endDate={END_DATE}', {}),
+        'get_volume_analytics:monthly': lambda: ('GET', f'/api/analytics/volume?user_id={rng.choice(ids["users"])}'
+                                                 f'&endDate={END_DATE}&bucket=month&groupBy=muscle_group', {}),
+        'get_report_job': lambda: ('GET', finished_job(), {}),
+        'get_report_cache_stats': lambda: ('GET', '/api/reports/cache-stats', {}),
+        'export_history': lambda: ('GET', f'/api/export?user_id={rng.choice(ids["users"])}', {}),
+        'import_history': lambda: ('POST', '/api/import', {'data': import_body}),
+        'search': lambda: ('GET', '/api/search?q=' + rng.choice(['ben', 'squat', 'pr', 'row c']), {}),
+        'search:notes': lambda: ('GET', f'/api/search?q=day&type=all&user_id={rng.choice(ids["users"])}', {}),
+        'get_categories': lambda: ('GET', '/api/categories', {}),
+        'get_muscle_groups': lambda: ('GET', '/api/muscle-groups', {}),
+        'get_users': lambda: ('GET', '/api/users', {}),
+        'get_user': lambda: ('GET', f'/api/users/{rng.choice(ids["users"])}', {}),
+        'get_personal_records': lambda: ('GET', f'/api/users/{rng.choice(ids["users"])}/records', {}),
+        'get_personal_record': lambda: ('GET', f'/api/users/{rng.choice(ids["users"])}/records/'
+                                        f'{rng.choice(ids["exercises"])}', {}),
+        'health_check': lambda: ('GET', '/api/health', {}),
+        'liveness_check': lambda: ('GET', '/api/health/live', {}),
+        'readiness_check': lambda: ('GET', '/api/health/ready', {}),
+    }
+
+
+def percentile(quantiles, p):
+    return round(quantiles[p - 1] * 1000, 3)
+
+
+def run_endpoint(client, make_request, counter, iterations):
+    """Time one endpoint; returns latency percentiles (ms), statements per request
+    and the most bind parameters seen in a single statement"""
+    latencies = []
+    statements = []
+    max_params = 0
+    for _ in range(iterations):
+        method, url, kwargs = make_request()
+        counter['statements'] = 0
+        counter['max_params'] = 0
+        started = time.perf_counter()
+        response = client.open(url, method=method, **kwargs)
+        response.get_data()  # drain streamed responses
+        latencies.append(time.perf_counter() - started)
+        statements.append(counter['statements'])
+        max_params = max(max_params, counter['max_params'])
+        if response.status_code >= 400:
+            raise RuntimeError(f'{method} {url} returned {response.status_code}: {response.get_data(as_text=True)[:200]}')
+
+    quantiles = statistics.quantiles(latencies, n=100, method='inclusive')
+    return {
+        'p50_ms': percentile(quantiles, 50),
+        'p95_ms': percentile(quantiles, 95),
+        'p99_ms': percentile(quantiles, 99),
+        'mean_ms': round(statistics.mean(latencies) * 1000, 3),
+        'statements': round(statistics.mean(statements), 2),
+        # Largest bind parameter count in one statement; grows with data if a query builds IN-lists
+        'max_params': max_params,
+    }
+
+
+def benchmark_database(url, sizes, iterations, with_cache, seed):
+    """Run every size against one database URL"""
+    class BenchmarkConfig(Config):
+        SQLALCHEMY_DATABASE_URI = url
+        SQLALCHEMY_ENGINE_OPTIONS = engine_options(url)
+        REPORT_CACHE_SIZE = Config.REPORT_CACHE_SIZE if with_cache else 0
+
+    app = create_app(BenchmarkConfig)
+    client = app.test_client()
+    results = []
+
+    with app.app_context():
+        counter = {'statements': 0, 'max_params': 0}
+
+        def count_statement(conn, cursor, statement, parameters, context, executemany):
+            counter['statements'] += 1
+            row = parameters
+            if executemany and parameters and isinstance(parameters[0], (list, tuple, dict)):
+                row = parameters[0]
+            counter['max_params'] = max(counter['max_params'], len(row or ()))
+
+        # GET requests may read through the reader engine
+        for engine in db.engines.values():
+            event.listen(engine, 'before_cursor_execute', count_statement)
+
+        for size in sizes:
+            users, workouts, logs = SIZES[size]
+            print(f"  [{db.engine.dialect.name}] {size}: loading {workouts} workouts, {logs} logs...")
+            db.drop_all()
+            db.create_all()
+            upgrade()
+            generate(users, workouts, logs, seed=seed, end_date=END_DATE)
+
+            ids = {
+                'users': [row[0] for row in db.session.query(User.user_id).limit(1000)],
+                'workouts': [row[0] for row in db.session.query(Workout.workout_id).limit(1000)],
+                'exercises': [row[0] for row in db.session.query(Exercise.exercise_id)],
+                'heavy_user': db.session.query(Workout.user_id).group_by(Workout.user_id).order_by(
+                    func.count().desc()).limit(1).scalar(),
+            }
+            db.session.remove()
+
+            # Check every api route has a benchmark
+            requests = endpoint_requests(client, random.Random(seed), ids)
+            covered = {name.split(':')[0] for name in requests}
+            routes = {rule.endpoint.split('.', 1)[1] for rule in app.url_map.iter_rules()
+                      if rule.endpoint.startswith('api.')}
+            missing = sorted(routes - covered)
+            if missing:
+                print(f"  ⚠️  No benchmark for: {', '.join(missing)}")
+
+            endpoints = {}
+            for name, make_request in requests.items():
+                endpoints[name] = run_endpoint(client, make_request, counter, iterations)
+                print(f"    {name:32} p50 {endpoints[name]['p50_ms']:9.2f} ms  "
+                      f"p95 {endpoints[name]['p95_ms']:9.2f} ms  "
+                      f"{endpoints[name]['statements']:6} stmts  "
+                      f"{endpoints[name]['max_params']:5} params")
+
+            results.append({
+                'size': size,
+                'users': users,
+                'workouts': workouts,
+                'logs': logs,
+                'endpoints': endpoints,
+                'missing': missing,
+            })
+
+        db.session.remove()
+        for engine in db.engines.values():
+            event.remove(engine, 'before_cursor_execute', count_statement)
+            engine.dispose()
+
+    return {'database': db_label(url), 'results': results}
+
+
+def db_label(url):
+    """Database URL without credentials"""
+    scheme, _, rest = url.partition('://')
+    return f"{scheme}://{rest.rpartition('@')[2]}"
+
+
+def git_revision():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', 'HEAD'], text=True,
+                                       stderr=subprocess.DEVNULL).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Benchmark the workout tracker API')
+    parser.add_argument('--sizes', default='small,medium', help=f'comma-separated: {", ".join(SIZES)}')
+    parser.add_argument('--iterations', type=int, default=50)
+    parser.add_argument('--database-url', action='append', dest='urls',
+                        help='SQLAlchemy URL to benchmark (repeatable); defaults to a temp SQLite file')
+    parser.add_argument('--with-cache', action='store_true', help='keep the report result cache enabled')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--max-params', type=int, default=MAX_PARAMS,
+                        help='fail when a statement binds more parameters than this')
+    parser.add_argument('--output', help='JSON results path (default benchmark_results/<timestamp>.json)')
+    args = parser.parse_args()
+
+    sizes = args.sizes.split(',')
+    urls = args.urls or ['sqlite:///' + os.path.join(tempfile.mkdtemp(), 'benchmark.db')]
+    started_at = datetime.utcnow()
+
+    print("Running API benchmarks...")
+    runs = [benchmark_database(url, sizes, args.iterations, args.with_cache, args.seed) for url in urls]
+
+    output = args.output or os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), 'benchmark_results',
+        started_at.strftime('%Y%m%dT%H%M%SZ') + '.json'
+    )
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump({
+            'started_at': started_at.isoformat() + 'Z',
+            'git_revision': git_revision(),
+            'python': platform.python_version(),
+            'iterations': args.iterations,
+            'report_cache': args.with_cache,
+            'seed': args.seed,
+            'runs': runs,
+        }, f, indent=2)
+
+    print(f"✅ Results written to {output}")
+
+    over = [
+        (run['database'], result['size'], name, stats['max_params'])
+        for run in runs for result in run['results']
+        for name, stats in result['endpoints'].items()
+        if stats['max_params'] > args.max_params
+    ]
+    if over:
+        print(f"❌ Statements with more than {args.max_params} bind parameters:")
+        for database, size, name, max_params in over:
+            print(f"  - {database} {size} {name}: {max_params}")
+        raise SystemExit(1)
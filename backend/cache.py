@@ -0,0 +1,169 @@
+"""
+In-process caching helpers
+Cached data lives in each worker and is validated against state stored
+in the database, so every gunicorn worker sees a write made through any
+other worker.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from flask import current_app, request
+from sqlalchemy import and_, or_, true
+from sqlalchemy.dialects import postgresql, sqlite
+from models import db, CacheVersion, ReportChange
+
+# Version counter shared by /exercises, /categories and /muscle-groups
+EXERCISES = 'exercises'
+
+_reference_cache = {}
+_reference_lock = threading.Lock()
+
+
+def get_version(name):
+    """Current value of a shared version counter"""
+    version = db.session.query(CacheVersion.version).filter_by(name=name).scalar()
+    return version or 0
+
+
+def bump_version(name):
+    """Increment a version counter as part of the caller's transaction"""
+    table = CacheVersion.__table__
+
+    # Upsert so two workers bumping a counter for the first time don't collide
+    dialect = postgresql if db.engine.dialect.name == 'postgresql' else sqlite
+    stmt = dialect.insert(table).values(name=name, version=1)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[table.c.name],
+        set_={'version': table.c.version + 1}
+    )
+    db.session.execute(stmt)
+
+
+def reference_response(key, version_name, loader):
+    """Serve loader() as JSON, cached per version and revalidated with an ETag"""
+    version = get_version(version_name)
+    etag = f'{key}-{version}'
+
+    # The client already has this version
+    if request.if_none_match.contains(etag):
+        response = current_app.response_class(status=304)
+    else:
+        with _reference_lock:
+            cached = _reference_cache.get(key)
+        if cached is None or cached[0] != version:
+            body = current_app.json.dumps(loader())
+            cached = (version, body)
+            with _reference_lock:
+                _reference_cache[key] = cached
+        response = current_app.response_class(cached[1], mimetype='application/json')
+
+    response.set_etag(etag)
+    # Let clients keep the data but revalidate it on every use
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+
+# ==================== REPORT RESULT CACHE ====================
+
+# Writes are stamped when flushed, not when committed; look back this far
+# so a transaction that committed after a report was cached still counts
+CHANGE_SLACK = timedelta(seconds=5)
+
+
+def record_report_change(workout_date=None):
+    """Log a write touching workout_date (None = all dates) in the caller's transaction"""
+    db.session.add(ReportChange(workout_date=workout_date))
+
+    # Cached reports never outlive the TTL, so older changes can't matter
+    cutoff = datetime.utcnow() - timedelta(seconds=current_app.config['REPORT_CACHE_TTL']) - CHANGE_SLACK
+    ReportChange.query.filter(ReportChange.changed_at < cutoff).delete(
+        synchronize_session=False
+    )
+
+
+def range_changed_since(checked_at, filters):
+    """True if a write after checked_at touched a date inside the filter range"""
+    in_range = [true()]
+    if filters['start_date']:
+        in_range.append(ReportChange.workout_date >= filters['start_date'])
+    if filters['end_date']:
+        in_range.append(ReportChange.workout_date <= filters['end_date'])
+
+    query = ReportChange.query.filter(
+        ReportChange.changed_at >= checked_at - CHANGE_SLACK,
+        or_(ReportChange.workout_date.is_(None), and_(*in_range))
+    )
+    return db.session.query(query.exists()).scalar()
+
+
+class ReportCache:
+    """Bounded LRU/TTL cache of report payloads keyed by the normalized filters"""
+
+    def __init__(self):
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(filters):
+        return tuple(sorted(filters.items()))
+
+    def lookup(self, filters):
+        """Return (report or None, timestamp to store a fresh report under)"""
+        key = self.make_key(filters)
+        checked_at = datetime.utcnow()
+
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None:
+            entry_checked_at, expires_at, report = entry
+            if expires_at <= time.monotonic():
+                entry = None
+            elif range_changed_since(entry_checked_at, filters):
+                self.invalidations += 1
+                entry = None
+
+        with self._lock:
+            if entry is None:
+                self._entries.pop(key, None)
+                self.misses += 1
+                return None, checked_at
+
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return report, checked_at
+
+    def store(self, filters, checked_at, report):
+        """Cache a report computed from data read after checked_at"""
+        max_entries = current_app.config['REPORT_CACHE_SIZE']
+        if max_entries <= 0:
+            return
+        expires_at = time.monotonic() + current_app.config['REPORT_CACHE_TTL']
+
+        with self._lock:
+            key = self.make_key(filters)
+            self._entries[key] = (checked_at, expires_at, report)
+            self._entries.move_to_end(key)
+            while len(self._entries) > max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'hits': self.hits,
+                'misses': self.misses,
+                'invalidations': self.invalidations,
+                'evictions': self.evictions,
+                'hitRate': round(self.hits / lookups, 3) if lookups else 0
+            }
+
+
+report_cache = ReportCache()
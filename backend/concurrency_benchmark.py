@@ -0,0 +1,212 @@
+"""
+Concurrent serving benchmark
+Starts gunicorn in each serving mode and drives it with concurrent clients:
+some request year-long reports, some request cheap workout pages and
+some log exercises. Reports throughput and latency for each kind of
+traffic, so sync and gthread workers can be compared, and SQLite's
+rollback journal against the WAL tuning mode (connections.py). The report
+cache is disabled on the server. Each mode serves a fresh copy of the
+SQLite database in rollback-journal mode, so no mode inherits WAL from
+an earlier run.
+
+Usage: python concurrency_benchmark.py [--modes sync,gthread,sqlite-rollback,sqlite-wal]
+                                       [--duration 15] [--report-clients 4]
+                                       [--light-clients 8] [--write-clients 4]
+"""
+
+import json
+import os
+import random
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+from datetime import date, datetime, timedelta
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+END_DATE = date(2025, 1, 1)
+
+# Environment overrides per serving mode; workers are held equal
+MODES = {
+    'sync': {'GUNICORN_WORKER_CLASS': 'sync'},
+    'gthread': {'GUNICORN_WORKER_CLASS': 'gthread', 'GUNICORN_THREADS': '8'},
+    # Writes wait behind the readers' shared locks
+    'sqlite-rollback': {'GUNICORN_WORKER_CLASS': 'gthread', 'GUNICORN_THREADS': '8',
+                        'SQLITE_TUNING': '0', 'SQLITE_READ_CONNECTIONS': '0'},
+    'sqlite-wal': {'GUNICORN_WORKER_CLASS': 'gthread', 'GUNICORN_THREADS': '8',
+                   'SQLITE_TUNING': '1', 'SQLITE_READ_CONNECTIONS': '1'},
+}
+KINDS = ('report', 'light', 'write')
+# Synthetic users; report and list requests pick one at random
+USERS = 50
+
+
+def prepare_database(url, workouts, logs):
+    """Load synthetic data unless the database already has some"""
+    env = dict(os.environ, DATABASE_URL=url)
+    subprocess.run([
+        sys.executable, 'load_data.py', '--users', str(USERS), '--workouts', str(workouts),
+        '--logs', str(logs), '--end-date', END_DATE.isoformat()
+    ], cwd=BACKEND_DIR, env=env, check=True)
+
+
+def sqlite_copy(url, name):
+    """Per-mode copy of a SQLite database, switched back to the rollback journal"""
+    source = url[len('sqlite:///'):]
+    target = f'{os.path.splitext(source)[0]}-{name}.db'
+    # The backup API includes pages still in the source's WAL file
+    with sqlite3.connect(source) as src, sqlite3.connect(target) as conn:
+        src.backup(conn)
+        conn.execute('PRAGMA journal_mode = DELETE')
+    src.close()
+    conn.close()
+    return 'sqlite:///' + target
+
+
+def start_server(url, port, workers, mode_env):
+    env = dict(os.environ, DATABASE_URL=url, PORT=str(port), WEB_CONCURRENCY=str(workers),
+               REPORT_CACHE_SIZE='0', **mode_env)
+    server = subprocess.Popen(
+        [sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py', 'app:create_app()'],
+        cwd=BACKEND_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+
+    # Wait for the workers to accept connections
+    for _ in range(100):
+        try:
+            urllib.request.urlopen(f'http://127.0.0.1:{port}/api/health/live', timeout=5).read()
+            return server
+        except OSError:
+            time.sleep(0.1)
+    server.terminate()
+    raise RuntimeError('gunicorn did not start')
+
+
+def client_loop(make_request, deadline, latencies, errors):
+    while time.monotonic() < deadline:
+        started = time.perf_counter()
+        try:
+            urllib.request.urlopen(make_request(), timeout=60).read()
+            latencies.append(time.perf_counter() - started)
+        except Exception:
+            errors.append(1)
+
+
+def summarize(latencies, errors, duration):
+    if len(latencies) < 2:
+        return {'requests': len(latencies), 'errors': len(errors)}
+    quantiles = statistics.quantiles(latencies, n=100, method='inclusive')
+    return {
+        'requests': len(latencies),
+        'errors': len(errors),
+        'throughput_rps': round(len(latencies) / duration, 2),
+        'p50_ms': round(quantiles[49] * 1000, 2),
+        'p95_ms': round(quantiles[94] * 1000, 2),
+        'max_ms': round(max(latencies) * 1000, 2),
+    }
+
+
+def log_request(base, workout_ids, exercise_ids):
+    """Build a POST that logs a random exercise in a random workout"""
+    body = json.dumps({
+        'workout_id': random.choice(workout_ids),
+        'exercise_id': random.choice(exercise_ids),
+        'sets': 3, 'reps': 10, 'weight_lbs': random.randint(45, 225),
+    }).encode()
+    return urllib.request.Request(f'{base}/api/workout-exercises', data=body, method='POST',
+                                  headers={'Content-Type': 'application/json'})
+
+
+def run_mode(name, url, port, args):
+    if url.startswith('sqlite:///'):
+        url = sqlite_copy(url, name)
+    server = start_server(url, port, args.workers, MODES[name])
+    try:
+        base = f'http://127.0.0.1:{port}'
+        start = END_DATE - timedelta(days=365)
+        exercises = json.loads(urllib.request.urlopen(f'{base}/api/exercises', timeout=60).read())
+        exercise_ids = [exercise['exercise_id'] for exercise in exercises]
+        workout_ids = range(1, args.workouts + 1)
+        user_ids = range(1, USERS + 1)
+
+        requests = {
+            'report': lambda: f'{base}/api/reports/summary?user_id={random.choice(user_ids)}'
+                              f'&startDate={start}&endDate={END_DATE}',
+            'light': lambda: f'{base}/api/workouts?limit=20&user_id={random.choice(user_ids)}',
+            'write': lambda: log_request(base, workout_ids, exercise_ids),
+        }
+        clients = {'report': args.report_clients, 'light': args.light_clients,
+                   'write': args.write_clients}
+        results = {kind: ([], []) for kind in KINDS}
+
+        deadline = time.monotonic() + args.duration
+        threads = [
+            threading.Thread(target=client_loop, args=(requests[kind], deadline, *results[kind]))
+            for kind, count in clients.items() for _ in range(count)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        summary = {kind: summarize(*results[kind], args.duration) for kind in KINDS}
+        summary['total_rps'] = round(sum(s.get('throughput_rps', 0) for s in summary.values()), 2)
+        return summary
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Compare gunicorn serving modes under concurrent load')
+    parser.add_argument('--modes', default='sync,gthread')
+    parser.add_argument('--workers', type=int, default=2)
+    parser.add_argument('--duration', type=float, default=15)
+    parser.add_argument('--report-clients', type=int, default=4)
+    parser.add_argument('--light-clients', type=int, default=8)
+    parser.add_argument('--write-clients', type=int, default=4)
+    parser.add_argument('--workouts', type=int, default=20000)
+    parser.add_argument('--logs', type=int, default=120000)
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--database-url', help='defaults to a temp SQLite file')
+    parser.add_argument('--output', help='JSON results path')
+    args = parser.parse_args()
+
+    url = args.database_url or 'sqlite:///' + os.path.join(tempfile.mkdtemp(), 'concurrency.db')
+    started_at = datetime.utcnow()
+    prepare_database(url, args.workouts, args.logs)
+
+    runs = {}
+    for mode in args.modes.split(','):
+        print(f"Running {mode} for {args.duration}s...")
+        runs[mode] = run_mode(mode, url, args.port, args)
+        for kind in KINDS:
+            stats = runs[mode][kind]
+            print(f"  {kind:7} {stats.get('throughput_rps', 0):8} req/s  "
+                  f"p50 {stats.get('p50_ms', '-')} ms  p95 {stats.get('p95_ms', '-')} ms  "
+                  f"errors {stats['errors']}")
+
+    output = args.output or os.path.join(
+        BACKEND_DIR, 'benchmark_results', 'concurrency-' + started_at.strftime('%Y%m%dT%H%M%SZ') + '.json'
+    )
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump({
+            'started_at': started_at.isoformat() + 'Z',
+            'workers': args.workers,
+            'duration': args.duration,
+            'report_clients': args.report_clients,
+            'light_clients': args.light_clients,
+            'write_clients': args.write_clients,
+            'workouts': args.workouts,
+            'logs': args.logs,
+            'runs': runs,
+        }, f, indent=2)
+
+    print(f"✅ Results written to {output}")
@@ -2,22 +2,106 @@ import os
 
 basedir = os.path.abspath(os.path.dirname(__file__))
 
+
+def env_flag(name, default=False):
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return value.lower() in ('1', 'true', 'yes')
+
+
+def database_url(name):
+    """Database URL from the environment with the scheme psycopg3 needs"""
+    url = os.environ.get(name)
+    
+    # Fix for PostgreSQL URL scheme
+    # Render uses postgres:// but we need postgresql+psycopg:// for psycopg3
+    if url and url.startswith('postgres://'):
+        url = url.replace('postgres://', 'postgresql+psycopg://', 1)
+    elif url and url.startswith('postgresql://'):
+        url = url.replace('postgresql://', 'postgresql+psycopg://', 1)
+    return url
+
+
+def engine_options(database_uri):
+    """SQLAlchemy engine/pool settings for the given database, overridable from the environment"""
+    if not database_uri.startswith('postgresql'):
+        # SQLite connections are local files; the default pool is fine
+        return {}
+    
+    # PgBouncer in transaction mode hands each transaction a different server
+    # connection, so client-side pooling and prepared statements must be off
+    if env_flag('DB_PGBOUNCER'):
+        from sqlalchemy.pool import NullPool
+        return {
+            'poolclass': NullPool,
+            'connect_args': {'prepare_threshold': None},
+        }
+    
+    options = {
+        'pool_size': int(os.environ.get('DB_POOL_SIZE', 5)),
+        'max_overflow': int(os.environ.get('DB_MAX_OVERFLOW', 10)),
+        'pool_timeout': int(os.environ.get('DB_POOL_TIMEOUT', 30)),
+        # Replace connections before Postgres or a proxy drops them as idle
+        'pool_recycle': int(os.environ.get('DB_POOL_RECYCLE', 1800)),
+        # Test each connection on checkout so stale ones are replaced, not 500s
+        'pool_pre_ping': env_flag('DB_POOL_PRE_PING', True),
+    }
+    
+    statement_timeout = int(os.environ.get('DB_STATEMENT_TIMEOUT_MS', 30000))
+    if statement_timeout:
+        options['connect_args'] = {'options': f'-c statement_timeout={statement_timeout}'}
+    
+    return options
+
+
 class Config:
     """Application configuration"""
     
     # Database configuration - use PostgreSQL in production, SQLite in development
-    DATABASE_URL = os.environ.get('DATABASE_URL')
+    DATABASE_URL = database_url('DATABASE_URL')
     
-    # Fix for PostgreSQL URL scheme
-    # Render uses postgres:// but we need postgresql+psycopg:// for psycopg3
-    if DATABASE_URL and DATABASE_URL.startswith('postgres://'):
-        DATABASE_URL = DATABASE_URL.replace('postgres://', 'postgresql+psycopg://', 1)
-    elif DATABASE_URL and DATABASE_URL.startswith('postgresql://'):
-        DATABASE_URL = DATABASE_URL.replace('postgresql://', 'postgresql+psycopg://', 1)
+    # Optional read replica; GET requests read from it (see connections.py)
+    DATABASE_REPLICA_URL = database_url('DATABASE_REPLICA_URL')
+    # Seconds a client's reads stay on the primary after it writes
+    REPLICA_STICKY_SECONDS = int(os.environ.get('REPLICA_STICKY_SECONDS', 5))
     
     SQLALCHEMY_DATABASE_URI = DATABASE_URL or \
         'sqlite:///' + os.path.join(basedir, 'workout_tracker.db')
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    SQLALCHEMY_ENGINE_OPTIONS = engine_options(SQLALCHEMY_DATABASE_URI)
+    
+    # SQLite tuning applied to every connection (WAL, synchronous=NORMAL, mmap,
+    # page cache, busy timeout) and a separate read-only engine for GET requests
+    SQLITE_TUNING = env_flag('SQLITE_TUNING', True)
+    SQLITE_READ_CONNECTIONS = env_flag('SQLITE_READ_CONNECTIONS', True)
+    SQLITE_MMAP_SIZE = int(os.environ.get('SQLITE_MMAP_SIZE', 256 * 1024 * 1024))
+    SQLITE_CACHE_SIZE_KB = int(os.environ.get('SQLITE_CACHE_SIZE_KB', 64 * 1024))
+    SQLITE_BUSY_TIMEOUT_MS = int(os.environ.get('SQLITE_BUSY_TIMEOUT_MS', 5000))
+    
+    # Report result cache - entries per worker (0 disables) and lifetime in seconds
+    REPORT_CACHE_SIZE = int(os.environ.get('REPORT_CACHE_SIZE', 128))
+    REPORT_CACHE_TTL = int(os.environ.get('REPORT_CACHE_TTL', 300))
+    
+    # Background report jobs (/api/reports/summary?async=true) - pool threads per
+    # worker, jobs a worker may have outstanding, seconds before an unfinished job
+    # is failed, and seconds finished results are kept for polling
+    REPORT_JOB_WORKERS = int(os.environ.get('REPORT_JOB_WORKERS', 2))
+    REPORT_JOB_QUEUE_SIZE = int(os.environ.get('REPORT_JOB_QUEUE_SIZE', 32))
+    REPORT_JOB_TIMEOUT = int(os.environ.get('REPORT_JOB_TIMEOUT', 600))
+    REPORT_JOB_TTL = int(os.environ.get('REPORT_JOB_TTL', 600))
+    
+    # Request/SQL instrumentation, Server-Timing headers and /api/metrics (opt-in)
+    METRICS_ENABLED = env_flag('METRICS_ENABLED')
+    SLOW_QUERY_MS = float(os.environ.get('SLOW_QUERY_MS', 200))
+    
+    # Readiness probe thresholds and how long a probe result is reused
+    READINESS_MAX_LATENCY_MS = float(os.environ.get('READINESS_MAX_LATENCY_MS', 500))
+    READINESS_MAX_POOL_USAGE = float(os.environ.get('READINESS_MAX_POOL_USAGE', 0.9))
+    HEALTH_CACHE_SECONDS = float(os.environ.get('HEALTH_CACHE_SECONDS', 2))
+    
+    # Encode JSON responses with orjson when it is installed
+    JSON_ORJSON = env_flag('JSON_ORJSON', True)
     
     # Flask configuration
     SECRET_KEY = os.environ.get('SECRET_KEY') or 'dev-secret-key-change-in-production'
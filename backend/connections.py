@@ -0,0 +1,141 @@
+"""
+Database connection setup
+SQLite tuning mode: each connection gets WAL journaling and the
+performance pragmas, so report reads no longer block log writes. GET
+requests also read through a separate engine (the "reader" bind): the
+DATABASE_REPLICA_URL replica when one is configured, otherwise a
+read-only connection to the SQLite file. Writes, flushes and every
+statement outside a GET request use the primary engine.
+
+With a replica, reads stay on the primary for routes marked with
+primary_reads() and for requests sending the X-Read-Primary header. The
+React app sends that header for a few seconds after each of its own
+writes. Same-site clients also get a read_primary cookie on every write,
+which pins them for REPLICA_STICKY_SECONDS. Replica lag should stay below
+the report cache's CHANGE_SLACK.
+"""
+
+from functools import wraps
+from flask import current_app, g, has_request_context, request
+from flask_sqlalchemy.session import Session
+from sqlalchemy import event
+from config import engine_options
+
+READER = 'reader'
+READ_METHODS = ('GET', 'HEAD')
+READ_PRIMARY_COOKIE = 'read_primary'
+READ_PRIMARY_HEADER = 'X-Read-Primary'
+
+
+def sqlite_file(database_uri):
+    """Path of a file-backed SQLite database, or None"""
+    prefix = 'sqlite:///'
+    if not database_uri.startswith(prefix):
+        return None
+    path = database_uri[len(prefix):].split('?', 1)[0]
+    if not path or path == ':memory:' or path.startswith('file:'):
+        return None
+    return path
+
+
+def reader_bind(config):
+    """Engine config for the reader bind, or None when reads share the primary engine"""
+    replica = config['DATABASE_REPLICA_URL']
+    if replica:
+        return dict(engine_options(replica), url=replica)
+    path = sqlite_file(config['SQLALCHEMY_DATABASE_URI'])
+    if path and config['SQLITE_TUNING'] and config['SQLITE_READ_CONNECTIONS']:
+        return f'sqlite:///file:{path}?mode=ro&uri=true'
+    return None
+
+
+def use_primary():
+    """Send the rest of this request's reads to the primary"""
+    g.read_primary = True
+
+
+def primary_reads(view):
+    """Route decorator for GET routes that must see the latest writes"""
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        use_primary()
+        return view(*args, **kwargs)
+    return wrapper
+
+
+class RoutingSession(Session):
+    """Session that sends GET-request reads to the reader bind when one is configured"""
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if (bind is None and READER in self._db.engines and has_request_context()
+                and request.method in READ_METHODS and not g.get('read_primary')
+                and not self._flushing and not getattr(clause, 'is_dml', False)):
+            return self._db.engines[READER]
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+def sqlite_pragmas(config, read_only=False):
+    """PRAGMA statements run on every new SQLite connection"""
+    pragmas = [
+        f"PRAGMA busy_timeout = {config['SQLITE_BUSY_TIMEOUT_MS']}",
+        f"PRAGMA cache_size = -{config['SQLITE_CACHE_SIZE_KB']}",
+        f"PRAGMA mmap_size = {config['SQLITE_MMAP_SIZE']}",
+        'PRAGMA temp_store = MEMORY',
+    ]
+    if read_only:
+        pragmas.append('PRAGMA query_only = ON')
+    else:
+        # WAL persists in the database file; NORMAL is durable under WAL except on power loss
+        pragmas += ['PRAGMA journal_mode = WAL', 'PRAGMA synchronous = NORMAL']
+    return pragmas
+
+
+def configure_binds(app):
+    """Register the reader bind; call before db.init_app"""
+    bind = reader_bind(app.config)
+    if bind:
+        binds = dict(app.config.get('SQLALCHEMY_BINDS') or {})
+        binds[READER] = bind
+        app.config['SQLALCHEMY_BINDS'] = binds
+
+
+def check_read_primary():
+    """Keep reads on the primary for clients that just wrote or ask for it"""
+    if request.cookies.get(READ_PRIMARY_COOKIE) or request.headers.get(READ_PRIMARY_HEADER):
+        use_primary()
+
+
+def mark_write(response):
+    """After a successful write, pin a same-site client's reads until the replica catches up
+
+    Cross-origin callers don't store this cookie; they send X-Read-Primary instead.
+    """
+    sticky = current_app.config['REPLICA_STICKY_SECONDS']
+    if sticky and request.method not in READ_METHODS and response.status_code < 400:
+        response.set_cookie(READ_PRIMARY_COOKIE, '1', max_age=sticky,
+                            httponly=True, samesite='Lax')
+    return response
+
+
+def init_app(app, db):
+    """Install the read-your-writes hooks and SQLite pragmas"""
+    if app.config['DATABASE_REPLICA_URL']:
+        app.before_request(check_read_primary)
+        app.after_request(mark_write)
+
+    if not app.config['SQLITE_TUNING']:
+        return
+
+    with app.app_context():
+        for key, engine in db.engines.items():
+            if engine.dialect.name != 'sqlite':
+                continue
+            pragmas = sqlite_pragmas(app.config, read_only=key == READER)
+
+            def set_pragmas(dbapi_connection, connection_record, pragmas=pragmas):
+                cursor = dbapi_connection.cursor()
+                for pragma in pragmas:
+                    cursor.execute(pragma)
+                cursor.close()
+
+            event.listen(engine, 'connect', set_pragmas)
@@ -0,0 +1,89 @@
+"""
+Training history export
+Streams workouts joined with their exercise logs as NDJSON or CSV
+without loading the whole history into memory
+"""
+
+import csv
+import io
+import json
+from models import db, Exercise, Workout, WorkoutExercise
+
+# Rows fetched per round trip from the server-side cursor
+BATCH_SIZE = 1000
+
+WORKOUT_FIELDS = ('workout_id', 'user_id', 'workout_date', 'duration_minutes', 'notes')
+LOG_FIELDS = ('log_id', 'exercise_id', 'exercise_name', 'exercise_category', 'sets', 'reps',
+              'weight_lbs', 'distance_miles', 'duration_seconds')
+
+
+def export_rows(user_id, start_date=None, end_date=None):
+    """One user's rows: one per log (or per workout without logs), ordered by workout"""
+    query = db.select(
+        Workout.workout_id,
+        Workout.user_id,
+        Workout.workout_date,
+        Workout.duration_minutes,
+        Workout.notes,
+        WorkoutExercise.log_id,
+        WorkoutExercise.exercise_id,
+        Exercise.name.label('exercise_name'),
+        Exercise.category.label('exercise_category'),
+        WorkoutExercise.sets,
+        WorkoutExercise.reps,
+        WorkoutExercise.weight_lbs,
+        WorkoutExercise.distance_miles,
+        WorkoutExercise.duration_seconds
+    ).select_from(Workout).outerjoin(
+        WorkoutExercise, WorkoutExercise.workout_id == Workout.workout_id
+    ).outerjoin(
+        Exercise, WorkoutExercise.exercise_id == Exercise.exercise_id
+    ).where(
+        Workout.user_id == user_id
+    )
+
+    if start_date:
+        query = query.where(Workout.workout_date >= start_date)
+    if end_date:
+        query = query.where(Workout.workout_date <= end_date)
+
+    query = query.order_by(
+        Workout.workout_date, Workout.workout_id, WorkoutExercise.log_id
+    ).execution_options(yield_per=BATCH_SIZE)
+
+    # yield_per streams through a server-side cursor where the driver has one
+    for row in db.session.execute(query):
+        yield row._mapping
+
+
+def ndjson_lines(rows):
+    """One JSON object per workout, with its logs nested under "exercises" """
+    current = None
+    for row in rows:
+        if current is None or current['workout_id'] != row['workout_id']:
+            if current is not None:
+                yield json.dumps(current) + '\n'
+            current = {field: row[field] for field in WORKOUT_FIELDS}
+            current['workout_date'] = row['workout_date'].isoformat()
+            current['exercises'] = []
+        if row['log_id'] is not None:
+            current['exercises'].append({field: row[field] for field in LOG_FIELDS})
+
+    if current is not None:
+        yield json.dumps(current) + '\n'
+
+
+def csv_lines(rows):
+    """Flat CSV with one line per log, in chunks of BATCH_SIZE lines"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(WORKOUT_FIELDS + LOG_FIELDS)
+
+    for count, row in enumerate(rows, 1):
+        writer.writerow([row[field] for field in WORKOUT_FIELDS + LOG_FIELDS])
+        if count % BATCH_SIZE == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+
+    yield buffer.getvalue()
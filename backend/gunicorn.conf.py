@@ -0,0 +1,41 @@
+"""
+Gunicorn configuration
+
+Serving model: WEB_CONCURRENCY worker processes. By default each process
+handles one request at a time (sync workers). Set GUNICORN_WORKER_CLASS=gthread
+to run GUNICORN_THREADS request threads per process instead. A slow report then
+occupies one thread, and the other threads in that worker keep serving.
+Threads help when requests mostly wait on the database, as with a networked
+PostgreSQL server. They don't help when requests are CPU-bound and the
+instance has a single core. Run concurrency_benchmark.py on the target
+hardware to compare the two modes.
+
+Why the threaded mode is safe:
+- Flask-SQLAlchemy scopes db.session to the application context, and
+  every request runs in its own context. Threads never share a session
+  or a connection.
+- The engine's connection pool is thread-safe. Each worker needs up to
+  GUNICORN_THREADS connections at once, so DB_POOL_SIZE + DB_MAX_OVERFLOW
+  must be at least that. The defaults (5 + 10) cover 15 threads.
+  Connections per database are roughly
+  WEB_CONCURRENCY x (DB_POOL_SIZE + DB_MAX_OVERFLOW).
+- The in-process caches and metrics in cache.py, health.py and
+  instrumentation.py are guarded by locks.
+- The app is not preloaded. Each worker creates its own engine after the
+  fork, so pooled connections are never shared between processes.
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+workers = int(os.environ.get('WEB_CONCURRENCY', 2))
+worker_class = os.environ.get('GUNICORN_WORKER_CLASS', 'sync')
+threads = int(os.environ.get('GUNICORN_THREADS', 4))
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 60))
+keepalive = 5
+
+# Recycle workers periodically to bound memory growth from caches
+max_requests = 1000
+max_requests_jitter = 100
+
+preload_app = False
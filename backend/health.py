@@ -0,0 +1,94 @@
+"""
+Health and readiness checks
+Readiness runs a timed probe query (against the replica too, when one is
+configured) and looks at pool saturation. The result
+is cached briefly so frequent load balancer probes don't add database load.
+"""
+
+import threading
+import time
+from flask import current_app
+from sqlalchemy import text
+from models import db
+from connections import READER
+
+_cached = None
+_cached_at = 0.0
+_lock = threading.Lock()
+
+
+def pool_stats():
+    """Connection pool usage for this worker"""
+    pool = db.engine.pool
+    if not hasattr(pool, 'checkedout'):
+        return {'class': type(pool).__name__}
+
+    capacity = pool.size() + max(pool._max_overflow, 0)
+    return {
+        'class': type(pool).__name__,
+        'size': pool.size(),
+        'checkedIn': pool.checkedin(),
+        'checkedOut': pool.checkedout(),
+        'overflow': pool.overflow(),
+        'maxOverflow': pool._max_overflow,
+        'usage': round(pool.checkedout() / capacity, 3) if capacity else 0
+    }
+
+
+def probe_database(engine):
+    """Run SELECT 1 on a fresh checkout; returns (ok, latency in ms, error)"""
+    started = time.perf_counter()
+    try:
+        with engine.connect() as conn:
+            conn.execute(text('SELECT 1'))
+        return True, round((time.perf_counter() - started) * 1000, 2), None
+    except Exception as e:
+        return False, round((time.perf_counter() - started) * 1000, 2), str(e)
+
+
+def check_readiness():
+    """Readiness report and whether this worker should receive traffic"""
+    global _cached, _cached_at
+
+    config = current_app.config
+    with _lock:
+        if _cached is not None and time.monotonic() - _cached_at < config['HEALTH_CACHE_SECONDS']:
+            return _cached
+
+    ok, latency, error = probe_database(db.engine)
+    pool = pool_stats()
+
+    problems = []
+    if not ok:
+        problems.append(f'database probe failed: {error}')
+    elif latency > config['READINESS_MAX_LATENCY_MS']:
+        problems.append(f'database probe took {latency} ms')
+    if pool.get('usage', 0) >= config['READINESS_MAX_POOL_USAGE']:
+        problems.append(f'connection pool {pool["usage"]:.0%} in use')
+
+    # GET requests read from the replica, so it has to be reachable too
+    replica = None
+    if config['DATABASE_REPLICA_URL']:
+        replica_ok, replica_latency, replica_error = probe_database(db.engines[READER])
+        replica = {'connected': replica_ok, 'latencyMs': replica_latency}
+        if not replica_ok:
+            problems.append(f'replica probe failed: {replica_error}')
+        elif replica_latency > config['READINESS_MAX_LATENCY_MS']:
+            problems.append(f'replica probe took {replica_latency} ms')
+
+    result = {
+        'status': 'ready' if not problems else 'unavailable',
+        'database': {
+            'connected': ok,
+            'latencyMs': latency
+        },
+        'pool': pool,
+        'problems': problems
+    }
+    if replica is not None:
+        result['replica'] = replica
+
+    with _lock:
+        _cached = result
+        _cached_at = time.monotonic()
+    return result
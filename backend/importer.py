@@ -0,0 +1,257 @@
+"""
+Historical data import
+Streams CSV or NDJSON workout history into the database in chunks.
+
+CSV input has one row per exercise log with the columns
+    user_id, workout_date, duration_minutes, notes, exercise_name (or exercise_id),
+    sets, reps, weight_lbs, distance_miles, duration_seconds
+and an optional workout_id used only to group rows into workouts; without
+it, consecutive rows for the same user and date form one workout.
+NDJSON input has one workout per line with its logs under "exercises",
+the same layout /api/export produces.
+
+Usage: python importer.py history.csv [--format csv|ndjson] [--user-id N]
+"""
+
+import csv
+import json
+import time
+from datetime import datetime
+from sqlalchemy import insert
+from models import db, Exercise, User, Workout, WorkoutExercise
+from cache import record_report_change
+from rollups import apply_rows
+from records import add_to_records
+
+# Logs written per transaction
+CHUNK_SIZE = 5000
+# Row errors kept in the result; the rest are only counted
+MAX_ERRORS = 20
+
+LOG_COLUMNS = ('workout_id', 'exercise_id', 'sets', 'reps', 'weight_lbs',
+               'distance_miles', 'duration_seconds')
+INT_FIELDS = ('user_id', 'duration_minutes', 'exercise_id', 'sets', 'reps', 'duration_seconds')
+FLOAT_FIELDS = ('weight_lbs', 'distance_miles')
+
+
+def clean(record):
+    """Convert blank strings to None and numeric fields to numbers; raises ValueError"""
+    if not isinstance(record, dict):
+        raise ValueError('expected an object')
+    values = {key: (value if value != '' else None) for key, value in record.items()}
+    for fields, convert in ((INT_FIELDS, int), (FLOAT_FIELDS, float)):
+        for field in fields:
+            if values.get(field) is not None:
+                try:
+                    values[field] = convert(values[field])
+                except (TypeError, ValueError):
+                    raise ValueError(f'{field} must be a number, got {values[field]!r}')
+    return values
+
+
+def parse_workout(record):
+    """Decode one reader record (an NDJSON line or a grouped CSV workout) into typed values"""
+    if isinstance(record, str):
+        try:
+            record = json.loads(record)
+        except ValueError as e:
+            raise ValueError(f'invalid JSON: {e}')
+    workout = clean(record)
+    logs = workout.get('exercises') or []
+    if not isinstance(logs, list):
+        raise ValueError('exercises must be a list')
+    workout['exercises'] = [clean(log) for log in logs]
+    return workout
+
+
+def read_csv(stream):
+    """Yield workouts with nested, still unconverted exercise rows from CSV log rows"""
+    current = None
+    current_key = None
+    for row in csv.DictReader(stream):
+        key = (row.get('user_id') or None, row.get('workout_date') or None, row.get('workout_id') or None)
+        if key != current_key:
+            if current is not None:
+                yield current
+            current_key = key
+            current = {
+                'user_id': row.get('user_id'),
+                'workout_date': row.get('workout_date'),
+                'duration_minutes': row.get('duration_minutes'),
+                'notes': row.get('notes'),
+                'exercises': []
+            }
+        # Workouts exported without logs have an empty exercise part
+        if row.get('exercise_name') or row.get('exercise_id'):
+            current['exercises'].append(row)
+
+    if current is not None:
+        yield current
+
+
+def read_ndjson(stream):
+    """Yield each non-blank NDJSON line, one workout per line"""
+    for line in stream:
+        if line.strip():
+            yield line
+
+
+READERS = {'csv': read_csv, 'ndjson': read_ndjson}
+
+
+def copy_logs(log_rows):
+    """Load log rows with PostgreSQL COPY on the session's connection"""
+    cursor = db.session.connection().connection.driver_connection.cursor()
+    with cursor.copy(f'COPY workout_exercises ({", ".join(LOG_COLUMNS)}) FROM STDIN') as copy:
+        for row in log_rows:
+            copy.write_row([row[column] for column in LOG_COLUMNS])
+
+
+def write_chunk(workouts):
+    """Insert one chunk of workouts and their logs in a single transaction"""
+    workout_ids = db.session.execute(
+        insert(Workout).returning(Workout.workout_id, sort_by_parameter_order=True),
+        [{key: workout.get(key) for key in ('user_id', 'workout_date', 'duration_minutes', 'notes')}
+         for workout in workouts]
+    ).scalars().all()
+
+    log_rows = []
+    rollup_rows = []
+    for workout, workout_id in zip(workouts, workout_ids):
+        for log in workout['exercises']:
+            log_row = {column: log.get(column) for column in LOG_COLUMNS}
+            log_row['workout_id'] = workout_id
+            log_rows.append(log_row)
+            rollup_rows.append(dict(
+                log_row,
+                user_id=workout['user_id'],
+                stat_date=workout['workout_date']
+            ))
+
+    if log_rows:
+        if db.engine.dialect.name == 'postgresql':
+            copy_logs(log_rows)
+        else:
+            db.session.execute(WorkoutExercise.__table__.insert(), log_rows)
+
+    apply_rows(rollup_rows)
+    add_to_records(rollup_rows)
+    for workout_date in {workout['workout_date'] for workout in workouts}:
+        record_report_change(workout_date)
+    db.session.commit()
+
+    return len(log_rows)
+
+
+def import_workouts(workouts, user_id=None, chunk_size=CHUNK_SIZE, progress=None):
+    """Validate and write a stream of reader records, committing every chunk_size logs
+
+    A record that fails to parse or validate is counted as skipped.
+    user_id overrides the user of every imported workout. progress, if
+    given, is called with the running result after each chunk.
+    """
+    # Exercise names resolve through one preloaded lookup instead of a query per row
+    exercise_ids = {}
+    for exercise_id, name in db.session.query(Exercise.exercise_id, Exercise.name):
+        exercise_ids[name.lower()] = exercise_id
+    known_ids = set(exercise_ids.values())
+
+    # Users are checked once each, before any chunk that references them is
+    # written, so a foreign key can't fail after earlier chunks committed
+    users = {}
+
+    def user_exists(user_id):
+        if user_id not in users:
+            users[user_id] = db.session.query(
+                db.session.query(User).filter(User.user_id == user_id).exists()
+            ).scalar()
+        return users[user_id]
+
+    result = {'workouts': 0, 'logs': 0, 'skipped': 0, 'errors': [], 'seconds': 0, 'logsPerSecond': 0}
+    started = time.perf_counter()
+
+    def flush(chunk):
+        result['logs'] += write_chunk(chunk)
+        result['workouts'] += len(chunk)
+        result['seconds'] = round(time.perf_counter() - started, 3)
+        result['logsPerSecond'] = round(result['logs'] / result['seconds']) if result['seconds'] else 0
+        if progress:
+            progress(result)
+
+    def skip(number, message):
+        result['skipped'] += 1
+        if len(result['errors']) < MAX_ERRORS:
+            result['errors'].append(f'Workout {number}: {message}')
+
+    chunk = []
+    chunk_logs = 0
+    for number, record in enumerate(workouts, 1):
+        try:
+            # Parsed here so a malformed record is skipped rather than ending the import
+            workout = parse_workout(record)
+            if user_id:
+                workout['user_id'] = user_id
+            if not workout.get('user_id') or not workout.get('workout_date'):
+                raise ValueError('user ID and workout date are required')
+            if not user_exists(workout['user_id']):
+                raise ValueError(f'unknown user ID {workout["user_id"]}')
+            workout['workout_date'] = datetime.strptime(workout['workout_date'], '%Y-%m-%d').date()
+
+            for log in workout['exercises']:
+                name = log.get('exercise_name')
+                if name:
+                    if name.lower() not in exercise_ids:
+                        raise ValueError(f'unknown exercise "{name}"')
+                    log['exercise_id'] = exercise_ids[name.lower()]
+                elif log.get('exercise_id') not in known_ids:
+                    raise ValueError(f'unknown exercise ID {log.get("exercise_id")}')
+        except (ValueError, TypeError) as e:
+            skip(number, str(e))
+            continue
+
+        chunk.append(workout)
+        chunk_logs += len(workout['exercises'])
+        if chunk_logs >= chunk_size:
+            flush(chunk)
+            chunk = []
+            chunk_logs = 0
+
+    if chunk:
+        flush(chunk)
+
+    return result
+
+
+if __name__ == '__main__':
+    import argparse
+    from app import create_app
+
+    parser = argparse.ArgumentParser(description='Import workout history from CSV or NDJSON')
+    parser.add_argument('path')
+    parser.add_argument('--format', choices=list(READERS), help='defaults to the file extension')
+    parser.add_argument('--user-id', type=int, help='import every workout for this user')
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE)
+    args = parser.parse_args()
+
+    file_format = args.format or ('ndjson' if args.path.endswith(('.ndjson', '.jsonl')) else 'csv')
+    app = create_app()
+
+    def report(result):
+        print(f"  {result['workouts']} workouts, {result['logs']} logs "
+              f"({result['logsPerSecond']} logs/s)")
+
+    with app.app_context(), open(args.path, newline='', encoding='utf-8') as stream:
+        print(f"Importing {args.path} as {file_format}...")
+        result = import_workouts(
+            READERS[file_format](stream),
+            user_id=args.user_id,
+            chunk_size=args.chunk_size,
+            progress=report
+        )
+
+        print(f"✅ Imported {result['workouts']} workouts and {result['logs']} logs "
+              f"in {result['seconds']}s ({result['logsPerSecond']} logs/s)")
+        if result['skipped']:
+            print(f"⚠️  Skipped {result['skipped']} workouts:")
+            for error in result['errors']:
+                print(f"  - {error}")
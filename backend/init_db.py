@@ -5,6 +5,7 @@ Run this to create the database tables
 
 from app import create_app
 from models import db
+from migrations import upgrade, LATEST_VERSION
 
 def init_database():
     """Initialize the database"""
@@ -19,14 +20,25 @@ def init_database():
         print("Creating database tables...")
         db.create_all()
         
+        # Record the schema as fully migrated
+        upgrade()
+        
         print("✅ Database initialized successfully!")
+        print(f"Schema version: {LATEST_VERSION}")
         print(f"Database location: {app.config['SQLALCHEMY_DATABASE_URI']}")
         print("\nTables created:")
         print("  - users")
         print("  - exercises")
         print("  - workouts")
         print("  - workout_exercises")
+        print("  - daily_exercise_stats")
+        print("  - personal_records")
+        print("  - cache_versions")
+        print("  - report_changes")
+        print("  - report_jobs")
+        print("  - schema_version")
         print("\nRun 'python seed_data.py' to populate with sample data.")
+        print("Run 'python migrations.py' to upgrade an existing database instead.")
 
 
 if __name__ == '__main__':
@@ -0,0 +1,156 @@
+"""
+Request and SQL instrumentation
+Opt-in (METRICS_ENABLED=1) timing built on Flask request hooks and
+SQLAlchemy engine events. Each request gets a Server-Timing header, slow
+statements are logged with their parameters, and per-endpoint latency
+histograms and SQL counters are served at /api/metrics in the Prometheus
+text format. Metrics are kept per worker process.
+"""
+
+import threading
+import time
+from flask import current_app, g, has_request_context, request
+from sqlalchemy import event
+from models import db
+from cache import report_cache
+
+# Latency histogram upper bounds in seconds
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Metrics:
+    """Per-process counters keyed by (method, route)"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.requests = {}
+
+    def observe(self, key, status, seconds, sql_count, sql_seconds):
+        with self.lock:
+            stats = self.requests.get(key)
+            if stats is None:
+                stats = self.requests[key] = {
+                    'buckets': [0] * len(BUCKETS),
+                    'count': 0,
+                    'sum': 0.0,
+                    'errors': 0,
+                    'sql_count': 0,
+                    'sql_seconds': 0.0,
+                }
+            for i, bound in enumerate(BUCKETS):
+                if seconds <= bound:
+                    stats['buckets'][i] += 1
+            stats['count'] += 1
+            stats['sum'] += seconds
+            stats['errors'] += status >= 500
+            stats['sql_count'] += sql_count
+            stats['sql_seconds'] += sql_seconds
+
+    def render(self):
+        """Prometheus text exposition of everything recorded so far"""
+        lines = [
+            '# HELP http_request_duration_seconds Request latency by route',
+            '# TYPE http_request_duration_seconds histogram',
+        ]
+        with self.lock:
+            snapshot = {key: dict(stats, buckets=list(stats['buckets']))
+                        for key, stats in self.requests.items()}
+
+        for (method, route), stats in sorted(snapshot.items()):
+            labels = f'method="{method}",route="{route}"'
+            for bound, count in zip(BUCKETS, stats['buckets']):
+                lines.append(f'http_request_duration_seconds_bucket{{{labels},le="{bound}"}} {count}')
+            lines.append(f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}} {stats["count"]}')
+            lines.append(f'http_request_duration_seconds_sum{{{labels}}} {stats["sum"]:.6f}')
+            lines.append(f'http_request_duration_seconds_count{{{labels}}} {stats["count"]}')
+
+        for name, field, kind, help_text in (
+            ('http_request_errors_total', 'errors', 'counter', 'Responses with a 5xx status'),
+            ('db_statements_total', 'sql_count', 'counter', 'SQL statements executed'),
+            ('db_statement_seconds_total', 'sql_seconds', 'counter', 'Time spent executing SQL'),
+        ):
+            lines.append(f'# HELP {name} {help_text}')
+            lines.append(f'# TYPE {name} {kind}')
+            for (method, route), stats in sorted(snapshot.items()):
+                lines.append(f'{name}{{method="{method}",route="{route}"}} {stats[field]}')
+
+        cache_stats = report_cache.stats()
+        lines.append('# TYPE report_cache_events_total counter')
+        for event_name in ('hits', 'misses', 'invalidations', 'evictions'):
+            lines.append(f'report_cache_events_total{{event="{event_name}"}} {cache_stats[event_name]}')
+        lines.append('# TYPE report_cache_entries gauge')
+        lines.append(f'report_cache_entries {cache_stats["entries"]}')
+
+        return '\n'.join(lines) + '\n'
+
+
+metrics = Metrics()
+
+
+def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault('query_start', []).append(time.perf_counter())
+
+
+def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info['query_start'].pop()
+
+    if has_request_context() and 'sql_count' in g:
+        g.sql_count += 1
+        g.sql_seconds += elapsed
+
+    if elapsed * 1000 >= current_app.config['SLOW_QUERY_MS']:
+        current_app.logger.warning(
+            'Slow query (%.1f ms): %s | params: %r',
+            elapsed * 1000, ' '.join(statement.split()), parameters
+        )
+
+
+def handle_error(context):
+    # Failed statements never reach after_cursor_execute
+    starts = context.connection.info.get('query_start') if context.connection else None
+    if starts:
+        starts.pop()
+
+
+def start_timer():
+    g.request_started = time.perf_counter()
+    g.sql_count = 0
+    g.sql_seconds = 0.0
+
+
+def record_request(response):
+    if 'request_started' not in g:
+        return response
+
+    elapsed = time.perf_counter() - g.request_started
+    route = request.url_rule.rule if request.url_rule else 'unmatched'
+    metrics.observe((request.method, route), response.status_code,
+                    elapsed, g.sql_count, g.sql_seconds)
+
+    response.headers.add(
+        'Server-Timing',
+        f'app;dur={elapsed * 1000:.1f}, '
+        f'db;dur={g.sql_seconds * 1000:.1f};desc="{g.sql_count} queries"'
+    )
+    return response
+
+
+def metrics_endpoint():
+    """Prometheus scrape endpoint"""
+    return current_app.response_class(metrics.render(), mimetype='text/plain; version=0.0.4')
+
+
+def init_app(app):
+    """Attach the hooks when METRICS_ENABLED is set"""
+    if not app.config['METRICS_ENABLED']:
+        return
+
+    with app.app_context():
+        for engine in db.engines.values():
+            event.listen(engine, 'before_cursor_execute', before_cursor_execute)
+            event.listen(engine, 'after_cursor_execute', after_cursor_execute)
+            event.listen(engine, 'handle_error', handle_error)
+
+    app.before_request(start_timer)
+    app.after_request(record_request)
+    app.add_url_rule('/api/metrics', 'metrics', metrics_endpoint)
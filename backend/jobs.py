@@ -0,0 +1,150 @@
+"""
+Background report jobs
+Reports can run on a bounded per-worker thread pool instead of inside the
+request. The client gets a job id back and polls for the result. Job state
+and results live in report_jobs, so any worker can answer a poll. An
+identical report that is already queued or running is shared rather than
+computed again.
+"""
+
+import json
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from flask import current_app
+from sqlalchemy import update
+from models import db, ReportJob
+from cache import report_cache
+from reports import build_report
+
+PENDING = ('queued', 'running')
+
+_executor = None
+# Filters key -> (job_id, event set once the job's row is committed) for
+# the jobs this worker has queued or running
+_pending = {}
+_lock = threading.Lock()
+
+
+class JobQueueFull(Exception):
+    """Raised when this worker already has REPORT_JOB_QUEUE_SIZE jobs outstanding"""
+
+
+def filters_key(filters):
+    return json.dumps(filters, sort_keys=True)
+
+
+def get_executor():
+    """Thread pool for this worker, created lazily so it starts after gunicorn forks"""
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=current_app.config['REPORT_JOB_WORKERS'],
+                thread_name_prefix='report-job'
+            )
+        return _executor
+
+
+def expire_jobs():
+    """Fail jobs that never finished (e.g. their worker restarted) and drop old results"""
+    config = current_app.config
+    now = datetime.utcnow()
+
+    db.session.execute(update(ReportJob).where(
+        ReportJob.status.in_(PENDING),
+        ReportJob.created_at < now - timedelta(seconds=config['REPORT_JOB_TIMEOUT'])
+    ).values(status='failed', error='Job did not finish in time', finished_at=now))
+    db.session.execute(ReportJob.__table__.delete().where(
+        ReportJob.finished_at < now - timedelta(seconds=config['REPORT_JOB_TTL'])
+    ))
+
+
+def submit_report_job(filters, checked_at):
+    """Queue a report computation, or join an identical one; returns (job_id, created)"""
+    key = filters_key(filters)
+
+    # The lock only guards _pending; every database round trip runs outside it
+    with _lock:
+        pending = _pending.get(key)
+    if pending is not None:
+        return join_job(*pending)
+
+    # Another worker may already be computing this report
+    expire_jobs()
+    job_id = db.session.query(ReportJob.job_id).filter(
+        ReportJob.filters_key == key,
+        ReportJob.status.in_(PENDING)
+    ).order_by(ReportJob.created_at.desc()).limit(1).scalar()
+    db.session.commit()
+    if job_id is not None:
+        return job_id, False
+
+    # Claim the key so concurrent requests in this worker join this job
+    with _lock:
+        pending = _pending.get(key)
+        if pending is None:
+            if len(_pending) >= current_app.config['REPORT_JOB_QUEUE_SIZE']:
+                raise JobQueueFull('Too many report jobs queued; try again shortly')
+            job_id = uuid.uuid4().hex
+            committed = threading.Event()
+            _pending[key] = (job_id, committed)
+    if pending is not None:
+        return join_job(*pending)
+
+    try:
+        db.session.add(ReportJob(job_id=job_id, filters_key=key))
+        db.session.commit()
+        get_executor().submit(run_report_job, current_app._get_current_object(),
+                              key, job_id, filters, checked_at)
+    except Exception:
+        with _lock:
+            _pending.pop(key, None)
+        raise
+    finally:
+        committed.set()
+    return job_id, True
+
+
+def join_job(job_id, committed):
+    """Share a job this worker created, once its row is visible to pollers"""
+    committed.wait(current_app.config['REPORT_JOB_TIMEOUT'])
+    return job_id, False
+
+
+def run_report_job(app, key, job_id, filters, checked_at):
+    """Compute one report on a pool thread and record the outcome"""
+    try:
+        with app.app_context():
+            set_job(job_id, status='running')
+            try:
+                report = build_report(filters)
+                report_cache.store(filters, checked_at, report)
+                values = {'status': 'done', 'result': app.json.dumps(report)}
+            except Exception as e:
+                db.session.rollback()
+                values = {'status': 'failed', 'error': str(e)}
+            set_job(job_id, finished_at=datetime.utcnow(), **values)
+    except Exception:
+        app.logger.exception('Report job %s could not be recorded', job_id)
+    finally:
+        with _lock:
+            _pending.pop(key, None)
+
+
+def set_job(job_id, **values):
+    db.session.execute(update(ReportJob).where(ReportJob.job_id == job_id).values(**values))
+    db.session.commit()
+
+
+def job_status(job_id):
+    """Job state for polling, with the report once it is done; None if unknown"""
+    job = db.session.get(ReportJob, job_id)
+    if job is None:
+        return None
+
+    payload = job.to_dict()
+    if job.status == 'done':
+        payload['result'] = current_app.json.loads(job.result)
+    return payload
@@ -0,0 +1,161 @@
+"""
+Synthetic load-data generator
+Fills an empty database with N users, M workouts and K exercise logs.
+The same seed always produces the same data.
+
+Usage: python load_data.py --users 100 --workouts 10000 --logs 60000 [--seed 42] [--end-date 2025-01-01]
+"""
+
+import random
+from datetime import date, timedelta
+from models import db, User, Exercise, Workout, WorkoutExercise
+from rollups import rebuild
+import records
+
+# (name, category, muscle_group, typical working weight in lbs)
+CATALOG = [
+    ('Bench Press', 'strength', 'chest', 155),
+    ('Squat', 'strength', 'legs', 205),
+    ('Deadlift', 'strength', 'back', 245),
+    ('Pull-ups', 'strength', 'back', None),
+    ('Shoulder Press', 'strength', 'shoulders', 95),
+    ('Bicep Curls', 'strength', 'arms', 30),
+    ('Tricep Dips', 'strength', 'arms', None),
+    ('Leg Press', 'strength', 'legs', 300),
+    ('Lat Pulldown', 'strength', 'back', 120),
+    ('Dumbbell Flyes', 'strength', 'chest', 35),
+    ('Lunges', 'strength', 'legs', 45),
+    ('Barbell Row', 'strength', 'back', 135),
+    ('Running', 'cardio', None, None),
+    ('Cycling', 'cardio', None, None),
+    ('Rowing', 'cardio', None, None),
+    ('Plank', 'flexibility', 'core', None),
+    ('Yoga Flow', 'flexibility', None, None),
+]
+
+NOTES = ['Push day', 'Pull day', 'Leg day', 'Cardio session', 'Full body workout',
+         'Heavy lifting day', 'Light recovery', None, None]
+
+# Rows per executemany batch
+BATCH_SIZE = 10000
+
+
+def insert_batches(table, rows):
+    """Core executemany inserts in fixed-size batches"""
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == BATCH_SIZE:
+            db.session.execute(table.insert(), batch)
+            batch = []
+    if batch:
+        db.session.execute(table.insert(), batch)
+
+
+def reset_sequences():
+    """Move PostgreSQL id sequences past the explicitly inserted keys"""
+    if db.engine.dialect.name != 'postgresql':
+        return
+    for table, column in (('users', 'user_id'), ('exercises', 'exercise_id'),
+                          ('workouts', 'workout_id'), ('workout_exercises', 'log_id')):
+        db.session.execute(db.text(
+            f"SELECT setval(pg_get_serial_sequence('{table}', '{column}'), "
+            f"COALESCE((SELECT MAX({column}) FROM {table}), 0) + 1, false)"
+        ))
+
+
+def generate(users, workouts, logs, days=730, seed=42, end_date=None):
+    """Insert the synthetic data set into empty tables and rebuild the derived tables
+
+    Workouts fall in the `days` days up to end_date (default today); pass a
+    fixed end_date to get identical data on every run.
+    """
+    rng = random.Random(seed)
+    today = end_date or date.today()
+
+    insert_batches(User.__table__, (
+        {'user_id': i, 'username': f'user_{i}', 'email': f'user_{i}@example.com'}
+        for i in range(1, users + 1)
+    ))
+    insert_batches(Exercise.__table__, (
+        {'exercise_id': i, 'name': name, 'category': category,
+         'muscle_group': muscle_group, 'description': f'{name} ({category})'}
+        for i, (name, category, muscle_group, _) in enumerate(CATALOG, 1)
+    ))
+
+    # A few very active users log most sessions (Pareto-distributed activity)
+    activity = [rng.paretovariate(1.5) for _ in range(users)]
+    strength = [rng.uniform(0.6, 1.4) for _ in range(users)]
+    workout_users = rng.choices(range(1, users + 1), weights=activity, k=workouts)
+
+    insert_batches(Workout.__table__, (
+        {'workout_id': i, 'user_id': user_id,
+         'workout_date': today - timedelta(days=rng.randrange(days)),
+         'duration_minutes': max(10, int(rng.gauss(50, 15))),
+         'notes': rng.choice(NOTES)}
+        for i, user_id in enumerate(workout_users, 1)
+    ))
+
+    def log_rows():
+        # Spread K logs over M workouts; every workout gets at least one when K >= M
+        per_workout = [1 if logs >= workouts else 0] * workouts
+        for _ in range(logs - sum(per_workout)):
+            per_workout[rng.randrange(workouts)] += 1
+
+        log_id = 1
+        for workout_index, count in enumerate(per_workout):
+            user_strength = strength[workout_users[workout_index] - 1]
+            for _ in range(count):
+                exercise_id = rng.randrange(len(CATALOG)) + 1
+                _, category, _, base_weight = CATALOG[exercise_id - 1]
+                row = {'log_id': log_id, 'workout_id': workout_index + 1,
+                       'exercise_id': exercise_id, 'sets': None, 'reps': None,
+                       'weight_lbs': None, 'distance_miles': None, 'duration_seconds': None}
+                if category == 'cardio':
+                    row['sets'] = 1
+                    row['distance_miles'] = round(rng.uniform(1, 10), 1)
+                    row['duration_seconds'] = int(row['distance_miles'] * rng.uniform(420, 720))
+                elif category == 'flexibility':
+                    row['sets'] = rng.randint(1, 3)
+                    row['duration_seconds'] = rng.choice([30, 45, 60, 90, 600])
+                else:
+                    row['sets'] = rng.randint(3, 5)
+                    row['reps'] = rng.choice([5, 6, 8, 10, 12, 15])
+                    if base_weight:
+                        row['weight_lbs'] = round(base_weight * user_strength * rng.uniform(0.8, 1.2) / 5) * 5
+                yield row
+                log_id += 1
+
+    insert_batches(WorkoutExercise.__table__, log_rows())
+    reset_sequences()
+    db.session.commit()
+    rebuild()
+    records.rebuild()
+
+
+if __name__ == '__main__':
+    import argparse
+    from app import create_app
+    from migrations import upgrade
+
+    parser = argparse.ArgumentParser(description='Generate synthetic workout data')
+    parser.add_argument('--users', type=int, default=100)
+    parser.add_argument('--workouts', type=int, default=10000)
+    parser.add_argument('--logs', type=int, default=60000)
+    parser.add_argument('--days', type=int, default=730, help='spread workouts over this many past days')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--end-date', type=date.fromisoformat, help='last workout date (default today)')
+    args = parser.parse_args()
+
+    app = create_app()
+
+    with app.app_context():
+        db.create_all()
+        upgrade()
+        if User.query.first():
+            print("⚠️  Database already contains data. Run 'python init_db.py' first.")
+        else:
+            print(f"Generating {args.users} users, {args.workouts} workouts, {args.logs} logs...")
+            generate(args.users, args.workouts, args.logs, days=args.days, seed=args.seed,
+                     end_date=args.end_date)
+            print("✅ Synthetic data loaded")
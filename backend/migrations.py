@@ -0,0 +1,129 @@
+"""
+Schema migration script
+Run this to bring an existing database up to the current schema
+without dropping any data
+"""
+
+from models import db, CacheVersion, DailyExerciseStats, PersonalRecord, ReportChange, ReportJob, SchemaVersion
+from rollups import backfill_statement
+import records
+from search import create_search_index
+
+
+def create_indexes(conn, *names):
+    """Create the named model indexes if they don't exist yet"""
+    indexes = {
+        index.name: index
+        for table in db.metadata.tables.values()
+        for index in table.indexes
+    }
+    for name in names:
+        indexes[name].create(conn, checkfirst=True)
+
+
+def add_filter_indexes(conn):
+    create_indexes(
+        conn,
+        'ix_workouts_date_id',
+        'ix_workout_exercises_workout_exercise',
+        'ix_workout_exercises_exercise_weight',
+        'ix_workout_exercises_weight',
+        'ix_exercises_category',
+    )
+
+
+def add_cache_versions(conn):
+    CacheVersion.__table__.create(conn, checkfirst=True)
+
+
+def add_report_changes(conn):
+    ReportChange.__table__.create(conn, checkfirst=True)
+
+
+def add_daily_exercise_stats(conn):
+    DailyExerciseStats.__table__.create(conn, checkfirst=True)
+    conn.execute(DailyExerciseStats.__table__.delete())
+    conn.execute(backfill_statement())
+
+
+def add_report_jobs(conn):
+    ReportJob.__table__.create(conn, checkfirst=True)
+
+
+def add_user_scope_index(conn):
+    # Carries workout_id too, so per-user keyset pages are read straight off the index
+    conn.execute(db.text('DROP INDEX IF EXISTS ix_workouts_user_date'))
+    create_indexes(conn, 'ix_workouts_user_date_id')
+
+
+def add_personal_records(conn):
+    PersonalRecord.__table__.create(conn, checkfirst=True)
+    conn.execute(PersonalRecord.__table__.delete())
+    conn.execute(records.backfill_statement())
+
+
+def add_rollup_volume(conn):
+    # Migration 4 creates the table from the current model, so the column may exist
+    columns = {column['name'] for column in db.inspect(conn).get_columns('daily_exercise_stats')}
+    if 'total_volume' not in columns:
+        conn.execute(db.text(
+            'ALTER TABLE daily_exercise_stats ADD COLUMN total_volume FLOAT NOT NULL DEFAULT 0'
+        ))
+    conn.execute(DailyExerciseStats.__table__.delete())
+    conn.execute(backfill_statement())
+
+
+# Ordered (version, description, function) entries. Append new migrations
+# to the end; never edit or renumber one that has already shipped.
+MIGRATIONS = [
+    (1, 'Add indexes for workout and report filters', add_filter_indexes),
+    (2, 'Add cache_versions table', add_cache_versions),
+    (3, 'Add report_changes table', add_report_changes),
+    (4, 'Add and backfill daily_exercise_stats rollup', add_daily_exercise_stats),
+    (5, 'Add report_jobs table', add_report_jobs),
+    (6, 'Extend the per-user workouts index with workout_id', add_user_scope_index),
+    (7, 'Add and backfill personal_records', add_personal_records),
+    (8, 'Add training volume to daily_exercise_stats', add_rollup_volume),
+    (9, 'Add full-text search indexes for exercises and workout notes', create_search_index),
+]
+
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+
+def current_version():
+    """Version of the last migration applied to the database"""
+    SchemaVersion.__table__.create(db.engine, checkfirst=True)
+    return db.session.query(db.func.max(SchemaVersion.version)).scalar() or 0
+
+
+def upgrade():
+    """Apply pending migrations in order, each in its own transaction"""
+    version = current_version()
+    db.session.commit()
+
+    applied = []
+    for number, description, migrate in MIGRATIONS:
+        if number <= version:
+            continue
+        with db.engine.begin() as conn:
+            migrate(conn)
+            conn.execute(SchemaVersion.__table__.insert().values(version=number))
+        applied.append((number, description))
+
+    return applied
+
+
+if __name__ == '__main__':
+    from app import create_app
+
+    app = create_app()
+
+    with app.app_context():
+        applied = upgrade()
+
+        if applied:
+            for number, description in applied:
+                print(f"✅ Applied migration {number}: {description}")
+        else:
+            print("Database is already up to date.")
+        print(f"Schema version: {LATEST_VERSION}")
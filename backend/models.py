@@ -1,7 +1,8 @@
 from flask_sqlalchemy import SQLAlchemy
 from datetime import datetime
+from connections import RoutingSession
 
-db = SQLAlchemy()
+db = SQLAlchemy(session_options={'class_': RoutingSession})
 
 class User(db.Model):
     """User model"""
@@ -27,6 +28,9 @@ class User(db.Model):
 class Exercise(db.Model):
     """Exercise model - stores exercise types"""
     __tablename__ = 'exercises'
+    __table_args__ = (
+        db.Index('ix_exercises_category', 'category'),
+    )
     
     exercise_id = db.Column(db.Integer, primary_key=True, autoincrement=True)
     name = db.Column(db.String(100), nullable=False, unique=True)
@@ -50,6 +54,11 @@ class Exercise(db.Model):
 class Workout(db.Model):
     """Workout model - stores workout sessions"""
     __tablename__ = 'workouts'
+    __table_args__ = (
+        # Date range filters and the (workout_date, workout_id) keyset order
+        db.Index('ix_workouts_date_id', 'workout_date', 'workout_id'),
+        db.Index('ix_workouts_user_date_id', 'user_id', 'workout_date', 'workout_id'),
+    )
     
     workout_id = db.Column(db.Integer, primary_key=True, autoincrement=True)
     user_id = db.Column(db.Integer, db.ForeignKey('users.user_id', ondelete='CASCADE'), nullable=False)
@@ -78,6 +87,11 @@ class Workout(db.Model):
 class WorkoutExercise(db.Model):
     """WorkoutExercise model - stores individual exercise logs within a workout"""
     __tablename__ = 'workout_exercises'
+    __table_args__ = (
+        db.Index('ix_workout_exercises_workout_exercise', 'workout_id', 'exercise_id'),
+        db.Index('ix_workout_exercises_exercise_weight', 'exercise_id', 'weight_lbs'),
+        db.Index('ix_workout_exercises_weight', 'weight_lbs'),
+    )
     
     log_id = db.Column(db.Integer, primary_key=True, autoincrement=True)
     workout_id = db.Column(db.Integer, db.ForeignKey('workouts.workout_id', ondelete='CASCADE'), nullable=False)
@@ -102,3 +116,94 @@ class WorkoutExercise(db.Model):
             'duration_seconds': self.duration_seconds
         }
 
+
+
+class DailyExerciseStats(db.Model):
+    """DailyExerciseStats model - per-user, per-day, per-exercise rollup of workout_exercises"""
+    __tablename__ = 'daily_exercise_stats'
+    __table_args__ = (
+        db.Index('ix_daily_exercise_stats_date', 'stat_date', 'exercise_id'),
+    )
+    
+    user_id = db.Column(db.Integer, db.ForeignKey('users.user_id', ondelete='CASCADE'), primary_key=True)
+    stat_date = db.Column(db.Date, primary_key=True)
+    exercise_id = db.Column(db.Integer, db.ForeignKey('exercises.exercise_id', ondelete='CASCADE'), primary_key=True)
+    log_count = db.Column(db.Integer, nullable=False, default=0)
+    total_sets = db.Column(db.Integer, nullable=False, default=0)
+    total_reps = db.Column(db.Integer, nullable=False, default=0)
+    weight_sum = db.Column(db.Float, nullable=False, default=0)
+    weight_count = db.Column(db.Integer, nullable=False, default=0)  # logs with a non-zero weight
+    total_volume = db.Column(db.Float, nullable=False, default=0)  # sum of sets x reps x weight
+
+
+class PersonalRecord(db.Model):
+    """PersonalRecord model - per-user, per-exercise bests, kept up to date on every log write"""
+    __tablename__ = 'personal_records'
+    
+    user_id = db.Column(db.Integer, db.ForeignKey('users.user_id', ondelete='CASCADE'), primary_key=True)
+    exercise_id = db.Column(db.Integer, db.ForeignKey('exercises.exercise_id', ondelete='CASCADE'), primary_key=True)
+    max_weight_lbs = db.Column(db.Float)
+    best_e1rm_lbs = db.Column(db.Float)  # Epley estimated one-rep max
+    max_volume_lbs = db.Column(db.Float)  # sets x reps x weight in a single log
+    max_distance_miles = db.Column(db.Float)
+    max_duration_seconds = db.Column(db.Integer)
+    
+    def to_dict(self):
+        return {
+            'user_id': self.user_id,
+            'exercise_id': self.exercise_id,
+            'max_weight_lbs': self.max_weight_lbs,
+            'best_e1rm_lbs': round(self.best_e1rm_lbs, 1) if self.best_e1rm_lbs is not None else None,
+            'max_volume_lbs': self.max_volume_lbs,
+            'max_distance_miles': self.max_distance_miles,
+            'max_duration_seconds': self.max_duration_seconds
+        }
+
+
+class CacheVersion(db.Model):
+    """CacheVersion model - shared version counters for cached data, bumped on writes"""
+    __tablename__ = 'cache_versions'
+    
+    name = db.Column(db.String(50), primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0)
+
+
+class ReportChange(db.Model):
+    """ReportChange model - log of workout dates touched by writes, used to invalidate cached reports"""
+    __tablename__ = 'report_changes'
+    
+    change_id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    workout_date = db.Column(db.Date)  # NULL means every date is affected
+    changed_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow, index=True)
+
+
+class ReportJob(db.Model):
+    """ReportJob model - report computations running in the background, polled by job id"""
+    __tablename__ = 'report_jobs'
+    __table_args__ = (
+        db.Index('ix_report_jobs_filters_status', 'filters_key', 'status'),
+    )
+    
+    job_id = db.Column(db.String(32), primary_key=True)
+    filters_key = db.Column(db.String(255), nullable=False)  # normalized filters as JSON
+    status = db.Column(db.String(20), nullable=False, default='queued')  # queued, running, done, failed
+    result = db.Column(db.Text)  # report JSON once done
+    error = db.Column(db.Text)
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow, index=True)
+    finished_at = db.Column(db.DateTime)
+    
+    def to_dict(self):
+        return {
+            'jobId': self.job_id,
+            'status': self.status,
+            'createdAt': self.created_at.isoformat() if self.created_at else None,
+            'finishedAt': self.finished_at.isoformat() if self.finished_at else None,
+            'error': self.error
+        }
+
+
+class SchemaVersion(db.Model):
+    """SchemaVersion model - records the last applied migration"""
+    __tablename__ = 'schema_version'
+    
+    version = db.Column(db.Integer, primary_key=True)
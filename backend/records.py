@@ -0,0 +1,149 @@
+"""
+Personal-record maintenance
+Keeps personal_records in step with workout_exercises. New logs raise a
+record in place. A deleted log only triggers a recompute, for that user
+and exercise alone, when it may have held one of the records or the row
+holds no record at all.
+Run this script to rebuild the records from scratch after a backfill.
+"""
+
+from models import db, PersonalRecord, Workout, WorkoutExercise
+from sqlalchemy import Float, case, cast, func
+from sqlalchemy.dialects import postgresql, sqlite
+
+RECORD_COLUMNS = ('max_weight_lbs', 'best_e1rm_lbs', 'max_volume_lbs',
+                  'max_distance_miles', 'max_duration_seconds')
+
+KEY_COLUMNS = ('user_id', 'exercise_id')
+
+
+def positive(value):
+    return value if value and value > 0 else None
+
+
+def record_values(row):
+    """Record candidates for one log row; None where the log doesn't qualify"""
+    weight = positive(row['weight_lbs'])
+    reps = positive(row['reps'])
+    sets = positive(row['sets'])
+    return {
+        'max_weight_lbs': weight,
+        # Epley: weight x (1 + reps / 30)
+        'best_e1rm_lbs': weight * (1 + reps / 30) if weight and reps else None,
+        'max_volume_lbs': sets * reps * weight if weight and reps and sets else None,
+        'max_distance_miles': positive(row['distance_miles']),
+        'max_duration_seconds': positive(row['duration_seconds']),
+    }
+
+
+def add_to_records(rows):
+    """Raise records for newly written logs in the current transaction"""
+    best = {}
+    for row in rows:
+        key = tuple(row[name] for name in KEY_COLUMNS)
+        current = best.setdefault(key, dict.fromkeys(RECORD_COLUMNS))
+        for name, value in record_values(row).items():
+            if value is not None and (current[name] is None or value > current[name]):
+                current[name] = value
+
+    if not best:
+        return
+
+    params = [dict(zip(KEY_COLUMNS, key), **values) for key, values in best.items()]
+    table = PersonalRecord.__table__
+
+    # Keep the larger of the stored and new value; a NULL on either side loses
+    dialect = postgresql if db.engine.dialect.name == 'postgresql' else sqlite
+    stmt = dialect.insert(table)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=list(KEY_COLUMNS),
+        set_={
+            name: case(
+                (stmt.excluded[name] > table.c[name], stmt.excluded[name]),
+                else_=func.coalesce(table.c[name], stmt.excluded[name])
+            )
+            for name in RECORD_COLUMNS
+        }
+    )
+    db.session.execute(stmt, params)
+
+
+def remove_from_records(rows):
+    """Recompute records the given logs may have held; call after the logs are deleted and flushed"""
+    candidates = {}
+    for row in rows:
+        key = tuple(row[name] for name in KEY_COLUMNS)
+        candidates.setdefault(key, []).append(record_values(row))
+
+    for key, values in candidates.items():
+        record = db.session.get(PersonalRecord, key)
+        if record is None:
+            continue
+        stored = {name: getattr(record, name) for name in RECORD_COLUMNS}
+        # A log below every record can go without touching the history. A row
+        # with no values (only sets-only logs) is recomputed so it goes away
+        # with the last log.
+        if all(value is None for value in stored.values()) or any(
+                value[name] is not None and value[name] >= stored[name]
+                for value in values for name in RECORD_COLUMNS
+                if stored[name] is not None):
+            recompute(*key)
+
+
+def recompute(user_id, exercise_id):
+    """Rebuild one user's records for one exercise from their logs"""
+    db.session.query(PersonalRecord).filter_by(user_id=user_id, exercise_id=exercise_id).delete()
+    db.session.execute(backfill_statement(
+        Workout.user_id == user_id,
+        WorkoutExercise.exercise_id == exercise_id
+    ))
+
+
+def backfill_statement(*conditions):
+    """INSERT ... SELECT that fills personal_records from workout_exercises"""
+    # SQL mirror of record_values()
+    positive_sql = lambda column: case((column > 0, column))
+    weight = positive_sql(WorkoutExercise.weight_lbs)
+    reps = positive_sql(WorkoutExercise.reps)
+    sets = positive_sql(WorkoutExercise.sets)
+
+    source = db.select(
+        Workout.user_id,
+        WorkoutExercise.exercise_id,
+        func.max(weight),
+        func.max(weight * (1 + cast(reps, Float) / 30)),
+        func.max(sets * reps * weight),
+        func.max(positive_sql(WorkoutExercise.distance_miles)),
+        func.max(positive_sql(WorkoutExercise.duration_seconds))
+    ).select_from(WorkoutExercise).join(
+        Workout, WorkoutExercise.workout_id == Workout.workout_id
+    ).where(
+        *conditions
+    ).group_by(
+        Workout.user_id, WorkoutExercise.exercise_id
+    )
+
+    return PersonalRecord.__table__.insert().from_select(
+        [*KEY_COLUMNS, *RECORD_COLUMNS], source
+    )
+
+
+def rebuild():
+    """Recompute every personal record from workout_exercises"""
+    table = PersonalRecord.__table__
+    db.session.execute(table.delete())
+    db.session.execute(backfill_statement())
+    db.session.commit()
+
+    return db.session.query(func.count()).select_from(table).scalar()
+
+
+if __name__ == '__main__':
+    from app import create_app
+
+    app = create_app()
+
+    with app.app_context():
+        print("Rebuilding personal_records...")
+        rows = rebuild()
+        print(f"✅ Personal records rebuilt with {rows} rows")
@@ -0,0 +1,200 @@
+"""
+Report computation helpers
+Builds the /api/reports/summary payload with SQL aggregation
+"""
+
+from models import db, Exercise, Workout, WorkoutExercise, DailyExerciseStats
+from sqlalchemy import func
+from serializers import LOG_COLUMNS, WORKOUT_COLUMNS
+
+
+def parse_number(args, name, convert, label):
+    """Optional numeric query parameter; raises ValueError rather than dropping a bad value"""
+    value = args.get(name)
+    if not value:
+        return None
+    try:
+        return convert(value)
+    except ValueError:
+        raise ValueError(f'{name} must be {label}')
+
+
+def parse_user_id(args):
+    """Required user_id query parameter; workout queries are always scoped to one user"""
+    user_id = parse_number(args, 'user_id', int, 'an integer')
+    if user_id is None:
+        raise ValueError('user_id is required')
+    return user_id
+
+
+def parse_report_filters(args):
+    """Normalize report query parameters into a filter dict; raises ValueError with a message for the client"""
+    category = args.get('category')
+
+    return {
+        'user_id': parse_user_id(args),
+        'start_date': args.get('startDate') or None,
+        'end_date': args.get('endDate') or None,
+        'category': category if category and category != 'all' else None,
+        'min_weight': parse_number(args, 'minWeight', float, 'a number'),
+        'max_weight': parse_number(args, 'maxWeight', float, 'a number'),
+    }
+
+
+def has_log_filters(filters):
+    """True when the filters narrow down individual exercise logs"""
+    return bool(filters['category'] or filters['min_weight'] is not None
+                or filters['max_weight'] is not None)
+
+
+def workout_conditions(filters):
+    """SQL conditions on the workouts table"""
+    conditions = []
+    if filters['user_id'] is not None:
+        conditions.append(Workout.user_id == filters['user_id'])
+    if filters['start_date']:
+        conditions.append(Workout.workout_date >= filters['start_date'])
+    if filters['end_date']:
+        conditions.append(Workout.workout_date <= filters['end_date'])
+    return conditions
+
+
+def log_conditions(filters):
+    """SQL conditions on workout_exercises (and the joined exercises table)"""
+    conditions = workout_conditions(filters)
+    if filters['category']:
+        conditions.append(Exercise.category == filters['category'])
+    if filters['min_weight'] is not None:
+        conditions.append(WorkoutExercise.weight_lbs >= filters['min_weight'])
+    if filters['max_weight'] is not None:
+        conditions.append(WorkoutExercise.weight_lbs <= filters['max_weight'])
+    return conditions
+
+
+def summary_rows_from_logs(filters):
+    """Per-exercise aggregates computed from the raw exercise logs"""
+    sets = func.coalesce(WorkoutExercise.sets, 0)
+    reps = func.coalesce(WorkoutExercise.reps, 0)
+    # NULLIF drops zero weights, matching the "if we.weight_lbs" check
+    weight = func.nullif(WorkoutExercise.weight_lbs, 0)
+
+    return db.session.query(
+        Exercise.name,
+        func.count(WorkoutExercise.log_id),
+        func.sum(sets),
+        func.sum(sets * reps),
+        func.sum(weight),
+        func.count(weight)
+    ).select_from(WorkoutExercise).join(
+        Workout, WorkoutExercise.workout_id == Workout.workout_id
+    ).join(
+        Exercise, WorkoutExercise.exercise_id == Exercise.exercise_id
+    ).filter(
+        *log_conditions(filters)
+    ).group_by(Exercise.name).all()
+
+
+def summary_rows_from_rollup(filters):
+    """Same aggregates read from daily_exercise_stats, one row per day and exercise"""
+    conditions = []
+    if filters['user_id'] is not None:
+        conditions.append(DailyExerciseStats.user_id == filters['user_id'])
+    if filters['start_date']:
+        conditions.append(DailyExerciseStats.stat_date >= filters['start_date'])
+    if filters['end_date']:
+        conditions.append(DailyExerciseStats.stat_date <= filters['end_date'])
+    if filters['category']:
+        conditions.append(Exercise.category == filters['category'])
+
+    return db.session.query(
+        Exercise.name,
+        func.sum(DailyExerciseStats.log_count),
+        func.sum(DailyExerciseStats.total_sets),
+        func.sum(DailyExerciseStats.total_reps),
+        func.sum(DailyExerciseStats.weight_sum),
+        func.sum(DailyExerciseStats.weight_count)
+    ).select_from(DailyExerciseStats).join(
+        Exercise, DailyExerciseStats.exercise_id == Exercise.exercise_id
+    ).filter(
+        *conditions
+    ).group_by(Exercise.name).all()
+
+
+def build_summary(filters):
+    """Aggregate totals and the per-exercise breakdown in the database"""
+    total_workouts = db.session.query(func.count(Workout.workout_id)).filter(
+        *workout_conditions(filters)
+    ).scalar()
+
+    # The rollup has no per-log weights, so weight ranges need the raw logs
+    if filters['min_weight'] is None and filters['max_weight'] is None:
+        rows = summary_rows_from_rollup(filters)
+    else:
+        rows = summary_rows_from_logs(filters)
+
+    # Roll the per-exercise groups up into the overall totals
+    total_sets = 0
+    total_reps = 0
+    weight_sum = 0
+    weight_count = 0
+    exercise_breakdown = {}
+    for name, count, group_sets, group_reps, group_weight, group_weight_count in rows:
+        exercise_breakdown[name] = {
+            'count': int(count),
+            'totalSets': int(group_sets or 0),
+            'totalReps': int(group_reps or 0)
+        }
+        total_sets += int(group_sets or 0)
+        total_reps += int(group_reps or 0)
+        weight_sum += float(group_weight or 0)
+        weight_count += int(group_weight_count or 0)
+
+    avg_weight = weight_sum / weight_count if weight_count else 0
+
+    return {
+        'totalWorkouts': total_workouts,
+        'totalSets': total_sets,
+        'totalReps': total_reps,
+        'avgWeight': f'{avg_weight:.1f}',
+        'exerciseBreakdown': exercise_breakdown
+    }
+
+
+def build_workout_details(filters):
+    """Detailed workout listing with each workout's matching exercise logs"""
+    # Column rows rather than ORM objects; this listing can run to tens of thousands of rows
+    workouts = db.session.query(*WORKOUT_COLUMNS).filter(
+        *workout_conditions(filters)
+    ).order_by(Workout.workout_id).all()
+
+    logs = db.session.query(*LOG_COLUMNS).select_from(WorkoutExercise).join(
+        Workout, WorkoutExercise.workout_id == Workout.workout_id
+    ).join(
+        Exercise, WorkoutExercise.exercise_id == Exercise.exercise_id
+    ).filter(
+        *log_conditions(filters)
+    ).order_by(WorkoutExercise.workout_id, WorkoutExercise.log_id).all()
+
+    # Bucket the logs by workout in a single pass
+    logs_by_workout = {}
+    for log in logs:
+        logs_by_workout.setdefault(log.workout_id, []).append(log._asdict())
+
+    keep_empty = not has_log_filters(filters)
+    detailed_workouts = []
+    for workout in workouts:
+        exercises = logs_by_workout.get(workout.workout_id, [])
+        if exercises or keep_empty:
+            workout_dict = workout._asdict()
+            workout_dict['exercises'] = exercises
+            detailed_workouts.append(workout_dict)
+
+    return detailed_workouts
+
+
+def build_report(filters):
+    """The full /api/reports/summary payload"""
+    return {
+        'summary': build_summary(filters),
+        'workouts': build_workout_details(filters)
+    }
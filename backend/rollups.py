@@ -0,0 +1,126 @@
+"""
+Daily rollup maintenance
+Keeps daily_exercise_stats in step with workout_exercises.
+Run this script to rebuild the rollup from scratch after a backfill.
+"""
+
+from models import db, DailyExerciseStats, Workout, WorkoutExercise
+from sqlalchemy import bindparam, func
+from sqlalchemy.dialects import postgresql, sqlite
+
+STAT_COLUMNS = ('log_count', 'total_sets', 'total_reps', 'weight_sum', 'weight_count', 'total_volume')
+
+
+KEY_COLUMNS = ('user_id', 'stat_date', 'exercise_id')
+
+
+def log_row(log, workout):
+    """Rollup and personal-record inputs for one exercise log"""
+    return {
+        'user_id': workout.user_id,
+        'stat_date': workout.workout_date,
+        'exercise_id': log.exercise_id,
+        'sets': log.sets,
+        'reps': log.reps,
+        'weight_lbs': log.weight_lbs,
+        'distance_miles': log.distance_miles,
+        'duration_seconds': log.duration_seconds,
+    }
+
+
+def apply_rows(rows, sign=1):
+    """Add (sign=1) or remove (sign=-1) logs' contributions in the current transaction"""
+    # Combine logs that land on the same rollup row
+    totals = {}
+    for row in rows:
+        key = tuple(row[name] for name in KEY_COLUMNS)
+        sets = row['sets'] or 0
+        weight = row['weight_lbs'] or 0
+        deltas = totals.setdefault(key, dict.fromkeys(STAT_COLUMNS, 0))
+        deltas['log_count'] += sign
+        deltas['total_sets'] += sign * sets
+        deltas['total_reps'] += sign * sets * (row['reps'] or 0)
+        deltas['weight_sum'] += sign * weight
+        deltas['weight_count'] += sign if weight else 0
+        deltas['total_volume'] += sign * sets * (row['reps'] or 0) * weight
+
+    if not totals:
+        return
+
+    params = [dict(zip(KEY_COLUMNS, key), **deltas) for key, deltas in totals.items()]
+    table = DailyExerciseStats.__table__
+
+    # Atomic upsert so concurrent writers to the same day don't collide
+    dialect = postgresql if db.engine.dialect.name == 'postgresql' else sqlite
+    stmt = dialect.insert(table)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=list(KEY_COLUMNS),
+        set_={name: table.c[name] + stmt.excluded[name] for name in STAT_COLUMNS}
+    )
+    db.session.execute(stmt, params)
+
+    if sign < 0:
+        db.session.execute(table.delete().where(
+            table.c.user_id == bindparam('user_id'),
+            table.c.stat_date == bindparam('stat_date'),
+            table.c.exercise_id == bindparam('exercise_id'),
+            table.c.log_count <= 0
+        ), [dict(zip(KEY_COLUMNS, key)) for key in totals])
+
+
+def apply_log(log, workout, sign=1):
+    """Add or remove a single log"""
+    apply_rows([log_row(log, workout)], sign)
+
+
+def apply_workout(workout, sign=1):
+    """Add or remove every log of a workout, e.g. before deleting it or moving its date"""
+    apply_rows([log_row(log, workout) for log in workout.workout_exercises], sign)
+
+
+def backfill_statement():
+    """INSERT ... SELECT that fills the rollup from workout_exercises"""
+    sets = func.coalesce(WorkoutExercise.sets, 0)
+    reps = func.coalesce(WorkoutExercise.reps, 0)
+    weight = func.nullif(WorkoutExercise.weight_lbs, 0)
+
+    source = db.select(
+        Workout.user_id,
+        Workout.workout_date,
+        WorkoutExercise.exercise_id,
+        func.count(WorkoutExercise.log_id),
+        func.sum(sets),
+        func.sum(sets * reps),
+        func.coalesce(func.sum(weight), 0),
+        func.count(weight),
+        func.coalesce(func.sum(sets * reps * weight), 0)
+    ).select_from(WorkoutExercise).join(
+        Workout, WorkoutExercise.workout_id == Workout.workout_id
+    ).group_by(
+        Workout.user_id, Workout.workout_date, WorkoutExercise.exercise_id
+    )
+
+    return DailyExerciseStats.__table__.insert().from_select(
+        ['user_id', 'stat_date', 'exercise_id', *STAT_COLUMNS], source
+    )
+
+
+def rebuild():
+    """Recompute the whole rollup from workout_exercises"""
+    table = DailyExerciseStats.__table__
+    db.session.execute(table.delete())
+    db.session.execute(backfill_statement())
+    db.session.commit()
+
+    return db.session.query(func.count()).select_from(table).scalar()
+
+
+if __name__ == '__main__':
+    from app import create_app
+
+    app = create_app()
+
+    with app.app_context():
+        print("Rebuilding daily_exercise_stats...")
+        rows = rebuild()
+        print(f"✅ Rollup rebuilt with {rows} rows")
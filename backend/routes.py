@@ -1,7 +1,21 @@
-from flask import Blueprint, request, jsonify
-from models import db, Exercise, Workout, WorkoutExercise, User
+from flask import Blueprint, Response, request, jsonify, stream_with_context, url_for
+from models import db, Exercise, Workout, WorkoutExercise, User, DailyExerciseStats, PersonalRecord
+from cache import EXERCISES, bump_version, reference_response, record_report_change, report_cache
+from rollups import apply_log, apply_rows, apply_workout, log_row
+from records import add_to_records, remove_from_records
+from exports import export_rows, ndjson_lines, csv_lines
+from importer import READERS, clean, import_workouts
+from health import check_readiness
+from serializers import USER_COLUMNS, WORKOUT_COLUMNS, row_dicts
+from reports import parse_number, parse_report_filters, parse_user_id, build_report
+from analytics import parse_analytics_args, parse_date, build_volume_series
+from search import DEFAULT_RESULTS, MAX_RESULTS, search_exercises, search_workouts
+from jobs import JobQueueFull, job_status, submit_report_job
+from connections import primary_reads, use_primary
 from datetime import datetime
-from sqlalchemy import func
+import io
+from sqlalchemy import func, and_, or_, insert
+from sqlalchemy.orm import selectinload
 
 api = Blueprint('api', __name__, url_prefix='/api')
 
@@ -11,8 +25,9 @@ api = Blueprint('api', __name__, url_prefix='/api')
 def get_exercises():
     """Get all exercises - used for dynamic dropdowns"""
     try:
-        exercises = Exercise.query.all()
-        return jsonify([ex.to_dict() for ex in exercises]), 200
+        return reference_response('exercises', EXERCISES, lambda: [
+            ex.to_dict() for ex in Exercise.query.all()
+        ])
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -50,6 +65,7 @@ def create_exercise():
         )
         
         db.session.add(exercise)
+        bump_version(EXERCISES)
         db.session.commit()
         
         return jsonify(exercise.to_dict()), 201
@@ -83,6 +99,8 @@ def update_exercise(exercise_id):
         if 'description' in data:
             exercise.description = data['description']
         
+        bump_version(EXERCISES)
+        record_report_change()
         db.session.commit()
         return jsonify(exercise.to_dict()), 200
     except Exception as e:
@@ -95,7 +113,11 @@ def delete_exercise(exercise_id):
     """Delete an exercise"""
     try:
         exercise = Exercise.query.get_or_404(exercise_id)
+        DailyExerciseStats.query.filter_by(exercise_id=exercise_id).delete()
+        PersonalRecord.query.filter_by(exercise_id=exercise_id).delete()
         db.session.delete(exercise)
+        bump_version(EXERCISES)
+        record_report_change()
         db.session.commit()
         return jsonify({'success': True, 'message': 'Exercise deleted'}), 200
     except Exception as e:
@@ -105,12 +127,74 @@ def delete_exercise(exercise_id):
 
 # ==================== WORKOUT ROUTES ====================
 
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+def encode_workout_cursor(workout):
+    """Cursor pointing just past the given workout in (date desc, id desc) order"""
+    return f'{workout.workout_date.isoformat()}_{workout.workout_id}'
+
+
+def decode_workout_cursor(cursor):
+    """Split a cursor back into its (workout_date, workout_id) key"""
+    date_part, id_part = cursor.split('_', 1)
+    return datetime.strptime(date_part, '%Y-%m-%d').date(), int(id_part)
+
+
 @api.route('/workouts', methods=['GET'])
 def get_workouts():
-    """Get all workouts"""
+    """Get a user's workouts, newest first, one keyset page at a time"""
     try:
-        workouts = Workout.query.order_by(Workout.workout_date.desc()).all()
-        return jsonify([w.to_dict() for w in workouts]), 200
+        try:
+            limit = int(request.args.get('limit', DEFAULT_PAGE_SIZE))
+        except ValueError:
+            return jsonify({'error': 'limit must be an integer'}), 400
+        if limit < 1 or limit > MAX_PAGE_SIZE:
+            return jsonify({'error': f'limit must be between 1 and {MAX_PAGE_SIZE}'}), 400
+        # Listings are one user's workouts; never fall back to everyone's
+        try:
+            user_id = parse_user_id(request.args)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        
+        # Plain column rows; the page is serialized without building ORM objects
+        query = db.session.query(*WORKOUT_COLUMNS).filter(Workout.user_id == user_id)
+        
+        # Apply filters
+        start_date = request.args.get('startDate')
+        end_date = request.args.get('endDate')
+        if start_date:
+            query = query.filter(Workout.workout_date >= start_date)
+        if end_date:
+            query = query.filter(Workout.workout_date <= end_date)
+        
+        # Seek past the last row of the previous page instead of using OFFSET
+        cursor = request.args.get('cursor')
+        if cursor:
+            try:
+                cursor_date, cursor_id = decode_workout_cursor(cursor)
+            except ValueError:
+                return jsonify({'error': 'Invalid cursor'}), 400
+            query = query.filter(or_(
+                Workout.workout_date < cursor_date,
+                and_(Workout.workout_date == cursor_date, Workout.workout_id < cursor_id)
+            ))
+        
+        # Fetch one extra row to know whether another page exists
+        workouts = query.order_by(
+            Workout.workout_date.desc(), Workout.workout_id.desc()
+        ).limit(limit + 1).all()
+        
+        next_cursor = None
+        if len(workouts) > limit:
+            workouts = workouts[:limit]
+            next_cursor = encode_workout_cursor(workouts[-1])
+        
+        return jsonify({
+            'workouts': row_dicts(workouts),
+            'nextCursor': next_cursor
+        }), 200
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -119,7 +203,10 @@ def get_workouts():
 def get_workout(workout_id):
     """Get a specific workout with exercises"""
     try:
-        workout = Workout.query.get_or_404(workout_id)
+        # Load the logs and their exercises up front so to_dict doesn't query per row
+        workout = Workout.query.options(
+            selectinload(Workout.workout_exercises).joinedload(WorkoutExercise.exercise)
+        ).get_or_404(workout_id)
         return jsonify(workout.to_dict(include_exercises=True)), 200
     except Exception as e:
         return jsonify({'error': str(e)}), 404
@@ -146,6 +233,7 @@ def create_workout():
         )
         
         db.session.add(workout)
+        record_report_change(workout_date)
         db.session.commit()
         
         return jsonify(workout.to_dict()), 201
@@ -161,8 +249,16 @@ def update_workout(workout_id):
         workout = Workout.query.get_or_404(workout_id)
         data = request.get_json()
         
+        # Reports covering the old date change too
+        record_report_change(workout.workout_date)
         if 'workout_date' in data:
-            workout.workout_date = datetime.strptime(data['workout_date'], '%Y-%m-%d').date()
+            new_date = datetime.strptime(data['workout_date'], '%Y-%m-%d').date()
+            if new_date != workout.workout_date:
+                # Move the workout's logs to the new day in the rollup
+                apply_workout(workout, -1)
+                workout.workout_date = new_date
+                apply_workout(workout)
+            record_report_change(workout.workout_date)
         if 'duration_minutes' in data:
             workout.duration_minutes = data['duration_minutes']
         if 'notes' in data:
@@ -180,7 +276,12 @@ def delete_workout(workout_id):
     """Delete a workout (cascades to workout_exercises)"""
     try:
         workout = Workout.query.get_or_404(workout_id)
+        logs = [log_row(log, workout) for log in workout.workout_exercises]
+        apply_workout(workout, -1)
         db.session.delete(workout)
+        db.session.flush()
+        remove_from_records(logs)
+        record_report_change(workout.workout_date)
         db.session.commit()
         return jsonify({'success': True, 'message': 'Workout deleted'}), 200
     except Exception as e:
@@ -188,6 +289,129 @@ def delete_workout(workout_id):
         return jsonify({'error': str(e)}), 500
 
 
+MAX_BULK_WORKOUTS = 500
+LOG_FIELDS = ('sets', 'reps', 'weight_lbs', 'distance_miles', 'duration_seconds')
+
+
+def log_values(log):
+    """Typed exercise_id and log fields from a request payload; raises ValueError for the client"""
+    # Same coercion as the importer, so the rollup and record arithmetic gets numbers
+    return clean({field: log.get(field) for field in ('exercise_id', *LOG_FIELDS)})
+
+
+@api.route('/workouts/bulk', methods=['POST'])
+def create_workouts_bulk():
+    """Create workouts with their exercise logs in one transaction
+    
+    Accepts a single workout with a nested "exercises" list, or
+    {"workouts": [...]} to sync several sessions at once.
+    """
+    try:
+        data = request.get_json(silent=True)
+        
+        # Validation: check the payload's shape before reading anything out of it
+        if not isinstance(data, dict):
+            return jsonify({'error': 'Expected a JSON object'}), 400
+        single = 'workouts' not in data
+        sessions = [data] if single else data['workouts']
+        if not isinstance(sessions, list):
+            return jsonify({'error': 'workouts must be a list'}), 400
+        if not sessions:
+            return jsonify({'error': 'At least one workout is required'}), 400
+        if len(sessions) > MAX_BULK_WORKOUTS:
+            return jsonify({'error': f'At most {MAX_BULK_WORKOUTS} workouts per request'}), 400
+        
+        workout_rows = []
+        session_logs = []
+        for i, session in enumerate(sessions):
+            if not isinstance(session, dict):
+                return jsonify({'error': f'Workout {i}: expected an object'}), 400
+            logs = session.get('exercises') or []
+            if not isinstance(logs, list) or not all(isinstance(log, dict) for log in logs):
+                return jsonify({'error': f'Workout {i}: exercises must be a list of objects'}), 400
+            if not session.get('user_id') or not session.get('workout_date'):
+                return jsonify({'error': f'Workout {i}: user ID and workout date are required'}), 400
+            if any(not log.get('exercise_id') for log in logs):
+                return jsonify({'error': f'Workout {i}: exercise ID is required for every log'}), 400
+            try:
+                workout = clean({key: session.get(key) for key in ('user_id', 'duration_minutes')})
+                workout_date = parse_date(str(session['workout_date']), 'workout_date')
+                session_logs.append([log_values(log) for log in logs])
+            except ValueError as e:
+                return jsonify({'error': f'Workout {i}: {e}'}), 400
+            workout_rows.append({
+                'user_id': workout['user_id'],
+                'workout_date': workout_date,
+                'duration_minutes': workout['duration_minutes'],
+                'notes': session.get('notes')
+            })
+        
+        # One lookup for every exercise referenced in the batch
+        exercise_ids = {log['exercise_id'] for logs in session_logs for log in logs}
+        exercises = {
+            row.exercise_id: row
+            for row in db.session.query(
+                Exercise.exercise_id, Exercise.name, Exercise.category
+            ).filter(Exercise.exercise_id.in_(exercise_ids))
+        } if exercise_ids else {}
+        missing = exercise_ids - exercises.keys()
+        if missing:
+            return jsonify({'error': f'Unknown exercise IDs: {sorted(missing)}'}), 400
+        
+        # Multi-row INSERT ... RETURNING for the workouts, then for their logs
+        workout_ids = db.session.execute(
+            insert(Workout).returning(Workout.workout_id, sort_by_parameter_order=True),
+            workout_rows
+        ).scalars().all()
+        
+        log_rows = []
+        rollup_rows = []
+        for logs, workout_row, workout_id in zip(session_logs, workout_rows, workout_ids):
+            workout_row['workout_id'] = workout_id
+            for log in logs:
+                log_row = dict(log, workout_id=workout_id)
+                log_rows.append(log_row)
+                rollup_rows.append(dict(
+                    log_row,
+                    user_id=workout_row['user_id'],
+                    stat_date=workout_row['workout_date']
+                ))
+        
+        log_ids = []
+        if log_rows:
+            log_ids = db.session.execute(
+                insert(WorkoutExercise).returning(WorkoutExercise.log_id, sort_by_parameter_order=True),
+                log_rows
+            ).scalars().all()
+        
+        apply_rows(rollup_rows)
+        add_to_records(rollup_rows)
+        for workout_date in {row['workout_date'] for row in workout_rows}:
+            record_report_change(workout_date)
+        db.session.commit()
+        
+        # Build the response from the inserted values instead of reloading
+        created = {
+            row['workout_id']: dict(row, workout_date=row['workout_date'].isoformat(), exercises=[])
+            for row in workout_rows
+        }
+        for log_row, log_id in zip(log_rows, log_ids):
+            exercise = exercises[log_row['exercise_id']]
+            created[log_row['workout_id']]['exercises'].append(dict(
+                log_row,
+                log_id=log_id,
+                exercise_name=exercise.name,
+                exercise_category=exercise.category
+            ))
+        
+        if single:
+            return jsonify(created[workout_ids[0]]), 201
+        return jsonify({'workouts': list(created.values())}), 201
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+
 # ==================== WORKOUT EXERCISE ROUTES ====================
 
 @api.route('/workout-exercises', methods=['POST'])
@@ -199,18 +423,23 @@ def create_workout_exercise():
         # Validation
         if not data.get('workout_id') or not data.get('exercise_id'):
             return jsonify({'error': 'Workout ID and Exercise ID are required'}), 400
+        try:
+            values = log_values(data)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
         
-        workout_exercise = WorkoutExercise(
-            workout_id=data['workout_id'],
-            exercise_id=data['exercise_id'],
-            sets=data.get('sets'),
-            reps=data.get('reps'),
-            weight_lbs=data.get('weight_lbs'),
-            distance_miles=data.get('distance_miles'),
-            duration_seconds=data.get('duration_seconds')
-        )
+        # The database may not enforce the foreign keys (SQLite doesn't)
+        workout = db.session.get(Workout, data['workout_id'])
+        if workout is None:
+            return jsonify({'error': 'Workout not found'}), 404
+        if db.session.get(Exercise, values['exercise_id']) is None:
+            return jsonify({'error': 'Exercise not found'}), 400
         
+        workout_exercise = WorkoutExercise(workout_id=workout.workout_id, **values)
         db.session.add(workout_exercise)
+        apply_log(workout_exercise, workout)
+        add_to_records([log_row(workout_exercise, workout)])
+        record_report_change(workout.workout_date)
         db.session.commit()
         
         return jsonify(workout_exercise.to_dict()), 201
@@ -224,7 +453,16 @@ def delete_workout_exercise(log_id):
     """Delete a workout exercise log"""
     try:
         workout_exercise = WorkoutExercise.query.get_or_404(log_id)
+        # A log left without its workout was never counted in the rollup or records
+        workout = workout_exercise.workout
+        if workout is not None:
+            log = log_row(workout_exercise, workout)
+            apply_log(workout_exercise, workout, -1)
         db.session.delete(workout_exercise)
+        db.session.flush()
+        if workout is not None:
+            remove_from_records([log])
+            record_report_change(workout.workout_date)
         db.session.commit()
         return jsonify({'success': True, 'message': 'Workout exercise deleted'}), 200
     except Exception as e:
@@ -238,78 +476,97 @@ def delete_workout_exercise(log_id):
 def get_workout_report():
     """Get workout report with filtering"""
     try:
-        # Get query parameters
-        start_date = request.args.get('startDate')
-        end_date = request.args.get('endDate')
-        category = request.args.get('category')
-        min_weight = request.args.get('minWeight')
-        max_weight = request.args.get('maxWeight')
+        try:
+            filters = parse_report_filters(request.args)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
         
-        # Base query for workouts
-        workout_query = Workout.query
+        report, checked_at = report_cache.lookup(filters)
+        if report is not None:
+            return jsonify(report), 200
         
-        # Apply date filters
-        if start_date:
-            workout_query = workout_query.filter(Workout.workout_date >= start_date)
-        if end_date:
-            workout_query = workout_query.filter(Workout.workout_date <= end_date)
-        
-        workouts = workout_query.all()
-        workout_ids = [w.workout_id for w in workouts]
-        
-        # Base query for workout exercises
-        we_query = WorkoutExercise.query.filter(WorkoutExercise.workout_id.in_(workout_ids))
-        
-        # Apply category filter
-        if category and category != 'all':
-            we_query = we_query.join(Exercise).filter(Exercise.category == category)
-        
-        # Apply weight filters
-        if min_weight:
-            we_query = we_query.filter(WorkoutExercise.weight_lbs >= float(min_weight))
-        if max_weight:
-            we_query = we_query.filter(WorkoutExercise.weight_lbs <= float(max_weight))
-        
-        workout_exercises = we_query.all()
-        
-        # Calculate statistics
-        total_workouts = len(workouts)
-        total_sets = sum(we.sets or 0 for we in workout_exercises)
-        total_reps = sum((we.sets or 0) * (we.reps or 0) for we in workout_exercises)
-        
-        weights = [we.weight_lbs for we in workout_exercises if we.weight_lbs]
-        avg_weight = sum(weights) / len(weights) if weights else 0
-        
-        # Exercise breakdown
-        exercise_breakdown = {}
-        for we in workout_exercises:
-            name = we.exercise.name
-            if name not in exercise_breakdown:
-                exercise_breakdown[name] = {'count': 0, 'totalSets': 0, 'totalReps': 0}
-            exercise_breakdown[name]['count'] += 1
-            exercise_breakdown[name]['totalSets'] += we.sets or 0
-            exercise_breakdown[name]['totalReps'] += (we.sets or 0) * (we.reps or 0)
-        
-        # Get detailed workouts
-        detailed_workouts = []
-        for workout in workouts:
-            # Filter workout exercises based on the same criteria
-            filtered_we = [we for we in workout.workout_exercises if we in workout_exercises]
-            if filtered_we or not (category or min_weight or max_weight):
-                workout_dict = workout.to_dict()
-                workout_dict['exercises'] = [we.to_dict() for we in filtered_we]
-                detailed_workouts.append(workout_dict)
+        # async=true computes on the background pool; poll the returned job
+        if request.args.get('async', '').lower() in ('1', 'true', 'yes'):
+            # Jobs are written and deduplicated on the primary
+            use_primary()
+            job_id, created = submit_report_job(filters, checked_at)
+            status_url = url_for('api.get_report_job', job_id=job_id)
+            response = jsonify({'jobId': job_id, 'created': created, 'statusUrl': status_url})
+            response.headers['Location'] = status_url
+            return response, 202
         
-        return jsonify({
-            'summary': {
-                'totalWorkouts': total_workouts,
-                'totalSets': total_sets,
-                'totalReps': total_reps,
-                'avgWeight': f'{avg_weight:.1f}',
-                'exerciseBreakdown': exercise_breakdown
-            },
-            'workouts': detailed_workouts
-        }), 200
+        report = build_report(filters)
+        report_cache.store(filters, checked_at, report)
+        return jsonify(report), 200
+    except JobQueueFull as e:
+        return jsonify({'error': str(e)}), 503
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+
+@api.route('/reports/jobs/<job_id>', methods=['GET'])
+@primary_reads
+def get_report_job(job_id):
+    """Poll a background report job; the report is included once it is done"""
+    try:
+        job = job_status(job_id)
+        if job is None:
+            return jsonify({'error': 'Report job not found'}), 404
+        return jsonify(job), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@api.route('/reports/cache-stats', methods=['GET'])
+def get_report_cache_stats():
+    """Hit/miss counters for this worker's report cache"""
+    return jsonify(report_cache.stats()), 200
+
+
+# ==================== ANALYTICS ROUTES ====================
+
+@api.route('/analytics/volume', methods=['GET'])
+def get_volume_analytics():
+    """Weekly or monthly training volume per exercise or muscle group for one user"""
+    try:
+        try:
+            params = parse_analytics_args(request.args)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        
+        return jsonify(build_volume_series(params)), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+# ==================== SEARCH ROUTES ====================
+
+@api.route('/search', methods=['GET'])
+def search():
+    """Ranked prefix search over exercises, and over one user's workout notes"""
+    try:
+        text = request.args.get('q', '')
+        search_type = request.args.get('type', 'exercises')
+        if search_type not in ('exercises', 'workouts', 'all'):
+            return jsonify({'error': 'type must be exercises, workouts or all'}), 400
+        limit = request.args.get('limit', DEFAULT_RESULTS, type=int)
+        if not 1 <= limit <= MAX_RESULTS:
+            return jsonify({'error': f'limit must be between 1 and {MAX_RESULTS}'}), 400
+        
+        # Workout notes belong to one user
+        if search_type != 'exercises':
+            try:
+                user_id = parse_user_id(request.args)
+            except ValueError as e:
+                return jsonify({'error': f'{e} to search workouts'}), 400
+        
+        results = {}
+        if search_type in ('exercises', 'all'):
+            results['exercises'] = search_exercises(text, limit)
+        if search_type in ('workouts', 'all'):
+            results['workouts'] = search_workouts(text, user_id, limit)
+        return jsonify(results), 200
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -318,8 +575,9 @@ def get_workout_report():
 def get_categories():
     """Get unique exercise categories - for dynamic dropdowns"""
     try:
-        categories = db.session.query(Exercise.category).distinct().all()
-        return jsonify([cat[0] for cat in categories]), 200
+        return reference_response('categories', EXERCISES, lambda: [
+            cat[0] for cat in db.session.query(Exercise.category).distinct().all()
+        ])
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -328,22 +586,103 @@ def get_categories():
 def get_muscle_groups():
     """Get unique muscle groups - for dynamic dropdowns"""
     try:
-        muscle_groups = db.session.query(Exercise.muscle_group).filter(
-            Exercise.muscle_group.isnot(None)
-        ).distinct().all()
-        return jsonify([mg[0] for mg in muscle_groups]), 200
+        return reference_response('muscle-groups', EXERCISES, lambda: [
+            mg[0] for mg in db.session.query(Exercise.muscle_group).filter(
+                Exercise.muscle_group.isnot(None)
+            ).distinct().all()
+        ])
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 
+# ==================== EXPORT ROUTES ====================
+
+@api.route('/export', methods=['GET'])
+def export_history():
+    """Stream a user's workouts and exercise logs as NDJSON (default) or CSV"""
+    try:
+        export_format = request.args.get('format', 'ndjson')
+        if export_format not in ('ndjson', 'csv'):
+            return jsonify({'error': 'format must be ndjson or csv'}), 400
+        # The export is one user's history; never fall back to everyone's
+        try:
+            user_id = parse_user_id(request.args)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        
+        rows = export_rows(
+            user_id=user_id,
+            start_date=request.args.get('startDate'),
+            end_date=request.args.get('endDate')
+        )
+        
+        if export_format == 'csv':
+            lines, mimetype = csv_lines(rows), 'text/csv'
+        else:
+            lines, mimetype = ndjson_lines(rows), 'application/x-ndjson'
+        
+        return Response(stream_with_context(lines), mimetype=mimetype, headers={
+            'Content-Disposition': f'attachment; filename=workout_history.{export_format}'
+        })
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+# Content types accepted as a raw import body, with the format each implies
+RAW_IMPORT_TYPES = {
+    '': None,
+    'text/plain': None,
+    'application/octet-stream': None,
+    'text/csv': 'csv',
+    'application/x-ndjson': 'ndjson',
+    'application/jsonl': 'ndjson',
+}
+
+
+@api.route('/import', methods=['POST'])
+def import_history():
+    """Import CSV or NDJSON workout history from an upload or the raw request body"""
+    try:
+        # Only multipart bodies go through request.files; reading it for any
+        # other type would consume the body (e.g. a form-encoded curl --data)
+        if request.mimetype == 'multipart/form-data':
+            upload = request.files.get('file')
+            if upload is None:
+                return jsonify({'error': 'Upload the history as the "file" field'}), 400
+            body, filename, body_format = upload.stream, upload.filename or '', None
+        elif request.mimetype in RAW_IMPORT_TYPES:
+            body, filename, body_format = request.stream, '', RAW_IMPORT_TYPES[request.mimetype]
+        else:
+            return jsonify({'error': f'Unsupported content type {request.mimetype}; '
+                                     'send multipart/form-data or the raw CSV or NDJSON body'}), 415
+        
+        import_format = request.args.get('format') or body_format or (
+            'ndjson' if filename.endswith(('.ndjson', '.jsonl')) else 'csv'
+        )
+        if import_format not in READERS:
+            return jsonify({'error': 'format must be ndjson or csv'}), 400
+        try:
+            user_id = parse_number(request.args, 'user_id', int, 'an integer')
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        
+        # Decode the body incrementally rather than reading it all at once
+        stream = io.TextIOWrapper(body, encoding='utf-8', newline='')
+        result = import_workouts(READERS[import_format](stream), user_id=user_id)
+        return jsonify(result), 201
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+
 # ==================== USER ROUTES (Optional) ====================
 
 @api.route('/users', methods=['GET'])
 def get_users():
     """Get all users"""
     try:
-        users = User.query.all()
-        return jsonify([u.to_dict() for u in users]), 200
+        users = db.session.query(*USER_COLUMNS).all()
+        return jsonify(row_dicts(users)), 200
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -358,13 +697,47 @@ def get_user(user_id):
         return jsonify({'error': str(e)}), 404
 
 
+@api.route('/users/<int:user_id>/records', methods=['GET'])
+def get_personal_records(user_id):
+    """Get a user's personal records for every exercise they have logged"""
+    try:
+        rows = db.session.query(PersonalRecord, Exercise.name).join(
+            Exercise, PersonalRecord.exercise_id == Exercise.exercise_id
+        ).filter(PersonalRecord.user_id == user_id).order_by(Exercise.name).all()
+        
+        return jsonify([dict(record.to_dict(), exercise_name=name) for record, name in rows]), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@api.route('/users/<int:user_id>/records/<int:exercise_id>', methods=['GET'])
+def get_personal_record(user_id, exercise_id):
+    """Get a user's personal records for one exercise"""
+    try:
+        record = db.session.get(PersonalRecord, (user_id, exercise_id))
+        if record is None:
+            return jsonify({'error': 'No records for this exercise'}), 404
+        return jsonify(record.to_dict()), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
 # ==================== HEALTH CHECK ====================
 
+@api.route('/health/live', methods=['GET'])
+def liveness_check():
+    """Liveness - the process is up and serving requests; never touches the database"""
+    return jsonify({'status': 'alive'}), 200
+
+
+@api.route('/health/ready', methods=['GET'])
+def readiness_check():
+    """Readiness - 503 when the database is unreachable, slow, or the pool is saturated"""
+    result = check_readiness()
+    return jsonify(result), 200 if result['status'] == 'ready' else 503
+
+
 @api.route('/health', methods=['GET'])
 def health_check():
-    """Health check endpoint"""
-    return jsonify({
-        'status': 'healthy',
-        'database': 'connected'
-    }), 200
-
+    """Health check endpoint (same checks as readiness)"""
+    return readiness_check()
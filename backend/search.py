@@ -0,0 +1,141 @@
+"""
+Full-text search over exercises and workout notes
+SQLite uses FTS5 tables that triggers keep in sync with their source
+tables. PostgreSQL uses generated tsvector columns with GIN indexes.
+Every word in the query is matched as a prefix, so partial input works
+for typeahead. Results are ordered by relevance, with exercise names
+weighted above descriptions.
+"""
+
+import re
+from models import db
+
+DEFAULT_RESULTS = 20
+MAX_RESULTS = 100
+
+SQLITE_SCHEMA = [
+    # External-content tables: the index stores no copy of the text
+    """CREATE VIRTUAL TABLE IF NOT EXISTS exercises_fts USING fts5(
+        name, description, content='exercises', content_rowid='exercise_id', prefix='2 3'
+    )""",
+    """CREATE TRIGGER IF NOT EXISTS exercises_fts_insert AFTER INSERT ON exercises BEGIN
+        INSERT INTO exercises_fts(rowid, name, description)
+        VALUES (new.exercise_id, new.name, new.description);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS exercises_fts_delete AFTER DELETE ON exercises BEGIN
+        INSERT INTO exercises_fts(exercises_fts, rowid, name, description)
+        VALUES ('delete', old.exercise_id, old.name, old.description);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS exercises_fts_update AFTER UPDATE OF name, description ON exercises BEGIN
+        INSERT INTO exercises_fts(exercises_fts, rowid, name, description)
+        VALUES ('delete', old.exercise_id, old.name, old.description);
+        INSERT INTO exercises_fts(rowid, name, description)
+        VALUES (new.exercise_id, new.name, new.description);
+    END""",
+    """CREATE VIRTUAL TABLE IF NOT EXISTS workouts_fts USING fts5(
+        notes, content='workouts', content_rowid='workout_id', prefix='2 3'
+    )""",
+    """CREATE TRIGGER IF NOT EXISTS workouts_fts_insert AFTER INSERT ON workouts BEGIN
+        INSERT INTO workouts_fts(rowid, notes) VALUES (new.workout_id, new.notes);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS workouts_fts_delete AFTER DELETE ON workouts BEGIN
+        INSERT INTO workouts_fts(workouts_fts, rowid, notes) VALUES ('delete', old.workout_id, old.notes);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS workouts_fts_update AFTER UPDATE OF notes ON workouts BEGIN
+        INSERT INTO workouts_fts(workouts_fts, rowid, notes) VALUES ('delete', old.workout_id, old.notes);
+        INSERT INTO workouts_fts(rowid, notes) VALUES (new.workout_id, new.notes);
+    END""",
+    # Index rows that existed before the triggers
+    "INSERT INTO exercises_fts(exercises_fts) VALUES ('rebuild')",
+    "INSERT INTO workouts_fts(workouts_fts) VALUES ('rebuild')",
+]
+
+POSTGRES_SCHEMA = [
+    """ALTER TABLE exercises ADD COLUMN IF NOT EXISTS search_vector tsvector
+        GENERATED ALWAYS AS (
+            setweight(to_tsvector('simple', coalesce(name, '')), 'A') ||
+            setweight(to_tsvector('simple', coalesce(description, '')), 'B')
+        ) STORED""",
+    "CREATE INDEX IF NOT EXISTS ix_exercises_search ON exercises USING GIN (search_vector)",
+    """ALTER TABLE workouts ADD COLUMN IF NOT EXISTS search_vector tsvector
+        GENERATED ALWAYS AS (to_tsvector('simple', coalesce(notes, ''))) STORED""",
+    "CREATE INDEX IF NOT EXISTS ix_workouts_search ON workouts USING GIN (search_vector)",
+]
+
+EXERCISE_SEARCH = {
+    # bm25() is lower for better matches; column weights favour the name
+    'sqlite': """
+        SELECT e.exercise_id, e.name, e.category, e.muscle_group, e.description,
+               -bm25(exercises_fts, 10.0, 1.0) AS score
+        FROM exercises_fts
+        JOIN exercises e ON e.exercise_id = exercises_fts.rowid
+        WHERE exercises_fts MATCH :query
+        ORDER BY bm25(exercises_fts, 10.0, 1.0), e.name
+        LIMIT :limit""",
+    'postgresql': """
+        SELECT e.exercise_id, e.name, e.category, e.muscle_group, e.description,
+               ts_rank(e.search_vector, q.query) AS score
+        FROM exercises e, to_tsquery('simple', :query) AS q(query)
+        WHERE e.search_vector @@ q.query
+        ORDER BY score DESC, e.name
+        LIMIT :limit""",
+}
+
+WORKOUT_SEARCH = {
+    'sqlite': """
+        SELECT w.workout_id, w.user_id, w.workout_date, w.duration_minutes, w.notes,
+               -bm25(workouts_fts) AS score
+        FROM workouts_fts
+        JOIN workouts w ON w.workout_id = workouts_fts.rowid
+        WHERE workouts_fts MATCH :query AND w.user_id = :user_id
+        ORDER BY bm25(workouts_fts), w.workout_date DESC
+        LIMIT :limit""",
+    'postgresql': """
+        SELECT w.workout_id, w.user_id, w.workout_date, w.duration_minutes, w.notes,
+               ts_rank(w.search_vector, q.query) AS score
+        FROM workouts w, to_tsquery('simple', :query) AS q(query)
+        WHERE w.search_vector @@ q.query AND w.user_id = :user_id
+        ORDER BY score DESC, w.workout_date DESC
+        LIMIT :limit""",
+}
+
+
+def dialect_name():
+    return 'postgresql' if db.engine.dialect.name == 'postgresql' else 'sqlite'
+
+
+def create_search_index(conn):
+    """Create the search index for this database and fill it from existing rows"""
+    schema = POSTGRES_SCHEMA if conn.dialect.name == 'postgresql' else SQLITE_SCHEMA
+    for statement in schema:
+        conn.execute(db.text(statement))
+
+
+def prefix_query(text):
+    """Match every word as a prefix; None when the text has no searchable words"""
+    words = re.findall(r'\w+', text.lower())
+    if not words:
+        return None
+    if dialect_name() == 'postgresql':
+        return ' & '.join(f'{word}:*' for word in words)
+    return ' '.join(f'"{word}"*' for word in words)
+
+
+def run_search(statements, query, **params):
+    rows = db.session.execute(db.text(statements[dialect_name()]), dict(params, query=query))
+    results = []
+    for row in rows:
+        result = row._asdict()
+        result['score'] = round(float(result['score']), 4)
+        results.append(result)
+    return results
+
+
+def search_exercises(text, limit=DEFAULT_RESULTS):
+    query = prefix_query(text)
+    return run_search(EXERCISE_SEARCH, query, limit=limit) if query else []
+
+
+def search_workouts(text, user_id, limit=DEFAULT_RESULTS):
+    query = prefix_query(text)
+    return run_search(WORKOUT_SEARCH, query, user_id=user_id, limit=limit) if query else []
@@ -4,7 +4,9 @@ Run this to populate the database with sample data
 """
 
 from app import create_app
-from models import db, User, Exercise, Workout, WorkoutExercise
+from models import db, User, Exercise, Workout, WorkoutExercise, DailyExerciseStats, PersonalRecord
+from rollups import rebuild
+import records
 from datetime import datetime, timedelta
 
 def seed_database():
@@ -22,6 +24,8 @@ def seed_database():
             
             # Clear existing data
             print("Clearing existing data...")
+            DailyExerciseStats.query.delete()
+            PersonalRecord.query.delete()
             WorkoutExercise.query.delete()
             Workout.query.delete()
             Exercise.query.delete()
@@ -182,6 +186,12 @@ def seed_database():
         db.session.commit()
         print(f"✅ Created {len(workout_exercises)} workout exercise logs")
         
+        # Populate the daily rollup from the logs above
+        rebuild()
+        print("✅ Rebuilt daily exercise stats")
+        records.rebuild()
+        print("✅ Rebuilt personal records")
+        
         print("\n" + "="*50)
         print("🎉 Database seeded successfully!")
         print("="*50)
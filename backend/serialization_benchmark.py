@@ -0,0 +1,137 @@
+"""
+Serialization benchmark
+Compares building and encoding response payloads through ORM objects and
+to_dict() against the column-row path in serializers.py, with both the
+stdlib and orjson encoders. Covers the report's workout listing and the
+users list over a temp SQLite database loaded with synthetic data.
+
+Usage: python serialization_benchmark.py [--workouts 20000] [--logs 100000] [--iterations 5]
+"""
+
+import json
+import os
+import statistics
+import tempfile
+import time
+from datetime import date, datetime
+from sqlalchemy.orm import contains_eager
+from app import create_app
+from config import Config
+from load_data import generate
+from migrations import upgrade
+from models import db, Exercise, User, Workout, WorkoutExercise
+from reports import build_workout_details, log_conditions, workout_conditions
+from serializers import FastJSONProvider, USER_COLUMNS, row_dicts, orjson
+
+END_DATE = date(2025, 1, 1)
+
+
+def orm_workout_details(filters):
+    """The report's workout listing built from ORM objects and to_dict()"""
+    workouts = Workout.query.filter(
+        *workout_conditions(filters)
+    ).order_by(Workout.workout_id).all()
+
+    logs = WorkoutExercise.query.join(
+        Workout, WorkoutExercise.workout_id == Workout.workout_id
+    ).join(
+        Exercise, WorkoutExercise.exercise_id == Exercise.exercise_id
+    ).options(
+        contains_eager(WorkoutExercise.exercise)
+    ).filter(
+        *log_conditions(filters)
+    ).order_by(WorkoutExercise.workout_id, WorkoutExercise.log_id).all()
+
+    logs_by_workout = {}
+    for we in logs:
+        logs_by_workout.setdefault(we.workout_id, []).append(we.to_dict())
+
+    detailed_workouts = []
+    for workout in workouts:
+        workout_dict = workout.to_dict()
+        workout_dict['exercises'] = logs_by_workout.get(workout.workout_id, [])
+        detailed_workouts.append(workout_dict)
+    return detailed_workouts
+
+
+def time_path(build, encode, iterations):
+    """Median milliseconds to build and encode one payload, plus the encoded size"""
+    timings = []
+    body = b''
+    for _ in range(iterations):
+        db.session.expunge_all()
+        started = time.perf_counter()
+        body = encode(build())
+        timings.append(time.perf_counter() - started)
+    return round(statistics.median(timings) * 1000, 2), len(body)
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Compare to_dict and column-row serialization')
+    parser.add_argument('--workouts', type=int, default=20000)
+    parser.add_argument('--logs', type=int, default=100000)
+    parser.add_argument('--iterations', type=int, default=5)
+    parser.add_argument('--output', help='JSON results path')
+    args = parser.parse_args()
+
+    class BenchmarkConfig(Config):
+        SQLALCHEMY_DATABASE_URI = 'sqlite:///' + os.path.join(tempfile.mkdtemp(), 'serialization.db')
+        SQLALCHEMY_ENGINE_OPTIONS = {}
+
+    app = create_app(BenchmarkConfig)
+    stdlib = FastJSONProvider(app)
+    stdlib.use_orjson = False
+    fast = FastJSONProvider(app)
+
+    # Encode the way a route does, through the provider's response()
+    encoders = {'json': lambda obj: stdlib.response(obj).get_data()}
+    if orjson is not None:
+        encoders['orjson'] = lambda obj: fast.response(obj).get_data()
+    else:
+        print("⚠️  orjson is not installed; only the stdlib encoder is measured")
+
+    filters = {'user_id': None, 'start_date': None, 'end_date': None,
+               'category': None, 'min_weight': None, 'max_weight': None}
+    payloads = {
+        'report_workouts': {
+            'to_dict': lambda: orm_workout_details(filters),
+            'columns': lambda: build_workout_details(filters),
+        },
+        'users': {
+            'to_dict': lambda: [u.to_dict() for u in User.query.all()],
+            'columns': lambda: row_dicts(db.session.query(*USER_COLUMNS).all()),
+        },
+    }
+
+    results = {}
+    with app.app_context():
+        db.create_all()
+        upgrade()
+        print(f"Loading {args.workouts} workouts, {args.logs} logs...")
+        generate(1000, args.workouts, args.logs, end_date=END_DATE)
+
+        for payload, builders in payloads.items():
+            results[payload] = {}
+            for builder_name, build in builders.items():
+                for encoder_name, encode in encoders.items():
+                    name = f'{builder_name}+{encoder_name}'
+                    ms, size = time_path(build, encode, args.iterations)
+                    results[payload][name] = {'median_ms': ms, 'bytes': size}
+                    print(f"  {payload:16} {name:16} {ms:10.2f} ms  {size:>10} bytes")
+
+    output = args.output or os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), 'benchmark_results',
+        'serialization-' + datetime.utcnow().strftime('%Y%m%dT%H%M%SZ') + '.json'
+    )
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump({
+            'workouts': args.workouts,
+            'logs': args.logs,
+            'iterations': args.iterations,
+            'results': results,
+        }, f, indent=2)
+
+    print(f"✅ Results written to {output}")
@@ -0,0 +1,96 @@
+"""
+JSON serialization
+FastJSONProvider encodes responses with orjson when it is installed and
+falls back to the stdlib encoder otherwise. The column lists below let
+read-only listings select plain rows and turn them into response dicts
+without building ORM objects or calling to_dict().
+"""
+
+from datetime import date
+from flask.json.provider import DefaultJSONProvider
+from models import Exercise, User, Workout, WorkoutExercise
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _default(o):
+    # Dates as ISO 8601, the same as to_dict() and orjson produce
+    if isinstance(o, date):
+        return o.isoformat()
+    return DefaultJSONProvider.default(o)
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson, with the same output options as the default"""
+
+    default = staticmethod(_default)
+
+    def __init__(self, app):
+        super().__init__(app)
+        # JSON_ORJSON=0 keeps the stdlib encoder, e.g. to compare the two
+        self.use_orjson = orjson is not None and app.config.get('JSON_ORJSON', True)
+
+    def _orjson_options(self):
+        options = orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            options |= orjson.OPT_SORT_KEYS
+        if (self.compact is None and self._app.debug) or self.compact is False:
+            options |= orjson.OPT_INDENT_2
+        return options
+
+    def dumps(self, obj, **kwargs):
+        if not self.use_orjson or kwargs:
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=self.default, option=self._orjson_options()).decode()
+
+    def loads(self, s, **kwargs):
+        if not self.use_orjson or kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        if not self.use_orjson:
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=self.default,
+                            option=self._orjson_options() | orjson.OPT_APPEND_NEWLINE)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+
+# Columns matching each model's to_dict() keys
+WORKOUT_COLUMNS = (
+    Workout.workout_id,
+    Workout.user_id,
+    Workout.workout_date,
+    Workout.duration_minutes,
+    Workout.notes,
+)
+
+# Needs exercises joined to the logs
+LOG_COLUMNS = (
+    WorkoutExercise.log_id,
+    WorkoutExercise.workout_id,
+    WorkoutExercise.exercise_id,
+    Exercise.name.label('exercise_name'),
+    Exercise.category.label('exercise_category'),
+    WorkoutExercise.sets,
+    WorkoutExercise.reps,
+    WorkoutExercise.weight_lbs,
+    WorkoutExercise.distance_miles,
+    WorkoutExercise.duration_seconds,
+)
+
+USER_COLUMNS = (
+    User.user_id,
+    User.username,
+    User.email,
+    User.created_at,
+)
+
+
+def row_dicts(rows):
+    """Rows of a column select as dicts keyed by column name"""
+    return [row._asdict() for row in rows]
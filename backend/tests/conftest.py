@@ -0,0 +1,149 @@
+"""
+Shared test fixtures
+Each test gets its own app over a fresh, fully migrated SQLite file.
+Process-wide state (report and reference caches, the readiness result,
+the report job pool) is reset between tests.
+"""
+
+from datetime import date
+import pytest
+from sqlalchemy import event
+import cache
+import health
+import jobs
+from app import create_app
+from config import Config
+from load_data import generate
+from migrations import upgrade
+from models import db, Workout, WorkoutExercise
+
+END_DATE = date(2025, 1, 1)
+
+
+def reset_process_state():
+    cache.report_cache.__init__()
+    cache._reference_cache.clear()
+    health._cached = None
+    if jobs._executor is not None:
+        jobs._executor.shutdown(wait=True)
+        jobs._executor = None
+    jobs._pending.clear()
+
+
+@pytest.fixture
+def make_app(tmp_path):
+    """Build an app over tmp_path/<name>.db; keyword arguments override config values"""
+    apps = []
+
+    def make(name='primary', **overrides):
+        class TestConfig(Config):
+            TESTING = True
+            SQLALCHEMY_DATABASE_URI = f'sqlite:///{tmp_path / name}.db'
+            SQLALCHEMY_ENGINE_OPTIONS = {}
+            DATABASE_REPLICA_URL = None
+            METRICS_ENABLED = False
+        for key, value in overrides.items():
+            setattr(TestConfig, key, value)
+
+        app = create_app(TestConfig)
+        with app.app_context():
+            # Tables live on the primary; the reader bind has none of its own
+            db.create_all(bind_key=None)
+            upgrade()
+        apps.append(app)
+        return app
+
+    reset_process_state()
+    yield make
+    reset_process_state()
+    for app in apps:
+        with app.app_context():
+            db.session.remove()
+            for engine in db.engines.values():
+                engine.dispose()
+
+
+@pytest.fixture
+def app(make_app):
+    return make_app()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def seeded_app(app):
+    """App loaded with a small deterministic synthetic data set"""
+    with app.app_context():
+        generate(20, 300, 1500, seed=7, end_date=END_DATE)
+    return app
+
+
+@pytest.fixture
+def statements(app):
+    """SQL statements run on any of the app's engines while the test runs"""
+    recorded = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        recorded.append(statement)
+
+    with app.app_context():
+        engines = list(db.engines.values())
+    for engine in engines:
+        event.listen(engine, 'before_cursor_execute', record)
+    yield recorded
+    for engine in engines:
+        event.remove(engine, 'before_cursor_execute', record)
+
+
+def table_snapshot(model):
+    """Every row of a table as sorted tuples, floats rounded; call in an app context"""
+    table = model.__table__
+    rows = db.session.execute(table.select()).all()
+    return sorted(
+        tuple(round(value, 6) if isinstance(value, float) else value for value in row)
+        for row in rows
+    )
+
+
+def random_log(rng, exercise_id=None):
+    return {
+        'exercise_id': exercise_id or rng.randint(1, 12),
+        'sets': rng.choice([None, 1, 3, 5]),
+        'reps': rng.choice([None, 5, 8, 12]),
+        'weight_lbs': rng.choice([None, 0, 45, 135, 225, 315]),
+        'distance_miles': rng.choice([None, 1.5, 5.0]),
+        'duration_seconds': rng.choice([None, 60, 1800]),
+    }
+
+
+def random_writes(app, rng, count):
+    """Drive the write endpoints with a random mix of creates, moves, deletes and bulk syncs"""
+    client = app.test_client()
+    for _ in range(count):
+        with app.app_context():
+            workout_ids = [row[0] for row in db.session.query(Workout.workout_id)]
+            log_ids = [row[0] for row in db.session.query(WorkoutExercise.log_id)]
+
+        operation = rng.choice(['log', 'log', 'delete_log', 'delete_workout', 'move', 'bulk'])
+        if operation == 'log' and workout_ids:
+            response = client.post('/api/workout-exercises',
+                                   json=dict(random_log(rng), workout_id=rng.choice(workout_ids)))
+        elif operation == 'delete_log' and log_ids:
+            response = client.delete(f'/api/workout-exercises/{rng.choice(log_ids)}')
+        elif operation == 'delete_workout' and workout_ids:
+            response = client.delete(f'/api/workouts/{rng.choice(workout_ids)}')
+        elif operation == 'move' and workout_ids:
+            response = client.put(f'/api/workouts/{rng.choice(workout_ids)}', json={
+                'workout_date': f'2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}'
+            })
+        else:
+            response = client.post('/api/workouts/bulk', json={'workouts': [
+                {'user_id': rng.randint(1, 5),
+                 'workout_date': f'2024-06-{rng.randint(1, 28):02d}',
+                 'exercises': [random_log(rng) for _ in range(rng.randint(0, 4))]}
+                for _ in range(rng.randint(1, 3))
+            ]})
+        assert response.status_code < 300, response.get_json()
@@ -0,0 +1,82 @@
+"""Training-volume analytics against a brute-force sum over the raw logs"""
+
+import pytest
+from datetime import date, timedelta
+from analytics import bucket_start, percent_change, rolling_mean
+from models import Exercise, Workout, WorkoutExercise
+
+BASE = '/api/analytics/volume?user_id=3&startDate=2024-01-01&endDate=2024-12-31'
+
+
+def brute_force(app, bucket, group_by):
+    """{group: {bucket start: [volume, sets, reps]}} straight from workout_exercises"""
+    series = {}
+    with app.app_context():
+        logs = WorkoutExercise.query.join(Workout).join(Exercise).filter(
+            Workout.user_id == 3,
+            Workout.workout_date >= date(2024, 1, 1),
+            Workout.workout_date <= date(2024, 12, 31)
+        ).all()
+        for log in logs:
+            key = log.exercise.name if group_by == 'exercise' else log.exercise.muscle_group
+            period = bucket_start(log.workout.workout_date, bucket).isoformat()
+            totals = series.setdefault(key, {}).setdefault(period, [0.0, 0, 0])
+            sets = log.sets or 0
+            reps = sets * (log.reps or 0)
+            totals[0] += reps * (log.weight_lbs or 0)
+            totals[1] += sets
+            totals[2] += reps
+    return series
+
+
+@pytest.mark.parametrize('bucket', ['week', 'month'])
+@pytest.mark.parametrize('group_by', ['exercise', 'muscle_group'])
+def test_volume_series_matches_raw_logs(seeded_app, bucket, group_by):
+    response = seeded_app.test_client().get(f'{BASE}&bucket={bucket}&groupBy={group_by}')
+    assert response.status_code == 200
+    payload = response.get_json()
+    expected = brute_force(seeded_app, bucket, group_by)
+
+    assert {series['key'] for series in payload['series']} == set(expected)
+    for series in payload['series']:
+        periods = expected[series['key']]
+        for i, period in enumerate(payload['periods']):
+            volume, sets, reps = periods.get(period, [0.0, 0, 0])
+            assert series['volume'][i] == pytest.approx(volume, abs=0.05)
+            assert series['sets'][i] == sets
+            assert series['reps'][i] == reps
+        assert series['rollingVolume'] == rolling_mean(series['volume'], payload['window'])
+        assert series['volumeChangePct'] == percent_change(series['volume'])
+
+    totals = [series['totalVolume'] for series in payload['series']]
+    assert totals == sorted(totals, reverse=True)
+
+
+def test_weekly_periods_are_contiguous_mondays(seeded_app):
+    payload = seeded_app.test_client().get(BASE).get_json()
+    periods = [date.fromisoformat(period) for period in payload['periods']]
+    assert all(period.weekday() == 0 for period in periods)
+    assert all(b - a == timedelta(days=7) for a, b in zip(periods, periods[1:]))
+    assert periods[0] <= date(2024, 1, 1) < periods[0] + timedelta(days=7)
+
+
+def test_rolling_mean_and_change():
+    assert rolling_mean([10, 20, 30, 40], 2) == [10.0, 15.0, 25.0, 35.0]
+    assert percent_change([0, 100, 50]) == [None, None, -50.0]
+
+
+@pytest.mark.parametrize('query', [
+    'startDate=2024-01-01',
+    'user_id=3&bucket=day',
+    'user_id=3&groupBy=category',
+    'user_id=abc',
+    'user_id=3&window=0',
+    'user_id=3&window=-2',
+    'user_id=3&window=abc',
+    'user_id=3&window=2.5',
+    'user_id=3&window=53',
+    'user_id=3&startDate=2024-12-01&endDate=2024-01-01',
+    'user_id=3&startDate=01/01/2024',
+])
+def test_invalid_parameters_are_rejected(client, query):
+    assert client.get(f'/api/analytics/volume?{query}').status_code == 400
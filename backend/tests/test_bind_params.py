@@ -0,0 +1,56 @@
+"""The report binds a constant number of parameters however many workouts it covers"""
+
+from sqlalchemy import event
+from load_data import generate
+from models import db
+from tests.conftest import END_DATE
+
+URLS = ('/api/reports/summary?user_id=1', '/api/reports/summary?user_id=1&minWeight=1')
+# Far below what an IN-list over the workouts would bind
+MAX_PARAMS = 10
+
+
+def report_params(app):
+    """Bind parameter count of each statement, per report URL"""
+    with app.app_context():
+        engines = list(db.engines.values())
+
+    counts = {}
+    current = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        current.append(len(parameters or ()))
+
+    for engine in engines:
+        event.listen(engine, 'before_cursor_execute', record)
+    try:
+        for url in URLS:
+            current.clear()
+            response = app.test_client().get(url)
+            assert response.status_code == 200
+            counts[url] = list(current)
+    finally:
+        for engine in engines:
+            event.remove(engine, 'before_cursor_execute', record)
+    return counts
+
+
+def test_report_over_50k_workouts_binds_constant_parameters(make_app):
+    small = make_app(name='small', REPORT_CACHE_SIZE=0)
+    large = make_app(name='large', REPORT_CACHE_SIZE=0)
+    with small.app_context():
+        generate(1, 1000, 1000, seed=5, end_date=END_DATE)
+    with large.app_context():
+        # Reports are per user, so one user holds every workout
+        generate(1, 55000, 55000, seed=5, end_date=END_DATE)
+
+    small_counts = report_params(small)
+    large_counts = report_params(large)
+
+    assert large_counts == small_counts
+    for url, counts in large_counts.items():
+        assert len(counts) <= 4, url
+        assert max(counts) <= MAX_PARAMS, (url, counts)
+
+    response = large.test_client().get(URLS[0])
+    assert len(response.get_json()['workouts']) == 55000
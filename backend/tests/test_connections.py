@@ -0,0 +1,92 @@
+"""SQLite tuning mode: connection pragmas and the read-only GET path"""
+
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.exc import OperationalError
+from connections import READER
+from models import db
+
+
+def pragma(engine, name):
+    with engine.connect() as conn:
+        return conn.execute(text(f'PRAGMA {name}')).scalar()
+
+
+def engine_statements(app):
+    """Record which bind key each statement ran on"""
+    recorded = []
+    with app.app_context():
+        for key, engine in db.engines.items():
+            event.listen(engine, 'before_cursor_execute',
+                         lambda *args, key=key: recorded.append(key))
+    return recorded
+
+
+def test_primary_connections_are_tuned(app):
+    with app.app_context():
+        config = app.config
+        assert pragma(db.engine, 'journal_mode') == 'wal'
+        assert pragma(db.engine, 'synchronous') == 1  # NORMAL
+        assert pragma(db.engine, 'busy_timeout') == config['SQLITE_BUSY_TIMEOUT_MS']
+        assert pragma(db.engine, 'cache_size') == -config['SQLITE_CACHE_SIZE_KB']
+        assert pragma(db.engine, 'mmap_size') == config['SQLITE_MMAP_SIZE']
+        assert pragma(db.engine, 'query_only') == 0
+
+
+def test_reader_connections_are_read_only(app):
+    with app.app_context():
+        reader = db.engines[READER]
+        assert pragma(reader, 'query_only') == 1
+        assert pragma(reader, 'busy_timeout') == app.config['SQLITE_BUSY_TIMEOUT_MS']
+        with pytest.raises(OperationalError):
+            with reader.begin() as conn:
+                conn.execute(text("INSERT INTO users (username, email) VALUES ('x', 'x@example.com')"))
+
+
+def test_get_reads_use_the_reader_and_writes_the_primary(seeded_app):
+    recorded = engine_statements(seeded_app)
+    client = seeded_app.test_client()
+
+    for url in ('/api/workouts?user_id=3', '/api/reports/summary?user_id=3', '/api/exercises',
+                '/api/users/3/records'):
+        recorded.clear()
+        assert client.get(url).status_code == 200
+        assert recorded and set(recorded) == {READER}, url
+
+    recorded.clear()
+    response = client.post('/api/workout-exercises', json={
+        'workout_id': 1, 'exercise_id': 1, 'sets': 3, 'reps': 5, 'weight_lbs': 100
+    })
+    assert response.status_code == 201
+    assert set(recorded) == {None}
+
+    # The reader sees the committed write straight away
+    log_id = response.get_json()['log_id']
+    assert any(log['log_id'] == log_id
+               for log in client.get('/api/workouts/1').get_json()['exercises'])
+
+
+def test_writes_proceed_while_a_read_transaction_is_open(seeded_app):
+    client = seeded_app.test_client()
+    with seeded_app.app_context():
+        reader = db.engines[READER]
+    with reader.connect() as conn:
+        # An open read transaction holds a shared lock under the rollback journal
+        conn.exec_driver_sql('BEGIN')
+        before = conn.execute(text('SELECT count(*) FROM workout_exercises')).scalar()
+
+        response = client.post('/api/workout-exercises', json={
+            'workout_id': 2, 'exercise_id': 1, 'sets': 3, 'reps': 5, 'weight_lbs': 100
+        })
+        assert response.status_code == 201
+        # Snapshot isolation: the open read still sees its own snapshot
+        assert conn.execute(text('SELECT count(*) FROM workout_exercises')).scalar() == before
+        conn.exec_driver_sql('COMMIT')
+
+
+def test_tuning_can_be_turned_off(make_app):
+    app = make_app(name='plain', SQLITE_TUNING=False)
+    with app.app_context():
+        assert READER not in db.engines
+        assert pragma(db.engine, 'journal_mode') == 'delete'
+    assert app.test_client().get('/api/workouts?user_id=1').status_code == 200
@@ -0,0 +1,34 @@
+"""History export: one user's workouts, streamed"""
+
+import csv
+import io
+import json
+import pytest
+from models import db, Workout
+
+
+def test_ndjson_export_is_scoped_to_user(seeded_app):
+    body = seeded_app.test_client().get('/api/export?user_id=3').get_data(as_text=True)
+    workouts = [json.loads(line) for line in body.splitlines()]
+    with seeded_app.app_context():
+        assert len(workouts) == db.session.query(Workout).filter_by(user_id=3).count()
+    assert {workout['user_id'] for workout in workouts} == {3}
+
+
+def test_csv_export_is_scoped_to_user(seeded_app):
+    body = seeded_app.test_client().get('/api/export?format=csv&user_id=3').get_data(as_text=True)
+    rows = list(csv.DictReader(io.StringIO(body)))
+    assert rows
+    assert {row['user_id'] for row in rows} == {'3'}
+
+
+@pytest.mark.parametrize('query,message', [
+    ('', 'user_id is required'),
+    ('user_id=', 'user_id is required'),
+    ('user_id=abc', 'user_id must be an integer'),
+    ('format=csv&user_id=2.5', 'user_id must be an integer'),
+])
+def test_export_requires_a_valid_user_id(seeded_app, query, message):
+    response = seeded_app.test_client().get(f'/api/export?{query}')
+    assert response.status_code == 400
+    assert response.get_json()['error'] == message
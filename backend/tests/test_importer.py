@@ -0,0 +1,119 @@
+"""History import: bad rows are skipped and counted, the rest is written"""
+
+import io
+import rollups
+from models import DailyExerciseStats, Workout
+from tests.conftest import table_snapshot
+
+CSV_HEADER = 'user_id,workout_date,duration_minutes,notes,exercise_name,sets,reps,weight_lbs,distance_miles,duration_seconds\n'
+
+
+def post_import(client, body, import_format):
+    return client.post(f'/api/import?format={import_format}', data=body,
+                       content_type='text/plain')
+
+
+def test_csv_import_skips_rows_that_do_not_convert(seeded_app):
+    client = seeded_app.test_client()
+    with seeded_app.app_context():
+        before = Workout.query.count()
+
+    body = CSV_HEADER + (
+        '1,2024-07-01,45,Good,Bench Press,3,5,185,,\n'
+        '1,2024-07-01,45,Good,Squat,3,5,225,,\n'
+        '2,2024-07-02,30,Bad,Bench Press,three,5,135,,\n'
+        '3,2024-07-03,60,Good,Running,1,,,3.1,1500\n'
+        '4,not-a-date,60,Bad,Squat,3,5,225,,\n'
+    )
+    response = post_import(client, body, 'csv')
+
+    assert response.status_code == 201
+    result = response.get_json()
+    assert (result['workouts'], result['logs'], result['skipped']) == (2, 3, 2)
+    assert 'sets must be a number' in result['errors'][0]
+    assert result['errors'][0].startswith('Workout 2:')
+    with seeded_app.app_context():
+        assert Workout.query.count() == before + 2
+
+
+def test_ndjson_import_skips_malformed_lines(seeded_app):
+    client = seeded_app.test_client()
+    body = '\n'.join([
+        '{"user_id": 1, "workout_date": "2024-07-01", "exercises": [{"exercise_id": 1, "sets": 3, "reps": 5, "weight_lbs": 135}]}',
+        '{"user_id": 1, "workout_date": "2024-07-02", "exercises": [',
+        '[1, 2, 3]',
+        '{"user_id": 2, "workout_date": "2024-07-03", "exercises": [{"exercise_id": 2, "sets": "x"}]}',
+        '{"user_id": 2, "workout_date": "2024-07-04", "exercises": "none"}',
+        '',
+        '{"user_id": 3, "workout_date": "2024-07-05", "exercises": []}',
+    ]) + '\n'
+    response = post_import(client, body, 'ndjson')
+
+    assert response.status_code == 201, response.get_json()
+    result = response.get_json()
+    assert (result['workouts'], result['logs'], result['skipped']) == (2, 1, 4)
+    assert 'invalid JSON' in result['errors'][0]
+
+
+def test_imported_logs_keep_the_rollup_consistent(seeded_app):
+    client = seeded_app.test_client()
+    export = client.get('/api/export?format=ndjson&user_id=2').get_data(as_text=True)
+    response = post_import(client, export, 'ndjson')
+    assert response.status_code == 201
+    assert response.get_json()['skipped'] == 0
+
+    with seeded_app.app_context():
+        maintained = table_snapshot(DailyExerciseStats)
+        rollups.rebuild()
+        assert maintained == table_snapshot(DailyExerciseStats)
+
+
+def test_unknown_users_are_skipped_before_anything_is_written(seeded_app):
+    client = seeded_app.test_client()
+    body = CSV_HEADER + (
+        '1,2024-07-01,45,Good,Bench Press,3,5,185,,\n'
+        '99999,2024-07-02,30,Nobody,Squat,3,5,225,,\n'
+    )
+    result = post_import(client, body, 'csv').get_json()
+    assert (result['workouts'], result['skipped']) == (1, 1)
+    assert result['errors'] == ['Workout 2: unknown user ID 99999']
+
+
+def test_multipart_upload_is_imported(seeded_app):
+    line = '{"user_id": 1, "workout_date": "2024-07-01", "exercises": [{"exercise_id": 1, "sets": 3}]}\n'
+    response = seeded_app.test_client().post('/api/import', data={
+        'file': (io.BytesIO(line.encode()), 'history.ndjson')
+    }, content_type='multipart/form-data')
+    assert response.status_code == 201
+    assert (response.get_json()['workouts'], response.get_json()['logs']) == (1, 1)
+
+
+def test_raw_body_format_follows_the_content_type(seeded_app):
+    client = seeded_app.test_client()
+    line = '{"user_id": 1, "workout_date": "2024-07-01", "exercises": []}\n'
+    response = client.post('/api/import', data=line, content_type='application/x-ndjson')
+    assert (response.status_code, response.get_json()['workouts']) == (201, 1)
+
+    body = CSV_HEADER + '1,2024-07-01,45,Good,Bench Press,3,5,185,,\n'
+    response = client.post('/api/import', data=body, content_type='text/csv')
+    assert (response.status_code, response.get_json()['logs']) == (201, 1)
+
+
+def test_form_encoded_body_is_rejected(seeded_app):
+    with seeded_app.app_context():
+        before = Workout.query.count()
+    body = CSV_HEADER + '1,2024-07-01,45,Good,Bench Press,3,5,185,,\n'
+    response = seeded_app.test_client().post('/api/import?format=csv', data=body,
+                                             content_type='application/x-www-form-urlencoded')
+    assert response.status_code == 415
+    with seeded_app.app_context():
+        assert Workout.query.count() == before
+
+
+def test_bad_import_requests_are_rejected(seeded_app):
+    client = seeded_app.test_client()
+    response = client.post('/api/import', data={}, content_type='multipart/form-data')
+    assert response.status_code == 400
+    response = client.post('/api/import?user_id=abc', data=CSV_HEADER, content_type='text/csv')
+    assert response.status_code == 400
+    assert response.get_json()['error'] == 'user_id must be an integer'
@@ -0,0 +1,112 @@
+"""Background report jobs: identical pending reports share one job"""
+
+import threading
+import time
+import pytest
+from sqlalchemy import event
+import jobs
+from load_data import generate
+from models import db
+from tests.conftest import END_DATE
+
+URL = '/api/reports/summary?async=1&user_id=14&startDate=2024-01-01&endDate=2024-06-30'
+
+
+@pytest.fixture
+def job_app(make_app, monkeypatch):
+    """Uncached app whose report jobs wait until the test releases them"""
+    app = make_app(REPORT_CACHE_SIZE=0, REPORT_JOB_QUEUE_SIZE=2)
+    with app.app_context():
+        generate(20, 300, 1500, seed=7, end_date=END_DATE)
+
+    release = threading.Event()
+    build_report = jobs.build_report
+
+    def blocked_build_report(filters):
+        assert release.wait(10)
+        return build_report(filters)
+
+    monkeypatch.setattr(jobs, 'build_report', blocked_build_report)
+    app.release_jobs = release
+    yield app
+    release.set()
+
+
+def wait_for(client, status_url):
+    for _ in range(200):
+        job = client.get(status_url).get_json()
+        if job['status'] not in jobs.PENDING:
+            return job
+        time.sleep(0.05)
+    raise AssertionError('job did not finish')
+
+
+def test_identical_requests_share_one_job(job_app):
+    client = job_app.test_client()
+    responses = [client.get(URL) for _ in range(5)]
+
+    assert {response.status_code for response in responses} == {202}
+    payloads = [response.get_json() for response in responses]
+    assert len({payload['jobId'] for payload in payloads}) == 1
+    assert [payload['created'] for payload in payloads] == [True, False, False, False, False]
+    assert responses[0].headers['Location'] == payloads[0]['statusUrl']
+
+    job_app.release_jobs.set()
+    job = wait_for(client, payloads[0]['statusUrl'])
+    assert job['status'] == 'done'
+    assert job['result'] == client.get(URL.replace('async=1&', '')).get_json()
+
+
+def test_concurrent_requests_share_one_job(job_app):
+    payloads = []
+
+    def request_report():
+        payloads.append(job_app.test_client().get(URL).get_json())
+
+    threads = [threading.Thread(target=request_report) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({payload['jobId'] for payload in payloads}) == 1
+    assert sum(payload['created'] for payload in payloads) == 1
+
+
+def test_different_filters_get_separate_jobs_until_the_queue_is_full(job_app):
+    client = job_app.test_client()
+    first = client.get(URL).get_json()
+    second = client.get(URL + '&category=strength').get_json()
+    assert first['jobId'] != second['jobId']
+    assert second['created']
+
+    assert client.get(URL + '&category=cardio').status_code == 503
+
+    job_app.release_jobs.set()
+    assert wait_for(client, first['statusUrl'])['status'] == 'done'
+    assert wait_for(client, second['statusUrl'])['status'] == 'done'
+    assert client.get(URL + '&category=cardio').status_code == 202
+
+
+def test_submission_does_not_hold_the_lock_during_database_io(job_app):
+    caller = threading.current_thread()
+    locked = []
+
+    def record(*args):
+        if threading.current_thread() is caller:
+            locked.append(jobs._lock.locked())
+
+    with job_app.app_context():
+        engine = db.engine
+    event.listen(engine, 'before_cursor_execute', record)
+    try:
+        client = job_app.test_client()
+        assert client.get(URL).get_json()['created']
+        assert not client.get(URL).get_json()['created']
+    finally:
+        event.remove(engine, 'before_cursor_execute', record)
+    assert locked and not any(locked)
+
+
+def test_unknown_job_is_404(client):
+    assert client.get('/api/reports/jobs/missing').status_code == 404
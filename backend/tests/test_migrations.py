@@ -0,0 +1,71 @@
+"""Versioned migrations and the indexes the report and list queries rely on"""
+
+from sqlalchemy import event, func, inspect
+from migrations import LATEST_VERSION, current_version, upgrade
+from models import db, DailyExerciseStats, PersonalRecord
+
+
+def query_plans(app, url):
+    """EXPLAIN QUERY PLAN detail lines for each SELECT a GET request runs"""
+    captured = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        captured.append((statement, parameters))
+
+    with app.app_context():
+        engines = list(db.engines.values())
+    for engine in engines:
+        event.listen(engine, 'before_cursor_execute', capture)
+    try:
+        assert app.test_client().get(url).status_code == 200
+    finally:
+        for engine in engines:
+            event.remove(engine, 'before_cursor_execute', capture)
+
+    plans = []
+    with app.app_context(), db.engine.connect() as conn:
+        for statement, parameters in captured:
+            rows = conn.exec_driver_sql('EXPLAIN QUERY PLAN ' + statement, parameters)
+            plans.append((statement, [row[-1] for row in rows]))
+    return plans
+
+
+def plan_for(plans, table):
+    """Plan of the statement whose FROM clause starts at the given table"""
+    for statement, plan in plans:
+        if f'\nFROM {table}' in statement:
+            return '\n'.join(plan)
+    raise AssertionError(f'no query from {table}: {plans}')
+
+
+def test_upgrade_is_idempotent(seeded_app):
+    with seeded_app.app_context():
+        assert current_version() == LATEST_VERSION
+        indexes = {table: inspect(db.engine).get_indexes(table)
+                   for table in ('workouts', 'workout_exercises', 'exercises')}
+        counts = [db.session.query(func.count()).select_from(model).scalar()
+                  for model in (DailyExerciseStats, PersonalRecord)]
+
+        assert upgrade() == []
+        assert upgrade() == []
+
+        assert current_version() == LATEST_VERSION
+        assert indexes == {table: inspect(db.engine).get_indexes(table) for table in indexes}
+        assert counts == [db.session.query(func.count()).select_from(model).scalar()
+                          for model in (DailyExerciseStats, PersonalRecord)]
+
+
+def test_report_log_query_uses_indexes(seeded_app):
+    plans = query_plans(seeded_app, '/api/reports/summary?user_id=18&startDate=2024-01-01&minWeight=50')
+    plan = plan_for(plans, 'workout_exercises')
+    assert 'ix_workouts_user_date_id' in plan
+    assert 'ix_workout_exercises_workout_exercise' in plan
+
+
+def test_workout_list_keyset_query_uses_indexes(seeded_app):
+    for url in ('/api/workouts?limit=20&user_id=18',
+                '/api/workouts?limit=20&user_id=18&cursor=2024-06-01_100'):
+        plan = plan_for(query_plans(seeded_app, url), 'workouts')
+        assert 'ix_workouts_user_date_id' in plan
+        # Rows come off the index in page order, no sort step
+        assert 'TEMP B-TREE' not in plan
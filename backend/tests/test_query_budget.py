@@ -0,0 +1,24 @@
+"""Per-request SQL statement budgets; a lazy load or per-row query breaks them"""
+
+import pytest
+
+BUDGETS = [
+    # workout, then its logs with their exercises
+    ('/api/workouts/1', 2),
+    ('/api/workouts/250', 2),
+    # one keyset page
+    ('/api/workouts?user_id=18', 1),
+    # workout count, summary groups, workouts, logs
+    ('/api/reports/summary?user_id=18', 4),
+    ('/api/reports/summary?user_id=18&startDate=2024-01-01&endDate=2024-12-31', 4),
+    ('/api/reports/summary?user_id=18&category=strength&minWeight=100', 4),
+]
+
+
+@pytest.mark.parametrize('url,budget', BUDGETS)
+def test_statement_budget(seeded_app, statements, url, budget):
+    client = seeded_app.test_client()
+    statements.clear()
+    response = client.get(url)
+    assert response.status_code == 200
+    assert len(statements) <= budget, '\n\n'.join(statements)
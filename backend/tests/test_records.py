@@ -0,0 +1,96 @@
+"""personal_records maintained write by write equals a rebuild from the logs"""
+
+import random
+import pytest
+import records
+from models import PersonalRecord, Workout
+from tests.conftest import random_writes, table_snapshot
+
+
+def rebuilt_matches(app):
+    with app.app_context():
+        maintained = table_snapshot(PersonalRecord)
+        records.rebuild()
+        return maintained == table_snapshot(PersonalRecord)
+
+
+def test_records_match_rebuild_after_random_writes(seeded_app):
+    random_writes(seeded_app, random.Random(11), 150)
+    assert rebuilt_matches(seeded_app)
+
+
+def test_new_best_is_recorded_and_deleting_it_restores_the_previous(seeded_app):
+    client = seeded_app.test_client()
+    with seeded_app.app_context():
+        workout = Workout.query.filter_by(user_id=3).first()
+        workout_id = workout.workout_id
+    before = client.get('/api/users/3/records/1').get_json()
+
+    response = client.post('/api/workout-exercises', json={
+        'workout_id': workout_id, 'exercise_id': 1, 'sets': 1, 'reps': 1, 'weight_lbs': 9999
+    })
+    assert response.status_code == 201
+    record = client.get('/api/users/3/records/1').get_json()
+    assert record['max_weight_lbs'] == 9999
+    assert rebuilt_matches(seeded_app)
+
+    log_id = response.get_json()['log_id']
+    assert client.delete(f'/api/workout-exercises/{log_id}').status_code == 200
+    assert client.get('/api/users/3/records/1').get_json() == before
+    assert rebuilt_matches(seeded_app)
+
+
+def test_deleting_an_exercise_drops_its_records(seeded_app):
+    client = seeded_app.test_client()
+    response = client.post('/api/exercises', json={'name': 'Sled Push', 'category': 'strength'})
+    exercise_id = response.get_json()['exercise_id']
+    with seeded_app.app_context():
+        workout_id = Workout.query.filter_by(user_id=2).first().workout_id
+    client.post('/api/workout-exercises', json={
+        'workout_id': workout_id, 'exercise_id': exercise_id, 'sets': 3, 'reps': 10, 'weight_lbs': 270
+    })
+    assert client.get(f'/api/users/2/records/{exercise_id}').status_code == 200
+
+    assert client.delete(f'/api/exercises/{exercise_id}').status_code == 200
+    assert client.get(f'/api/users/2/records/{exercise_id}').status_code == 404
+    assert rebuilt_matches(seeded_app)
+
+
+def test_deleting_the_last_sets_only_log_drops_the_empty_record(seeded_app):
+    client = seeded_app.test_client()
+    response = client.post('/api/exercises', json={'name': 'Dead Hang', 'category': 'mobility'})
+    exercise_id = response.get_json()['exercise_id']
+    with seeded_app.app_context():
+        workout_id = Workout.query.filter_by(user_id=2).first().workout_id
+
+    log_ids = []
+    for sets in (3, 2):
+        response = client.post('/api/workout-exercises', json={
+            'workout_id': workout_id, 'exercise_id': exercise_id, 'sets': sets
+        })
+        log_ids.append(response.get_json()['log_id'])
+    record = client.get(f'/api/users/2/records/{exercise_id}').get_json()
+    assert all(record[name] is None for name in records.RECORD_COLUMNS)
+    assert rebuilt_matches(seeded_app)
+
+    assert client.delete(f'/api/workout-exercises/{log_ids[0]}').status_code == 200
+    assert client.get(f'/api/users/2/records/{exercise_id}').status_code == 200
+    assert rebuilt_matches(seeded_app)
+
+    assert client.delete(f'/api/workout-exercises/{log_ids[1]}').status_code == 200
+    assert client.get(f'/api/users/2/records/{exercise_id}').status_code == 404
+    assert rebuilt_matches(seeded_app)
+
+
+def test_string_numerics_set_numeric_records(seeded_app):
+    client = seeded_app.test_client()
+    with seeded_app.app_context():
+        workout_id = Workout.query.filter_by(user_id=3).first().workout_id
+    response = client.post('/api/workout-exercises', json={
+        'workout_id': workout_id, 'exercise_id': '1', 'sets': '1', 'reps': '3', 'weight_lbs': '9999'
+    })
+    assert response.status_code == 201
+    record = client.get('/api/users/3/records/1').get_json()
+    assert record['max_weight_lbs'] == 9999
+    assert record['best_e1rm_lbs'] == pytest.approx(9999 * (1 + 3 / 30))
+    assert rebuilt_matches(seeded_app)
@@ -0,0 +1,61 @@
+"""Reference-data caching: ETag revalidation and the shared version counter"""
+
+import pytest
+from cache import EXERCISES, bump_version, get_version
+from models import db, Exercise
+
+URLS = ('/api/exercises', '/api/categories', '/api/muscle-groups')
+EXERCISE = {'name': 'Zercher Squat', 'category': 'mobility', 'muscle_group': 'adductors'}
+
+
+@pytest.mark.parametrize('url', URLS)
+def test_etag_round_trip(seeded_app, url):
+    client = seeded_app.test_client()
+    first = client.get(url)
+    assert first.status_code == 200
+    assert first.headers['Cache-Control'] == 'no-cache'
+    etag = first.headers['ETag']
+
+    again = client.get(url, headers={'If-None-Match': etag})
+    assert again.status_code == 304
+    assert again.headers['ETag'] == etag
+    assert not again.get_data()
+
+
+@pytest.mark.parametrize('url', URLS)
+def test_write_bumps_the_version(seeded_app, url):
+    client = seeded_app.test_client()
+    etag = client.get(url).headers['ETag']
+    with seeded_app.app_context():
+        before = get_version(EXERCISES)
+
+    assert client.post('/api/exercises', json=EXERCISE).status_code == 201
+    with seeded_app.app_context():
+        assert get_version(EXERCISES) == before + 1
+
+    response = client.get(url, headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.headers['ETag'] != etag
+    assert any(value in response.get_data(as_text=True) for value in EXERCISE.values())
+
+
+def test_bump_creates_and_increments_counters(app):
+    with app.app_context():
+        assert get_version('fresh') == 0
+        bump_version('fresh')
+        bump_version('fresh')
+        db.session.commit()
+        assert get_version('fresh') == 2
+
+
+def test_other_workers_writes_invalidate_the_cache(seeded_app):
+    client = seeded_app.test_client()
+    assert EXERCISE['name'] not in client.get('/api/exercises').get_data(as_text=True)
+
+    # Another worker's write: the row and the bump land in the database only
+    with seeded_app.app_context():
+        db.session.add(Exercise(**EXERCISE))
+        bump_version(EXERCISES)
+        db.session.commit()
+
+    assert EXERCISE['name'] in client.get('/api/exercises').get_data(as_text=True)
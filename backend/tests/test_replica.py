@@ -0,0 +1,101 @@
+"""Read replica routing over two SQLite files
+
+The replica is a separately migrated, empty database that never receives
+the primary's writes, so any read it answers shows up as missing data.
+"""
+
+import time
+import pytest
+from connections import READ_PRIMARY_COOKIE, READ_PRIMARY_HEADER, READER
+from tests.test_connections import engine_statements
+
+EXERCISE = {'name': 'Zercher Squat', 'category': 'strength', 'muscle_group': 'legs'}
+
+
+@pytest.fixture
+def replica_app(make_app, tmp_path):
+    make_app(name='replica')
+    return make_app(DATABASE_REPLICA_URL=f"sqlite:///{tmp_path / 'replica'}.db")
+
+
+def exercise_names(client, **kwargs):
+    response = client.get('/api/exercises', **kwargs)
+    assert response.status_code == 200
+    return {exercise['name'] for exercise in response.get_json()}
+
+
+def test_gets_read_the_replica_and_writes_go_to_the_primary(replica_app):
+    recorded = engine_statements(replica_app)
+    client = replica_app.test_client()
+
+    response = client.post('/api/exercises', json=EXERCISE)
+    assert response.status_code == 201
+    assert recorded and set(recorded) == {None}
+
+    recorded.clear()
+    fresh = replica_app.test_client()
+    assert EXERCISE['name'] not in exercise_names(fresh)
+    assert recorded and set(recorded) == {READER}
+
+
+def test_header_pins_reads_to_the_primary(replica_app):
+    client = replica_app.test_client()
+    assert client.post('/api/exercises', json=EXERCISE).status_code == 201
+
+    recorded = engine_statements(replica_app)
+    fresh = replica_app.test_client()
+    assert EXERCISE['name'] in exercise_names(fresh, headers={READ_PRIMARY_HEADER: '1'})
+    assert recorded and set(recorded) == {None}
+
+
+def test_writes_set_the_sticky_cookie(replica_app):
+    client = replica_app.test_client()
+    response = client.post('/api/exercises', json=EXERCISE)
+    assert response.status_code == 201
+    cookie = response.headers['Set-Cookie']
+    assert cookie.startswith(f'{READ_PRIMARY_COOKIE}=1')
+    assert f"Max-Age={replica_app.config['REPLICA_STICKY_SECONDS']}" in cookie
+
+    assert EXERCISE['name'] in exercise_names(client)
+    client.delete_cookie(READ_PRIMARY_COOKIE)
+    assert EXERCISE['name'] not in exercise_names(client)
+
+
+def test_failed_writes_and_reads_do_not_set_the_cookie(replica_app):
+    client = replica_app.test_client()
+    assert 'Set-Cookie' not in client.get('/api/exercises').headers
+    response = client.post('/api/exercises', json={'name': ''})
+    assert response.status_code == 400
+    assert 'Set-Cookie' not in response.headers
+
+
+def test_primary_reads_routes_see_new_jobs(replica_app):
+    client = replica_app.test_client()
+    response = client.get('/api/reports/summary?async=true&user_id=1')
+    assert response.status_code == 202
+    status_url = response.get_json()['statusUrl']
+
+    recorded = engine_statements(replica_app)
+    deadline = time.monotonic() + 10
+    while True:
+        response = client.get(status_url)
+        assert response.status_code == 200
+        if response.get_json()['status'] == 'done' or time.monotonic() > deadline:
+            break
+        time.sleep(0.05)
+    assert response.get_json()['status'] == 'done'
+    assert READER not in recorded
+
+
+def test_readiness_checks_the_replica(make_app, tmp_path):
+    make_app(name='replica')
+    app = make_app(DATABASE_REPLICA_URL=f"sqlite:///{tmp_path / 'replica'}.db")
+    body = app.test_client().get('/api/health/ready').get_json()
+    assert body['replica']['connected'] is True
+
+
+def test_readiness_fails_when_the_replica_is_unreachable(make_app, tmp_path):
+    app = make_app(DATABASE_REPLICA_URL=f"sqlite:///{tmp_path / 'missing' / 'replica'}.db")
+    response = app.test_client().get('/api/health/ready')
+    assert response.status_code == 503
+    assert response.get_json()['replica']['connected'] is False
@@ -0,0 +1,95 @@
+"""Report cache: hits for repeated filters, invalidation only by writes inside the range"""
+
+from flask import request
+from models import db, Workout
+from reports import build_report, parse_report_filters
+
+# The seeded user with workouts both in June 2024 and through 2023
+USER = 14
+JUNE = f'/api/reports/summary?user_id={USER}&startDate=2024-06-01&endDate=2024-06-30'
+YEAR_2023 = f'/api/reports/summary?user_id={USER}&startDate=2023-01-01&endDate=2023-12-31'
+
+
+def workout_on(app, start, end):
+    with app.app_context():
+        return db.session.query(Workout.workout_id).filter(
+            Workout.user_id == USER, Workout.workout_date >= start, Workout.workout_date <= end
+        ).order_by(Workout.workout_id).limit(1).scalar()
+
+
+def log_exercise(client, workout_id):
+    response = client.post('/api/workout-exercises', json={
+        'workout_id': workout_id, 'exercise_id': 1, 'sets': 4, 'reps': 8, 'weight_lbs': 135
+    })
+    assert response.status_code == 201
+
+
+def fresh_report(app, url):
+    """The report computed now, bypassing the cache, as the client would decode it"""
+    with app.test_request_context(url):
+        report = build_report(parse_report_filters(request.args))
+        return app.json.loads(app.json.dumps(report))
+
+
+def stats(client):
+    return client.get('/api/reports/cache-stats').get_json()
+
+
+def test_repeated_report_is_served_from_cache(seeded_app):
+    client = seeded_app.test_client()
+    first = client.get(JUNE).get_json()
+    second = client.get(JUNE).get_json()
+
+    assert first == second
+    assert stats(client)['hits'] == 1
+    assert stats(client)['misses'] == 1
+
+
+def test_write_outside_range_keeps_cached_report(seeded_app):
+    client = seeded_app.test_client()
+    cached = client.get(JUNE).get_json()
+
+    log_exercise(client, workout_on(seeded_app, '2023-01-01', '2023-12-31'))
+
+    assert client.get(JUNE).get_json() == cached
+    assert stats(client)['hits'] == 1
+    assert stats(client)['invalidations'] == 0
+    assert cached == fresh_report(seeded_app, JUNE)
+
+
+def test_write_inside_range_invalidates_cached_report(seeded_app):
+    client = seeded_app.test_client()
+    cached = client.get(JUNE).get_json()
+
+    log_exercise(client, workout_on(seeded_app, '2024-06-01', '2024-06-30'))
+
+    report = client.get(JUNE).get_json()
+    assert stats(client)['invalidations'] == 1
+    assert report['summary']['totalSets'] == cached['summary']['totalSets'] + 4
+    assert report == fresh_report(seeded_app, JUNE)
+
+
+def test_moving_a_workout_invalidates_both_dates(seeded_app):
+    client = seeded_app.test_client()
+    workout_id = workout_on(seeded_app, '2023-01-01', '2023-12-31')
+    client.get(JUNE)
+    client.get(YEAR_2023)
+
+    response = client.put(f'/api/workouts/{workout_id}', json={'workout_date': '2024-06-15'})
+    assert response.status_code == 200
+
+    assert client.get(JUNE).get_json() == fresh_report(seeded_app, JUNE)
+    assert client.get(YEAR_2023).get_json() == fresh_report(seeded_app, YEAR_2023)
+    assert stats(client)['invalidations'] == 2
+
+
+def test_deleting_a_workout_invalidates_its_range(seeded_app):
+    client = seeded_app.test_client()
+    client.get(JUNE)
+
+    workout_id = workout_on(seeded_app, '2024-06-01', '2024-06-30')
+    assert client.delete(f'/api/workouts/{workout_id}').status_code == 200
+
+    report = client.get(JUNE).get_json()
+    assert workout_id not in {workout['workout_id'] for workout in report['workouts']}
+    assert report == fresh_report(seeded_app, JUNE)
@@ -0,0 +1,41 @@
+"""The report's detailed workout listing grows linearly with the number of workouts"""
+
+import time
+from tests.conftest import END_DATE
+from load_data import generate
+from models import db
+from reports import build_workout_details
+
+SIZES = (1000, 2000, 4000, 8000)
+LOGS_PER_WORKOUT = 4
+
+
+def best_time(build, repeats=3):
+    timings = []
+    for _ in range(repeats):
+        db.session.expunge_all()
+        started = time.perf_counter()
+        build()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def test_workout_details_scale_linearly(make_app):
+    filters = dict.fromkeys(('user_id', 'start_date', 'end_date', 'category',
+                             'min_weight', 'max_weight'))
+    timings = {}
+    for size in SIZES:
+        app = make_app(name=f'scale_{size}')
+        with app.app_context():
+            generate(50, size, size * LOGS_PER_WORKOUT, seed=1, end_date=END_DATE)
+            details = build_workout_details(filters)
+            assert len(details) == size
+            assert sum(len(workout['exercises']) for workout in details) == size * LOGS_PER_WORKOUT
+            timings[size] = best_time(lambda: build_workout_details(filters))
+
+    # 8x the workouts; linear is ~8x, quadratic bucketing would be ~64x
+    growth = timings[SIZES[-1]] / timings[SIZES[0]]
+    assert growth < 20, f'8x workouts took {growth:.1f}x as long: {timings}'
+    # Each doubling should stay well under the 4x a quadratic pass gives
+    for smaller, larger in zip(SIZES, SIZES[1:]):
+        assert timings[larger] / timings[smaller] < 3.5, timings
@@ -0,0 +1,132 @@
+"""Report summary: SQL aggregation against the original Python implementation"""
+
+import pytest
+import reports
+from models import db, Exercise, Workout, WorkoutExercise
+from reports import build_summary
+
+FILTER_SETS = [
+    {},
+    {'start_date': '2024-06-01', 'end_date': '2024-09-30'},
+    {'category': 'strength'},
+    {'category': 'cardio', 'start_date': '2024-01-01'},
+    {'user_id': 3},
+    {'user_id': 3, 'end_date': '2024-03-31', 'category': 'strength'},
+    {'min_weight': 100.0},
+    {'max_weight': 135.0},
+    {'min_weight': 100.0, 'max_weight': 250.0, 'category': 'strength'},
+    {'min_weight': 50.0, 'start_date': '2024-06-01', 'user_id': 3},
+    {'min_weight': 10000.0},
+]
+
+
+def make_filters(**values):
+    filters = dict.fromkeys(('user_id', 'start_date', 'end_date', 'category',
+                             'min_weight', 'max_weight'))
+    filters.update(values)
+    return filters
+
+
+def python_summary(filters):
+    """The summary as the report route computed it before the SQL aggregation"""
+    workout_query = Workout.query
+    if filters['user_id'] is not None:
+        workout_query = workout_query.filter(Workout.user_id == filters['user_id'])
+    if filters['start_date']:
+        workout_query = workout_query.filter(Workout.workout_date >= filters['start_date'])
+    if filters['end_date']:
+        workout_query = workout_query.filter(Workout.workout_date <= filters['end_date'])
+    workouts = workout_query.all()
+    workout_ids = {w.workout_id for w in workouts}
+
+    workout_exercises = [
+        we for we in WorkoutExercise.query.all()
+        if we.workout_id in workout_ids
+        and (not filters['category'] or we.exercise.category == filters['category'])
+        and (filters['min_weight'] is None or (we.weight_lbs is not None and we.weight_lbs >= filters['min_weight']))
+        and (filters['max_weight'] is None or (we.weight_lbs is not None and we.weight_lbs <= filters['max_weight']))
+    ]
+
+    weights = [we.weight_lbs for we in workout_exercises if we.weight_lbs]
+    avg_weight = sum(weights) / len(weights) if weights else 0
+
+    exercise_breakdown = {}
+    for we in workout_exercises:
+        entry = exercise_breakdown.setdefault(we.exercise.name, {'count': 0, 'totalSets': 0, 'totalReps': 0})
+        entry['count'] += 1
+        entry['totalSets'] += we.sets or 0
+        entry['totalReps'] += (we.sets or 0) * (we.reps or 0)
+
+    return {
+        'totalWorkouts': len(workouts),
+        'totalSets': sum(we.sets or 0 for we in workout_exercises),
+        'totalReps': sum((we.sets or 0) * (we.reps or 0) for we in workout_exercises),
+        'avgWeight': f'{avg_weight:.1f}',
+        'exerciseBreakdown': exercise_breakdown
+    }
+
+
+@pytest.mark.parametrize('values', FILTER_SETS, ids=lambda values: ','.join(values) or 'none')
+def test_summary_matches_python_reference(seeded_app, values):
+    filters = make_filters(**values)
+    with seeded_app.app_context():
+        assert build_summary(filters) == python_summary(filters)
+
+
+def test_summary_without_weight_filters_reads_the_rollup(seeded_app, monkeypatch):
+    def fail(filters):
+        raise AssertionError('raw logs scanned without a weight filter')
+    monkeypatch.setattr(reports, 'summary_rows_from_logs', fail)
+
+    filters = make_filters(category='strength', start_date='2024-06-01')
+    with seeded_app.app_context():
+        assert build_summary(filters)['exerciseBreakdown']
+
+
+def test_summary_with_weight_filters_reads_the_logs(seeded_app, monkeypatch):
+    def fail(filters):
+        raise AssertionError('rollup used for a weight range')
+    monkeypatch.setattr(reports, 'summary_rows_from_rollup', fail)
+
+    filters = make_filters(min_weight=100.0)
+    with seeded_app.app_context():
+        assert build_summary(filters)['exerciseBreakdown']
+
+
+def test_summary_route_matches_reference(seeded_app):
+    client = seeded_app.test_client()
+    response = client.get('/api/reports/summary?user_id=18&startDate=2024-01-01&category=strength&minWeight=100')
+    assert response.status_code == 200
+
+    filters = make_filters(user_id=18, start_date='2024-01-01', category='strength', min_weight=100.0)
+    with seeded_app.app_context():
+        assert response.get_json()['summary'] == python_summary(filters)
+
+
+def test_report_is_scoped_to_user(seeded_app):
+    client = seeded_app.test_client()
+    report = client.get('/api/reports/summary?user_id=3').get_json()
+    assert report['workouts']
+    assert {workout['user_id'] for workout in report['workouts']} == {3}
+    with seeded_app.app_context():
+        assert report['summary'] == python_summary(make_filters(user_id=3))
+
+
+def test_user_id_zero_is_a_user_not_a_missing_filter(seeded_app):
+    report = seeded_app.test_client().get('/api/reports/summary?user_id=0').get_json()
+    assert report['workouts'] == []
+    assert report['summary']['totalWorkouts'] == 0
+
+
+@pytest.mark.parametrize('query,message', [
+    ('', 'user_id is required'),
+    ('startDate=2024-01-01', 'user_id is required'),
+    ('user_id=abc', 'user_id must be an integer'),
+    ('user_id=3.5', 'user_id must be an integer'),
+    ('user_id=1&minWeight=heavy', 'minWeight must be a number'),
+    ('user_id=1&maxWeight=1O0', 'maxWeight must be a number'),
+])
+def test_invalid_report_parameters_are_rejected(client, query, message):
+    response = client.get(f'/api/reports/summary?{query}')
+    assert response.status_code == 400
+    assert response.get_json()['error'] == message
@@ -0,0 +1,100 @@
+"""daily_exercise_stats maintained write by write equals a rebuild from the logs"""
+
+import random
+import pytest
+import rollups
+from models import db, DailyExerciseStats, Workout, WorkoutExercise
+from tests.conftest import random_writes, table_snapshot
+
+
+def rebuilt_matches(app):
+    with app.app_context():
+        maintained = table_snapshot(DailyExerciseStats)
+        rollups.rebuild()
+        return maintained == table_snapshot(DailyExerciseStats)
+
+
+def first_workout_id(app, user_id=1):
+    with app.app_context():
+        return Workout.query.filter_by(user_id=user_id).first().workout_id
+
+
+def test_rollup_matches_rebuild_after_random_writes(seeded_app):
+    random_writes(seeded_app, random.Random(3), 150)
+
+    assert rebuilt_matches(seeded_app)
+
+
+def test_rollup_has_no_empty_rows_after_deletes(seeded_app):
+    client = seeded_app.test_client()
+    response = client.post('/api/workouts/bulk', json={
+        'user_id': 1, 'workout_date': '2024-06-03',
+        'exercises': [{'exercise_id': 2, 'sets': 3, 'reps': 5, 'weight_lbs': 185}]
+    })
+    workout_id = response.get_json()['workout_id']
+    assert client.delete(f'/api/workouts/{workout_id}').status_code == 200
+    assert rebuilt_matches(seeded_app)
+
+
+def test_string_numerics_are_coerced(seeded_app):
+    client = seeded_app.test_client()
+    response = client.post('/api/workout-exercises', json={
+        'workout_id': first_workout_id(seeded_app), 'exercise_id': '2',
+        'sets': '3', 'reps': '5', 'weight_lbs': '185.5', 'distance_miles': ''
+    })
+    assert response.status_code == 201
+    log = response.get_json()
+    assert (log['sets'], log['reps'], log['weight_lbs'], log['distance_miles']) == (3, 5, 185.5, None)
+
+    response = client.post('/api/workouts/bulk', json={
+        'user_id': '4', 'workout_date': '2024-06-05', 'duration_minutes': '45',
+        'exercises': [{'exercise_id': '1', 'sets': '4', 'reps': '8', 'weight_lbs': '225'}]
+    })
+    assert response.status_code == 201
+    workout = response.get_json()
+    assert workout['user_id'] == 4
+    assert workout['exercises'][0]['sets'] == 4
+    assert rebuilt_matches(seeded_app)
+
+
+@pytest.mark.parametrize('url,payload', [
+    ('/api/workout-exercises', {'workout_id': 1, 'exercise_id': 2, 'sets': 'three'}),
+    ('/api/workout-exercises', {'workout_id': 1, 'exercise_id': 2, 'weight_lbs': [185]}),
+    ('/api/workouts/bulk', {'user_id': 1, 'workout_date': '2024-06-05',
+                            'exercises': [{'exercise_id': 1, 'reps': '8x'}]}),
+    ('/api/workouts/bulk', {'user_id': 'me', 'workout_date': '2024-06-05'}),
+])
+def test_bad_numerics_are_rejected(seeded_app, url, payload):
+    with seeded_app.app_context():
+        logs = db.session.query(WorkoutExercise).count()
+    response = seeded_app.test_client().post(url, json=payload)
+    assert response.status_code == 400
+    assert 'must be a number' in response.get_json()['error']
+    with seeded_app.app_context():
+        assert db.session.query(WorkoutExercise).count() == logs
+
+
+def test_logs_need_an_existing_workout_and_exercise(seeded_app):
+    client = seeded_app.test_client()
+    response = client.post('/api/workout-exercises', json={'workout_id': 999999, 'exercise_id': 1, 'sets': 3})
+    assert response.status_code == 404
+    response = client.post('/api/workout-exercises', json={
+        'workout_id': first_workout_id(seeded_app), 'exercise_id': 999999, 'sets': 3
+    })
+    assert response.status_code == 400
+    assert rebuilt_matches(seeded_app)
+
+
+def test_log_without_a_workout_can_be_deleted(seeded_app):
+    # Left behind by writes before the workout check; SQLite doesn't enforce the foreign key
+    with seeded_app.app_context():
+        orphan = WorkoutExercise(workout_id=999999, exercise_id=1, sets=3, reps=5, weight_lbs=135)
+        db.session.add(orphan)
+        db.session.commit()
+        log_id = orphan.log_id
+
+    response = seeded_app.test_client().delete(f'/api/workout-exercises/{log_id}')
+    assert response.status_code == 200
+    with seeded_app.app_context():
+        assert db.session.get(WorkoutExercise, log_id) is None
+    assert rebuilt_matches(seeded_app)
@@ -0,0 +1,75 @@
+"""Full-text search stays in step with exercise and workout writes"""
+
+from models import db, Workout
+
+
+def exercise_names(client, query):
+    response = client.get(f'/api/search?q={query}')
+    assert response.status_code == 200
+    return [result['name'] for result in response.get_json()['exercises']]
+
+
+def workout_ids(client, query, user_id):
+    response = client.get(f'/api/search?type=workouts&q={query}&user_id={user_id}')
+    assert response.status_code == 200
+    return [result['workout_id'] for result in response.get_json()['workouts']]
+
+
+def test_exercise_index_follows_create_rename_and_delete(client):
+    response = client.post('/api/exercises', json={
+        'name': 'Zercher Squat', 'category': 'strength', 'description': 'Bar held in the elbows'
+    })
+    exercise_id = response.get_json()['exercise_id']
+    assert exercise_names(client, 'zerch') == ['Zercher Squat']
+    assert exercise_names(client, 'elbow') == ['Zercher Squat']
+
+    client.put(f'/api/exercises/{exercise_id}', json={'name': 'Jefferson Curl'})
+    assert exercise_names(client, 'zerch') == []
+    assert exercise_names(client, 'jeff') == ['Jefferson Curl']
+
+    assert client.delete(f'/api/exercises/{exercise_id}').status_code == 200
+    assert exercise_names(client, 'jeff') == []
+    assert exercise_names(client, 'elbow') == []
+
+
+def test_name_matches_rank_above_description_matches(client):
+    client.post('/api/exercises', json={'name': 'Farmer Carry', 'category': 'strength',
+                                        'description': 'Walk holding heavy weights'})
+    client.post('/api/exercises', json={'name': 'Suitcase Walk', 'category': 'strength',
+                                        'description': 'One-sided farmer carry'})
+    assert exercise_names(client, 'farmer carry') == ['Farmer Carry', 'Suitcase Walk']
+
+
+def test_workout_notes_follow_every_write_path(seeded_app):
+    client = seeded_app.test_client()
+    with seeded_app.app_context():
+        workout_id = db.session.query(Workout.workout_id).filter_by(user_id=4).limit(1).scalar()
+
+    client.put(f'/api/workouts/{workout_id}', json={'notes': 'Deload week, tempo squats'})
+    assert workout_ids(client, 'deload', 4) == [workout_id]
+    # Notes are scoped to their owner
+    assert workout_ids(client, 'deload', 5) == []
+
+    created = client.post('/api/workouts', json={
+        'user_id': 4, 'workout_date': '2024-07-01', 'notes': 'Deload again'
+    }).get_json()['workout_id']
+    bulk = client.post('/api/workouts/bulk', json={
+        'user_id': 4, 'workout_date': '2024-07-02', 'notes': 'Deload finisher', 'exercises': []
+    }).get_json()['workout_id']
+    client.post('/api/import?format=ndjson', content_type='text/plain',
+                data='{"user_id": 4, "workout_date": "2024-07-03", "notes": "Imported deload"}\n')
+    assert len(workout_ids(client, 'deload', 4)) == 4
+    assert {workout_id, created, bulk} <= set(workout_ids(client, 'deload', 4))
+
+    client.put(f'/api/workouts/{workout_id}', json={'notes': 'Heavy singles'})
+    client.delete(f'/api/workouts/{created}')
+    results = workout_ids(client, 'deload', 4)
+    assert len(results) == 2
+    assert workout_id not in results and created not in results
+
+
+def test_search_validates_parameters(client):
+    assert client.get('/api/search?q=a&type=users').status_code == 400
+    assert client.get('/api/search?q=a&limit=0').status_code == 400
+    assert client.get('/api/search?q=a&type=workouts').status_code == 400
+    assert client.get('/api/search?q=%20%21').get_json() == {'exercises': []}
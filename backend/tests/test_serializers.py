@@ -0,0 +1,56 @@
+"""Column-row serializers and the orjson provider produce the same JSON as to_dict()"""
+
+import pytest
+from models import db, User, Workout, WorkoutExercise, Exercise
+from serializers import LOG_COLUMNS, USER_COLUMNS, WORKOUT_COLUMNS, orjson, row_dicts
+from load_data import generate
+from tests.conftest import END_DATE
+
+URLS = (
+    '/api/reports/summary?user_id=18&startDate=2024-01-01&endDate=2024-08-31',
+    '/api/workouts?user_id=18&limit=100',
+    '/api/workouts/42',
+    '/api/users/3/records',
+    '/api/analytics/volume?user_id=3&endDate=2024-12-31',
+)
+
+
+def encoded(app, value):
+    return app.json.loads(app.json.dumps(value))
+
+
+def test_column_rows_match_to_dict(seeded_app):
+    with seeded_app.app_context():
+        users = row_dicts(db.session.query(*USER_COLUMNS).order_by(User.user_id))
+        assert encoded(seeded_app, users) == [user.to_dict() for user in User.query.order_by(User.user_id)]
+
+        workouts = row_dicts(db.session.query(*WORKOUT_COLUMNS).order_by(Workout.workout_id))
+        assert encoded(seeded_app, workouts) == [
+            workout.to_dict() for workout in Workout.query.order_by(Workout.workout_id)
+        ]
+
+        logs = row_dicts(db.session.query(*LOG_COLUMNS).select_from(WorkoutExercise).join(
+            Exercise, WorkoutExercise.exercise_id == Exercise.exercise_id
+        ).order_by(WorkoutExercise.log_id))
+        assert encoded(seeded_app, logs) == [
+            log.to_dict() for log in WorkoutExercise.query.order_by(WorkoutExercise.log_id)
+        ]
+
+
+@pytest.mark.skipif(orjson is None, reason='orjson is not installed')
+def test_orjson_responses_match_stdlib(make_app):
+    apps = {}
+    for name, use_orjson in (('stdlib', False), ('orjson', True)):
+        app = make_app(name=name, JSON_ORJSON=use_orjson)
+        with app.app_context():
+            generate(20, 300, 1500, seed=7, end_date=END_DATE)
+        apps[name] = app
+    assert not apps['stdlib'].json.use_orjson
+    assert apps['orjson'].json.use_orjson
+
+    for url in URLS:
+        stdlib = apps['stdlib'].test_client().get(url)
+        fast = apps['orjson'].test_client().get(url)
+        assert stdlib.status_code == fast.status_code == 200, url
+        assert fast.mimetype == 'application/json'
+        assert fast.get_data() == stdlib.get_data(), url
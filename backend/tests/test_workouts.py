@@ -0,0 +1,69 @@
+"""Workout listing and the workout write routes"""
+
+import pytest
+from models import db, WorkoutExercise
+
+
+def test_list_is_scoped_to_user(seeded_app):
+    client = seeded_app.test_client()
+    response = client.get('/api/workouts?user_id=3&limit=100')
+    assert response.status_code == 200
+    workouts = response.get_json()['workouts']
+    assert workouts
+    assert {workout['user_id'] for workout in workouts} == {3}
+
+
+@pytest.mark.parametrize('query,message', [
+    ('', 'user_id is required'),
+    ('limit=10', 'user_id is required'),
+    ('user_id=abc', 'user_id must be an integer'),
+    ('user_id=3.5', 'user_id must be an integer'),
+    ('user_id=%20', 'user_id must be an integer'),
+])
+def test_list_requires_a_valid_user_id(seeded_app, query, message):
+    response = seeded_app.test_client().get(f'/api/workouts?{query}')
+    assert response.status_code == 400
+    assert response.get_json()['error'] == message
+
+
+def test_list_user_id_zero_is_not_unscoped(seeded_app):
+    response = seeded_app.test_client().get('/api/workouts?user_id=0')
+    assert response.status_code == 200
+    assert response.get_json()['workouts'] == []
+
+
+@pytest.mark.parametrize('payload,message', [
+    ([{'user_id': 1, 'workout_date': '2024-06-05'}], 'Expected a JSON object'),
+    ({'workouts': {'user_id': 1}}, 'workouts must be a list'),
+    ({'workouts': [7]}, 'Workout 0: expected an object'),
+    ({'user_id': 1, 'workout_date': '2024-06-05', 'exercises': {'exercise_id': 1}},
+     'Workout 0: exercises must be a list of objects'),
+    ({'user_id': 1, 'workout_date': '2024-06-05', 'exercises': [1, 2]},
+     'Workout 0: exercises must be a list of objects'),
+    ({'user_id': 1, 'workout_date': 'June 5th'},
+     'Workout 0: workout_date must be YYYY-MM-DD'),
+])
+def test_bulk_rejects_malformed_payloads(app, payload, message):
+    response = app.test_client().post('/api/workouts/bulk', json=payload)
+    assert response.status_code == 400
+    assert response.get_json()['error'] == message
+
+
+def test_bulk_returns_the_ids_of_the_inserted_logs(seeded_app):
+    sessions = [
+        {'user_id': user_id, 'workout_date': f'2024-06-{day:02d}', 'exercises': [
+            {'exercise_id': exercise_id, 'sets': day, 'reps': exercise_id, 'weight_lbs': 100 + user_id}
+            for exercise_id in (3, 1, 2)
+        ]}
+        for user_id, day in ((1, 5), (2, 6), (3, 7))
+    ]
+    response = seeded_app.test_client().post('/api/workouts/bulk', json={'workouts': sessions})
+    assert response.status_code == 201
+
+    with seeded_app.app_context():
+        for workout in response.get_json()['workouts']:
+            for log in workout['exercises']:
+                stored = db.session.get(WorkoutExercise, log['log_id'])
+                assert stored.workout_id == workout['workout_id']
+                assert (stored.exercise_id, stored.sets, stored.reps, stored.weight_lbs) == (
+                    log['exercise_id'], log['sets'], log['reps'], log['weight_lbs'])
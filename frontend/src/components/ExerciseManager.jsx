@@ -1,9 +1,10 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useRef } from 'react';
 import { 
   getAllExercises, 
   createExercise, 
   updateExercise, 
-  deleteExercise 
+  deleteExercise,
+  searchExercises
 } from '../services/api';
 import './ExerciseManager.css';
 
@@ -18,6 +19,9 @@ const ExerciseManager = () => {
     description: ''
   });
   const [message, setMessage] = useState({ text: '', type: '' });
+  const [searchQuery, setSearchQuery] = useState('');
+  const [searchResults, setSearchResults] = useState(null);
+  const latestQuery = useRef('');
 
   // Fetch exercises on component mount
   useEffect(() => {
@@ -29,6 +33,10 @@ const ExerciseManager = () => {
     try {
       const data = await getAllExercises();
       setExercises(data);
+      // Search results may be stale after a change; show the full list again
+      setSearchQuery('');
+      setSearchResults(null);
+      latestQuery.current = '';
     } catch (error) {
       showMessage('Error loading exercises', 'error');
     } finally {
@@ -36,6 +44,28 @@ const ExerciseManager = () => {
     }
   };
 
+  const handleSearchChange = async (e) => {
+    const query = e.target.value;
+    setSearchQuery(query);
+    latestQuery.current = query;
+    
+    if (!query.trim()) {
+      setSearchResults(null);
+      return;
+    }
+    try {
+      const results = await searchExercises(query);
+      // Ignore responses for queries the user has already typed past
+      if (latestQuery.current === query) {
+        setSearchResults(results);
+      }
+    } catch (error) {
+      showMessage('Error searching exercises', 'error');
+    }
+  };
+
+  const visibleExercises = searchResults || exercises;
+
   const showMessage = (text, type) => {
     setMessage({ text, type });
     setTimeout(() => setMessage({ text: '', type: '' }), 3000);
@@ -208,13 +238,24 @@ const ExerciseManager = () => {
       {/* EXERCISE LIST */}
       <div className="list-section">
         <h2>All Exercises ({exercises.length})</h2>
+        <input
+          type="search"
+          className="exercise-search"
+          value={searchQuery}
+          onChange={handleSearchChange}
+          placeholder="Search exercises by name or description"
+        />
         {loading && <p>Loading...</p>}
         
         {!loading && exercises.length === 0 && (
           <p className="empty-message">No exercises found. Create one above!</p>
         )}
 
-        {!loading && exercises.length > 0 && (
+        {!loading && exercises.length > 0 && searchResults && searchResults.length === 0 && (
+          <p className="empty-message">No exercises match "{searchQuery}".</p>
+        )}
+
+        {!loading && visibleExercises.length > 0 && (
           <div className="exercise-table-container">
             <table className="exercise-table">
               <thead>
@@ -227,7 +268,7 @@ const ExerciseManager = () => {
                 </tr>
               </thead>
               <tbody>
-                {exercises.map(exercise => (
+                {visibleExercises.map(exercise => (
                   <tr key={exercise.exercise_id}>
                     <td className="exercise-name">{exercise.name}</td>
                     <td>
@@ -1,9 +1,7 @@
 import React, { useState, useEffect } from 'react';
 import { 
   getAllExercises, 
-  createWorkout, 
-  createWorkoutExercise,
-  getWorkoutById 
+  createWorkoutSession
 } from '../services/api';
 import './WorkoutLogger.css';
 
@@ -111,29 +109,21 @@ const WorkoutLogger = () => {
 
     setLoading(true);
     try {
-      // Create the workout
-      const workout = await createWorkout({
+      // Save the workout and all exercise logs in one request
+      const completeWorkout = await createWorkoutSession({
         user_id: workoutData.user_id,
         workout_date: workoutData.workout_date,
         duration_minutes: parseInt(workoutData.duration_minutes) || null,
-        notes: workoutData.notes
-      });
-
-      // Create all exercise logs
-      for (const log of exerciseLogs) {
-        await createWorkoutExercise({
-          workout_id: workout.workout_id,
+        notes: workoutData.notes,
+        exercises: exerciseLogs.map(log => ({
           exercise_id: log.exercise_id,
           sets: log.sets,
           reps: log.reps,
           weight_lbs: log.weight_lbs,
           distance_miles: log.distance_miles,
           duration_seconds: log.duration_seconds
-        });
-      }
-
-      // Load the complete workout to display
-      const completeWorkout = await getWorkoutById(workout.workout_id);
+        }))
+      });
       setSavedWorkout(completeWorkout);
       
       showMessage('Workout saved successfully!', 'success');
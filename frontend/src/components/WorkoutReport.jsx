@@ -2,9 +2,13 @@ import React, { useState, useEffect } from 'react';
 import { getWorkoutReport, getExerciseCategories } from '../services/api';
 import './WorkoutReport.css';
 
+// Reports are scoped to one user; matches the default user in WorkoutLogger
+const DEFAULT_USER_ID = 1;
+
 const WorkoutReport = () => {
   const [categories, setCategories] = useState([]);
   const [filters, setFilters] = useState({
+    userId: DEFAULT_USER_ID,
     startDate: '',
     endDate: '',
     category: 'all',
@@ -19,7 +23,7 @@ const WorkoutReport = () => {
   useEffect(() => {
     loadCategories();
     // Load initial report with default filters
-    loadReport({});
+    loadReport({ userId: DEFAULT_USER_ID });
   }, []);
 
   const loadCategories = async () => {
@@ -56,6 +60,7 @@ const WorkoutReport = () => {
 
   const handleResetFilters = () => {
     const defaultFilters = {
+      userId: DEFAULT_USER_ID,
       startDate: '',
       endDate: '',
       category: 'all',
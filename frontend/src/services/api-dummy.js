@@ -59,11 +59,24 @@ export const deleteExercise = async (id) => {
   return { success: true };
 };
 
+export const searchExercises = async (query, limit = 20) => {
+  await delay(100);
+  const words = query.toLowerCase().match(/\w+/g) || [];
+  if (words.length === 0) return [];
+  
+  // Every query word must prefix a word in the name or description
+  const matches = exercises.filter(ex => {
+    const text = `${ex.name} ${ex.description || ''}`.toLowerCase().match(/\w+/g) || [];
+    return words.every(word => text.some(token => token.startsWith(word)));
+  });
+  return matches.slice(0, limit);
+};
+
 // ==================== WORKOUT API ====================
 
 export const getAllWorkouts = async () => {
   await delay();
-  return [...workouts];
+  return { workouts: [...workouts], nextCursor: null };
 };
 
 export const getWorkoutById = async (id) => {
@@ -99,6 +112,15 @@ export const createWorkout = async (workoutData) => {
   return newWorkout;
 };
 
+export const createWorkoutSession = async ({ exercises = [], ...workoutData }) => {
+  const newWorkout = await createWorkout(workoutData);
+  const logs = [];
+  for (const log of exercises) {
+    logs.push(await createWorkoutExercise({ workout_id: newWorkout.workout_id, ...log }));
+  }
+  return { ...newWorkout, exercises: logs };
+};
+
 export const updateWorkout = async (id, workoutData) => {
   await delay();
   const index = workouts.findIndex(w => w.workout_id === id);
@@ -145,10 +167,13 @@ export const deleteWorkoutExercise = async (logId) => {
 export const getWorkoutReport = async (filters = {}) => {
   await delay();
   
-  const { startDate, endDate, category, minWeight, maxWeight } = filters;
+  const { userId, startDate, endDate, category, minWeight, maxWeight } = filters;
   
-  // Filter workouts by date
+  // Filter workouts by user and date
   let filteredWorkouts = [...workouts];
+  if (userId) {
+    filteredWorkouts = filteredWorkouts.filter(w => w.user_id === parseInt(userId));
+  }
   if (startDate) {
     filteredWorkouts = filteredWorkouts.filter(w => w.workout_date >= startDate);
   }
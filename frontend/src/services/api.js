@@ -12,20 +12,40 @@ const handleResponse = async (response) => {
   return response.json();
 };
 
+// After this client writes, its reads carry X-Read-Primary for a few seconds
+// so the backend answers them from the primary database rather than a read
+// replica that may not have the change yet (matches REPLICA_STICKY_SECONDS)
+const READ_PRIMARY_MS = 5000;
+let readPrimaryUntil = 0;
+
+const apiFetch = async (url, options = {}) => {
+  const isRead = !options.method || options.method === 'GET';
+  const headers = { ...options.headers };
+  if (isRead && Date.now() < readPrimaryUntil) {
+    headers['X-Read-Primary'] = '1';
+  }
+
+  const response = await fetch(url, { ...options, headers });
+  if (!isRead && response.ok) {
+    readPrimaryUntil = Date.now() + READ_PRIMARY_MS;
+  }
+  return response;
+};
+
 // ==================== EXERCISE API ====================
 
 export const getAllExercises = async () => {
-  const response = await fetch(`${API_BASE_URL}/exercises`);
+  const response = await apiFetch(`${API_BASE_URL}/exercises`);
   return handleResponse(response);
 };
 
 export const getExerciseById = async (id) => {
-  const response = await fetch(`${API_BASE_URL}/exercises/${id}`);
+  const response = await apiFetch(`${API_BASE_URL}/exercises/${id}`);
   return handleResponse(response);
 };
 
 export const createExercise = async (exerciseData) => {
-  const response = await fetch(`${API_BASE_URL}/exercises`, {
+  const response = await apiFetch(`${API_BASE_URL}/exercises`, {
     method: 'POST',
     headers: {
       'Content-Type': 'application/json',
@@ -36,7 +56,7 @@ export const createExercise = async (exerciseData) => {
 };
 
 export const updateExercise = async (id, exerciseData) => {
-  const response = await fetch(`${API_BASE_URL}/exercises/${id}`, {
+  const response = await apiFetch(`${API_BASE_URL}/exercises/${id}`, {
     method: 'PUT',
     headers: {
       'Content-Type': 'application/json',
@@ -47,26 +67,49 @@ export const updateExercise = async (id, exerciseData) => {
 };
 
 export const deleteExercise = async (id) => {
-  const response = await fetch(`${API_BASE_URL}/exercises/${id}`, {
+  const response = await apiFetch(`${API_BASE_URL}/exercises/${id}`, {
     method: 'DELETE',
   });
   return handleResponse(response);
 };
 
+// Ranked prefix search over exercise names and descriptions
+export const searchExercises = async (query, limit = 20) => {
+  const params = new URLSearchParams({ q: query, limit });
+  const response = await apiFetch(`${API_BASE_URL}/search?${params}`);
+  const data = await handleResponse(response);
+  return data.exercises;
+};
+
 // ==================== WORKOUT API ====================
 
-export const getAllWorkouts = async () => {
-  const response = await fetch(`${API_BASE_URL}/workouts`);
+// Returns one page: { workouts, nextCursor }. Pass nextCursor back as
+// `cursor` to fetch the following page; it is null on the last page.
+export const getAllWorkouts = async (options = {}) => {
+  const params = new URLSearchParams();
+  
+  if (options.limit) params.append('limit', options.limit);
+  if (options.cursor) params.append('cursor', options.cursor);
+  if (options.userId) params.append('user_id', options.userId);
+  if (options.startDate) params.append('startDate', options.startDate);
+  if (options.endDate) params.append('endDate', options.endDate);
+  
+  const queryString = params.toString();
+  const url = queryString
+    ? `${API_BASE_URL}/workouts?${queryString}`
+    : `${API_BASE_URL}/workouts`;
+  
+  const response = await apiFetch(url);
   return handleResponse(response);
 };
 
 export const getWorkoutById = async (id) => {
-  const response = await fetch(`${API_BASE_URL}/workouts/${id}`);
+  const response = await apiFetch(`${API_BASE_URL}/workouts/${id}`);
   return handleResponse(response);
 };
 
 export const createWorkout = async (workoutData) => {
-  const response = await fetch(`${API_BASE_URL}/workouts`, {
+  const response = await apiFetch(`${API_BASE_URL}/workouts`, {
     method: 'POST',
     headers: {
       'Content-Type': 'application/json',
@@ -77,7 +120,7 @@ export const createWorkout = async (workoutData) => {
 };
 
 export const updateWorkout = async (id, workoutData) => {
-  const response = await fetch(`${API_BASE_URL}/workouts/${id}`, {
+  const response = await apiFetch(`${API_BASE_URL}/workouts/${id}`, {
     method: 'PUT',
     headers: {
       'Content-Type': 'application/json',
@@ -88,16 +131,30 @@ export const updateWorkout = async (id, workoutData) => {
 };
 
 export const deleteWorkout = async (id) => {
-  const response = await fetch(`${API_BASE_URL}/workouts/${id}`, {
+  const response = await apiFetch(`${API_BASE_URL}/workouts/${id}`, {
     method: 'DELETE',
   });
   return handleResponse(response);
 };
 
+// Create a workout and all of its exercise logs in one request.
+// sessionData is a workout with a nested `exercises` array of logs;
+// resolves to the saved workout including its exercises.
+export const createWorkoutSession = async (sessionData) => {
+  const response = await apiFetch(`${API_BASE_URL}/workouts/bulk`, {
+    method: 'POST',
+    headers: {
+      'Content-Type': 'application/json',
+    },
+    body: JSON.stringify(sessionData),
+  });
+  return handleResponse(response);
+};
+
 // ==================== WORKOUT EXERCISE LOGS API ====================
 
 export const createWorkoutExercise = async (logData) => {
-  const response = await fetch(`${API_BASE_URL}/workout-exercises`, {
+  const response = await apiFetch(`${API_BASE_URL}/workout-exercises`, {
     method: 'POST',
     headers: {
       'Content-Type': 'application/json',
@@ -108,7 +165,7 @@ export const createWorkoutExercise = async (logData) => {
 };
 
 export const deleteWorkoutExercise = async (logId) => {
-  const response = await fetch(`${API_BASE_URL}/workout-exercises/${logId}`, {
+  const response = await apiFetch(`${API_BASE_URL}/workout-exercises/${logId}`, {
     method: 'DELETE',
   });
   return handleResponse(response);
@@ -120,6 +177,7 @@ export const getWorkoutReport = async (filters = {}) => {
   // Build query string from filters
   const params = new URLSearchParams();
   
+  if (filters.userId) params.append('user_id', filters.userId);
   if (filters.startDate) params.append('startDate', filters.startDate);
   if (filters.endDate) params.append('endDate', filters.endDate);
   if (filters.category && filters.category !== 'all') params.append('category', filters.category);
@@ -131,25 +189,25 @@ export const getWorkoutReport = async (filters = {}) => {
     ? `${API_BASE_URL}/reports/summary?${queryString}`
     : `${API_BASE_URL}/reports/summary`;
   
-  const response = await fetch(url);
+  const response = await apiFetch(url);
   return handleResponse(response);
 };
 
 // Get unique categories (for dynamic dropdown)
 export const getExerciseCategories = async () => {
-  const response = await fetch(`${API_BASE_URL}/categories`);
+  const response = await apiFetch(`${API_BASE_URL}/categories`);
   return handleResponse(response);
 };
 
 // Get unique muscle groups (for dynamic dropdown)
 export const getMuscleGroups = async () => {
-  const response = await fetch(`${API_BASE_URL}/muscle-groups`);
+  const response = await apiFetch(`${API_BASE_URL}/muscle-groups`);
   return handleResponse(response);
 };
 
 // Health check
 export const checkHealth = async () => {
-  const response = await fetch(`${API_BASE_URL}/health`);
+  const response = await apiFetch(`${API_BASE_URL}/health`);
   return handleResponse(response);
 };
 